@@ -42,68 +42,55 @@ MIN_RADIAL_VARIANCE = 10
 MAX_RADIAL_VARIANCE = 50
 
 
-# --- Function to generate the asteroid's *core 3D data* (vertices and faces) ---
-def generate_asteroid_core_data(inner_radius, outer_radius, jitter_val, jaggedness_factor=1.0, shape_randomization_factor=(1.0, 1.0, 1.0), displacement_strength=0.0, indentation_scale=0.0, indentation_shape_factor=(1.0, 1.0, 1.0)):
+# --- Functions to generate the asteroid's *core 3D data* (vertices and faces) ---
+def sample_asteroid_points(inner_radius, outer_radius, jitter_val):
     """
-    Generates the 3D vertices and faces for a new asteroid using a convex hull.
+    Draws the random samples an asteroid's points are built from: a unit direction,
+    a base radius and a radial jitter offset per point.
     """
     if inner_radius >= outer_radius:
         inner_radius = outer_radius - 1
         if inner_radius < 1: inner_radius = 1
 
-    points = []
+    directions = np.empty((NUM_POINTS, 3))
+    base_radii = np.empty(NUM_POINTS)
+    jitter_offsets = np.empty(NUM_POINTS)
     for i in range(NUM_POINTS):
         # Generate points on a sphere using spherical coordinates
         theta = math.acos(1 - 2 * (i + 0.5) / NUM_POINTS) # Latitude
         phi = math.pi * (1 + math.sqrt(5)) * i # Longitude
+        directions[i] = (math.sin(theta) * math.cos(phi), math.sin(theta) * math.sin(phi), math.cos(theta))
 
-        # Add random jitter to the radius, amplified by jaggedness_factor
-        # Ensure jitter_val is applied as a deviation from the base radius
-        base_radius = random.uniform(inner_radius, outer_radius)
-        jitter_amount = random.uniform(-jitter_val, jitter_val) * jaggedness_factor
-        radius = base_radius + jitter_amount
-
-        # Ensure radius remains positive
-        if radius <= 0:
-            radius = 0.1 # Small positive value to avoid issues
-        
-        # Convert spherical to cartesian coordinates
-        x = radius * math.sin(theta) * math.cos(phi)
-        y = radius * math.sin(theta) * math.sin(phi)
-        z = radius * math.cos(theta)
-
-        # Apply noise for displacement (indents or bumps)
-        if displacement_strength != 0 and indentation_scale > 0:
-            # Scale the coordinates for the noise function
-            nx = x * indentation_scale * indentation_shape_factor[0]
-            ny = y * indentation_scale * indentation_shape_factor[1]
-            nz = z * indentation_scale * indentation_shape_factor[2]
-
-            # Generate 3D Perlin noise
-            displacement = noise.pnoise3(nx, ny, nz, octaves=8, persistence=0.7, lacunarity=2.5, repeatx=1024, repeaty=1024, repeatz=1024, base=0)
-
-            # Apply displacement to the radius
-            radius += displacement * displacement_strength
-
-            # Recalculate x, y, z with the new radius
-            x = radius * math.sin(theta) * math.cos(phi) * shape_randomization_factor[0]
-            y = radius * math.sin(theta) * math.sin(phi) * shape_randomization_factor[1]
-            z = radius * math.cos(theta) * shape_randomization_factor[2]
-
-        points.append([x, y, z])
-
-    points = np.array(points)
-    
-    # Create the convex hull from the points
-    hull = ConvexHull(points)
-
-    # The vertices of the hull are the final 3D points of our asteroid
-    vertices = hull.points
-    # The simplices are the triangular faces, defined by indices into the vertices array
-    faces = hull.simplices
-
-    return vertices, faces
+        # Random jitter is a deviation from the base radius, scaled later by the jaggedness factor
+        base_radii[i] = random.uniform(inner_radius, outer_radius)
+        jitter_offsets[i] = random.uniform(-jitter_val, jitter_val)
+    return directions, base_radii, jitter_offsets
 
+def displace_asteroid_points(directions, base_radii, jitter_offsets, jaggedness_factor=1.0, shape_randomization_factor=(1.0, 1.0, 1.0), displacement_strength=0.0, indentation_scale=0.0, indentation_shape_factor=(1.0, 1.0, 1.0), noise_samples=None):
+    """
+    Turns the sampled points into 3D positions for the given shape factors.
+    Returns the points and the per-point noise samples, so a later call with only a
+    new displacement_strength can pass them back in instead of re-sampling the noise.
+    """
+    # Amplify the jitter by the jaggedness factor and ensure the radius remains positive
+    radii = np.maximum(base_radii + jitter_offsets * jaggedness_factor, 0.1)
+    points = directions * radii[:, None]
+
+    # Apply noise for displacement (indents or bumps)
+    if displacement_strength != 0 and indentation_scale > 0:
+        if noise_samples is None:
+            # Scale the coordinates for the noise function and generate 3D Perlin noise
+            noise_coords = points * indentation_scale * np.asarray(indentation_shape_factor)
+            noise_samples = np.array([
+                noise.pnoise3(nx, ny, nz, octaves=8, persistence=0.7, lacunarity=2.5, repeatx=1024, repeaty=1024, repeatz=1024, base=0)
+                for nx, ny, nz in noise_coords
+            ])
+
+        # Apply displacement to the radius and recalculate x, y, z with the new radius
+        radii = radii + noise_samples * displacement_strength
+        points = directions * radii[:, None] * np.asarray(shape_randomization_factor)
+
+    return points, noise_samples
 
 # --- Functions to calculate dynamic properties based on size ---
 def calculate_dynamic_property(outer_radius, min_size, max_size, min_value, max_value, invert=False):
@@ -147,6 +134,20 @@ def generate_uv_coordinates(vertices):
         uvs.append((u, v))
     return np.array(uvs)
 
+def generate_vertex_normals(vertices):
+    """Uses the normalized vertex positions as normals for smooth shading."""
+    lengths = np.linalg.norm(vertices, axis=1, keepdims=True)
+    lengths[lengths == 0] = 1.0 # Avoid division by zero
+    return (vertices / lengths).astype(np.float32)
+
+def build_vertex_buffer_data(vertices, normals, uvs):
+    """Packs vertices into an interleaved float32 [px, py, pz, nx, ny, nz, u, v] array for a VBO."""
+    vertex_data = np.empty((len(vertices), 8), dtype=np.float32)
+    vertex_data[:, 0:3] = vertices
+    vertex_data[:, 3:6] = normals
+    vertex_data[:, 6:8] = uvs
+    return vertex_data
+
 
 
 # --- Asteroid3D Class ---
@@ -167,8 +168,14 @@ class Asteroid3D:
         
         # Store the base, unrotated vertices and faces
         self.base_vertices = np.array([])
-        self.faces = np.array([])
+        self.faces = np.empty((0, 3), dtype=np.int32) # (N, 3) triangle vertex indices
         self.uv_coords = np.array([]) # Add UV coordinates
+        self.point_samples = None # Random (directions, base_radii, jitter_offsets) the vertices are built from
+        self.noise_samples = None # Per-point displacement noise, reused while only the displacement strength changes
+        self.normals = np.array([]) # Unit vertex normals
+        self.color_gl = (0.0, 0.0, 0.0, 1.0) # Color as normalized RGBA floats for OpenGL
+        self.vertex_data = None # Interleaved vertex/normal/UV data for GL buffers
+        self.index_data = None # Flat triangle indices for GL buffers
 
         # 3D Rotation attributes
         self.rotation = R.from_euler('xyz', [0, 0, 0], degrees=True) # Initial rotation
@@ -249,14 +256,16 @@ class Asteroid3D:
 
         if self.color_key not in ASTEROID_COLORS:
             self.color_key = 'brown'
-
-        # Generate the 3D data, passing all relevant factors
-        self.base_vertices, self.faces = generate_asteroid_core_data(
-            self.inner_radius, self.outer_radius, self.jitter, self.jaggedness_factor,
-            self.shape_randomization_factor, self.displacement_strength,
-            self.indentation_scale, self.indentation_shape_factor
-        )
-        self.uv_coords = generate_uv_coordinates(self.base_vertices)
+        color = self.get_color()
+        self.color_gl = (color[0] / 255.0, color[1] / 255.0, color[2] / 255.0, 1.0)
+
+        # Generate the 3D data, passing all relevant factors, and keep the samples for later re-displacement
+        self.point_samples = sample_asteroid_points(self.inner_radius, self.outer_radius, self.jitter)
+        self.noise_samples = None
+        points = self._displace_points()
+        self.faces = np.ascontiguousarray(ConvexHull(points).simplices, dtype=np.int32)
+        self.index_data = self.faces.ravel().astype(np.uint32)
+        self._set_vertices(points)
         
         # Set a new random rotation and speed if fully randomizing
         if randomize_all:
@@ -294,6 +303,31 @@ class Asteroid3D:
                     nested_satellite_proportion=self.nested_satellite_proportion # Pass the proportion to nested satellites
                 ))
 
+    def update_jaggedness(self, jaggedness_factor):
+        """Re-displaces the existing vertices for a new jaggedness factor, keeping the faces and random samples."""
+        self.jaggedness_factor = jaggedness_factor
+        self.noise_samples = None # The noise is sampled at the jittered radius, so it has to be re-sampled
+        self._set_vertices(self._displace_points())
+
+    def update_displacement(self, displacement_strength):
+        """Re-displaces the existing vertices for a new displacement strength, keeping the faces and noise samples."""
+        self.displacement_strength = displacement_strength
+        self._set_vertices(self._displace_points())
+
+    def _displace_points(self):
+        points, self.noise_samples = displace_asteroid_points(
+            *self.point_samples, self.jaggedness_factor,
+            self.shape_randomization_factor, self.displacement_strength,
+            self.indentation_scale, self.indentation_shape_factor, self.noise_samples
+        )
+        return points
+
+    def _set_vertices(self, vertices):
+        self.base_vertices = vertices
+        self.uv_coords = generate_uv_coordinates(self.base_vertices)
+        self.normals = generate_vertex_normals(self.base_vertices)
+        self.vertex_data = build_vertex_buffer_data(self.base_vertices, self.normals, self.uv_coords)
+
     def update(self, delta_time, parent_world_position=None):
         # Update self-rotation
         rotation_delta = R.from_rotvec(self.rotation_speed * (math.pi / 180.0)) # Convert speed to radians
@@ -216,6 +216,9 @@ class Asteroid:
         self.rotation_angle = 0.0
         self.rotation_speed = 0.0
 
+        # Unrotated textured surfaces keyed by (brightness step, color); cleared when the shape changes
+        self._frame_images = {}
+
         self.recreate_asteroid(
             new_outer_radius=new_outer_radius,
             asteroid_type=asteroid_type,
@@ -253,6 +256,7 @@ class Asteroid:
                 self.inner_radius, self.outer_radius, self.jitter, self.smoothing_iterations,
                 tex_width, tex_height
             )
+        self._frame_images = {}
 
         if randomize_all or new_outer_radius is not None or asteroid_type is not None:
              self.animation_timer_counter = random.randint(0, self.animation_duration - 1)
@@ -274,13 +278,17 @@ class Asteroid:
         if CLEAR_ASTEROID_TEXTURE is None:
             return pygame.Surface((self.surface_size, self.surface_size), pygame.SRCALPHA)
 
-        base_color = ASTEROID_COLORS.get(self.color_key, (255, 255, 255))
-        brightness_factor = ANIMATION_SEQUENCE_INDICES[self.current_animation_frame_index] / 7.0
-        animated_color = tuple(min(255, int(c * (0.5 + brightness_factor * 0.5))) for c in base_color)
+        frame_key = (ANIMATION_SEQUENCE_INDICES[self.current_animation_frame_index], self.color_key)
+        original_asteroid_surface = self._frame_images.get(frame_key)
+        if original_asteroid_surface is None:
+            base_color = ASTEROID_COLORS.get(self.color_key, (255, 255, 255))
+            brightness_factor = ANIMATION_SEQUENCE_INDICES[self.current_animation_frame_index] / 7.0
+            animated_color = tuple(min(255, int(c * (0.5 + brightness_factor * 0.5))) for c in base_color)
 
-        original_asteroid_surface = apply_texture_to_shape(
-            self.smoothed_points, self.surface_size, CLEAR_ASTEROID_TEXTURE, self.patch_x, self.patch_y, animated_color
-        )
+            original_asteroid_surface = apply_texture_to_shape(
+                self.smoothed_points, self.surface_size, CLEAR_ASTEROID_TEXTURE, self.patch_x, self.patch_y, animated_color
+            )
+            self._frame_images[frame_key] = original_asteroid_surface
 
         rotated_asteroid_surface = pygame.transform.rotate(original_asteroid_surface, self.rotation_angle)
 
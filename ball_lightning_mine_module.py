@@ -74,7 +74,7 @@ class BallLightningMine:
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.target_radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
+        self.target_radius = self.game.player_ship.track_radii[track]
         self.angle = random.uniform(0, 2 * math.pi)
         self.radius = 0
         self.speed = random.uniform(2, 5)
@@ -162,7 +162,7 @@ class BallLightningMine:
         self.ball_lightning_graphic.set_position(self.x, self.y)
 
     def _generate_new_lightning_arcs(self):
-        track_center_radius = self.game.player_ship.orbital_radius_base + self.track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
+        track_center_radius = self.game.player_ship.track_radii[self.track]
         
         for _ in range(ARC_COUNT):
             arc_length = random.uniform(*ARC_ANGULAR_LENGTH_RANGE)
@@ -182,8 +182,7 @@ class BallLightningMine:
     def draw(self, game_surface):
         if self.state == "traveling" or self.state == "charging":
             lightning_image = self.ball_lightning_graphic.get_current_image()
-            image_rect = lightning_image.get_rect(center=(int(self.x), int(self.y)))
-            game_surface.blit(lightning_image, image_rect)
+            game_surface.blit(lightning_image, (int(self.x) - lightning_image.get_width() // 2, int(self.y) - lightning_image.get_height() // 2))
         
         elif self.state == "exploding":
             for arc_data in self.lightning_arcs:
@@ -220,6 +219,7 @@ if __name__ == "__main__":
             self.orbital_radius_base = 150
             self.track_width = 60
             self.track_spacing_multiplier = 2.5
+            self.track_radii = tuple(self.orbital_radius_base + track * self.track_width * self.track_spacing_multiplier for track in range(3))
             self.track = 1
             self.shield_active = False
             self.x = screen_width // 2
@@ -261,7 +261,7 @@ if __name__ == "__main__":
 
         screen.fill((40, 0, 60))
 
-        track_center_radius = mock_game.player_ship.orbital_radius_base + test_mine.track * mock_game.player_ship.track_width * mock_game.player_ship.track_spacing_multiplier
+        track_center_radius = mock_game.player_ship.track_radii[test_mine.track]
         pygame.draw.circle(screen, (20, 0, 30), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), track_center_radius + mock_game.player_ship.track_width // 2, 1)
         pygame.draw.circle(screen, (20, 0, 30), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), track_center_radius - mock_game.player_ship.track_width // 2, 1)
 
@@ -3,6 +3,13 @@ import math
 import random
 import sys
 import json
+import threading
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError: # numba is optional; the NumPy code paths are used without it
+    njit = None
 
 from asteroid_module import Asteroid, load_asteroid_textures, MIN_OUTER_RADIUS, MAX_OUTER_RADIUS, ASTEROID_COLORS, ANIMATION_SEQUENCE_INDICES
 from ball_lightning_module import BallLightning
@@ -20,38 +27,254 @@ import os
 # --- Asset Path ---
 ASSET_PATH = "assets"
 
+# --- High Scores ---
+HIGH_SCORES_PATH = os.path.join(ASSET_PATH, 'highscores.json')
+high_scores_writer = None # Thread writing the most recent save, if any
+# Last parsed table, reused while the file's modification time is unchanged
+high_scores_cache = {"mtime": None, "scores": []}
+
+# --- Collision Broadphase ---
+# Cell size of the per-frame obstacle grid. Must be at least the largest obstacle
+# radius plus the largest pirate/projectile radius so a 3x3 probe never misses a hit.
+COLLISION_CELL_SIZE = 64
+# A probe covers its own cell and the eight around it
+COLLISION_NEIGHBOR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+# --- Frame Rate ---
+# Screens whose content doesn't animate don't need the full gameplay frame rate.
+# Animated screens (menu, game over jitter, high score crystal, name cursor) count
+# frames for their timing, so they stay at Game.fps.
+STATIC_SCREEN_FPS = 30
+STATIC_SCREEN_STATES = {"SPLASH", "PAUSED", "ESCAPED", "LEVEL_COMPLETE"}
+# Background star rotation on menu screens, per frame at the nominal Game.fps
+MENU_STAR_ROTATION_SPEED = 0.01
+# The menu's 800px splash asteroid is only re-rotated when its angle crosses a step of this
+# many degrees (every 5 frames at 0.05 degrees a frame); in between the last rotation is reused
+MENU_ASTEROID_ROTATION_STEP = 0.25
+# Distinct rotozoomed game over images the jitter flashes pick from. Each is ~3 MB, so the
+# pool stays small; flashes last 2 frames, too short to notice repeats.
+GAME_OVER_JITTER_VARIANTS = 12
+# Game logic runs in fixed 1/fps steps. A late frame is caught up with extra steps, but
+# never more than this many, so a long hitch (e.g. loading a level) can't snowball.
+MAX_UPDATE_STEPS_PER_FRAME = 4
+# Clock.get_time() is whole milliseconds, so a frame at 120fps measures 8 or 9 ms.
+# Steps due within this fraction are taken now to avoid alternating 0- and 2-step frames.
+UPDATE_STEP_TOLERANCE = 0.1
+# When the letterboxed game area covers less than this fraction of the window, only that
+# rect is pushed to the display; the bars never change. Otherwise a full flip is cheaper.
+PARTIAL_UPDATE_MAX_WINDOW_FRACTION = 0.5
+
+# --- HUD ---
+# Zero-padded "00".."99", indexed by the timer's hundredths instead of formatting them every frame
+TWO_DIGIT_LABELS = tuple(f"{i:02}" for i in range(100))
+
+# --- Time Dilation ---
+# Per-track dilation gain and how strongly ship speed modifies it (inner, middle, outer)
+TRACK_DILATION_RATES = (1, 0.20, 0.10)
+TRACK_SPEED_INFLUENCE = (30.0, 10.0, -50.5)
+
+# --- Angles ---
+TWO_PI = 2 * math.pi
+INV_TWO_PI = 1 / TWO_PI
+
+# --- Trig Lookup ---
+# Sin/cos table for purely visual positions (background stars). Power-of-two size so an
+# index wraps with a mask; at 4096 entries the error stays under a pixel on screen.
+# Each row holds (sin, cos) side by side so one gather fetches both.
+TRIG_TABLE_SIZE = 4096
+TRIG_TABLE_MASK = TRIG_TABLE_SIZE - 1
+_trig_table_angles = np.arange(TRIG_TABLE_SIZE) * (TWO_PI / TRIG_TABLE_SIZE)
+SINCOS_TABLE = np.column_stack((np.sin(_trig_table_angles), np.cos(_trig_table_angles)))
+
 # --- Helper functions (can be outside the class) ---
+def compute_dilation(track, base_speed, max_speed):
+    # Dilation gained this frame on the given track at the given ship speed
+    speed_effect = base_speed / max_speed
+    return TRACK_DILATION_RATES[track] * (1.0 + speed_effect * TRACK_SPEED_INFLUENCE[track])
+
 def check_collision(obj1_radius, obj1_x, obj1_y, obj2_radius, obj2_x, obj2_y):
     distance_squared = (obj1_x - obj2_x)**2 + (obj1_y - obj2_y)**2
     radii_sum_squared = (obj1_radius + obj2_radius)**2
     return distance_squared < radii_sum_squared
 
+def sincos_lookup(angle):
+    # Table sine and cosine of an array of angles
+    index = (angle * (TRIG_TABLE_SIZE * INV_TWO_PI)).astype(np.intp) & TRIG_TABLE_MASK
+    sincos = SINCOS_TABLE[index]
+    return sincos[:, 0], sincos[:, 1]
+
+def tick_obstacle_orbits(radius, target_radius, entry_speed, entering, angle, orbital_speed):
+    # Vectorized version of the per-obstacle entry/orbit step; all arguments are updated in place
+    orbiting = ~entering
+    inward = entering & (radius < target_radius)
+    outward = entering & ~inward
+    np.add(radius, entry_speed, out=radius, where=inward)
+    np.subtract(radius, entry_speed, out=radius, where=outward)
+    arrived = (inward & (radius >= target_radius)) | (outward & (radius <= target_radius))
+    entering &= ~arrived
+    np.add(angle, orbital_speed, out=angle, where=orbiting)
+    np.mod(angle, TWO_PI, out=angle)
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def tick_obstacle_orbits(radius, target_radius, entry_speed, entering, angle, orbital_speed):
+        # Same step as the NumPy version above, compiled as a plain loop when numba is installed
+        for i in range(radius.shape[0]):
+            if entering[i]:
+                if radius[i] < target_radius[i]:
+                    radius[i] += entry_speed[i]
+                    if radius[i] >= target_radius[i]:
+                        entering[i] = False
+                else:
+                    radius[i] -= entry_speed[i]
+                    if radius[i] <= target_radius[i]:
+                        entering[i] = False
+            else:
+                angle[i] += orbital_speed[i]
+                if angle[i] > TWO_PI:
+                    angle[i] -= TWO_PI
+                elif angle[i] < 0:
+                    angle[i] += TWO_PI
+
+def find_circle_hits(x, y, radius, xs, ys, radii, tracks, track):
+    # Indices of the circles on the given track that overlap the circle at (x, y).
+    # Only circles on that track get the distance test.
+    on_track = np.flatnonzero(tracks == track)
+    dx = xs[on_track] - x
+    dy = ys[on_track] - y
+    reach = radii[on_track] + radius
+    return on_track[dx * dx + dy * dy < reach * reach]
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def find_circle_hits(x, y, radius, xs, ys, radii, tracks, track):
+        # Same test as the NumPy version above, as a single compiled loop
+        hits = np.empty(xs.shape[0], dtype=np.intp)
+        count = 0
+        for i in range(xs.shape[0]):
+            if tracks[i] != track:
+                continue
+            dx = xs[i] - x
+            dy = ys[i] - y
+            reach = radii[i] + radius
+            if dx * dx + dy * dy < reach * reach:
+                hits[count] = i
+                count += 1
+        return hits[:count]
+
+def tick_star_field(angle, alpha, alpha_change, layer_ends, layer_multipliers, angular_step):
+    # Rotate every star by its layer's share of angular_step and advance its twinkle; updated in place.
+    # Stars are stored layer by layer, so each layer is one contiguous slice sharing a single delta.
+    start = 0
+    for end, multiplier in zip(layer_ends.tolist(), layer_multipliers.tolist()):
+        angle[start:end] += np.float32(angular_step * multiplier)
+        start = end
+    np.mod(angle, np.float32(TWO_PI), out=angle)
+    alpha += alpha_change
+    reverse = (alpha <= 50) | (alpha >= 255)
+    alpha_change[reverse] *= -1
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def tick_star_field(angle, alpha, alpha_change, layer_ends, layer_multipliers, angular_step):
+        # One fused pass over the field instead of the separate NumPy passes above
+        two_pi = np.float32(TWO_PI)
+        start = 0
+        for layer in range(layer_ends.shape[0]):
+            delta = np.float32(angular_step * layer_multipliers[layer])
+            end = layer_ends[layer]
+            for i in range(start, end):
+                a = angle[i] + delta
+                if a >= two_pi:
+                    a -= two_pi
+                elif a < 0:
+                    a += two_pi
+                angle[i] = a
+                alpha[i] += alpha_change[i]
+                if alpha[i] <= 50 or alpha[i] >= 255:
+                    alpha_change[i] = -alpha_change[i]
+            start = end
+
+def stamp_star_alpha(alpha_pixels, xs, ys, sizes, alphas):
+    # Write each star's alpha over its size x size square of alpha_pixels (indexed [x, y]).
+    # Stars are 1-3 px; each pixel offset is stamped for the stars large enough to cover it.
+    width, height = alpha_pixels.shape
+    for dx in range(3):
+        for dy in range(3):
+            px = xs + dx
+            py = ys + dy
+            mask = (sizes > max(dx, dy)) & (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            alpha_pixels[px[mask], py[mask]] = alphas[mask]
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def stamp_star_alpha(alpha_pixels, xs, ys, sizes, alphas):
+        # Same stamp as above as one loop over the stars, without the nine masked passes
+        width, height = alpha_pixels.shape
+        for i in range(xs.shape[0]):
+            size = sizes[i]
+            alpha = alphas[i]
+            for dx in range(size):
+                x = xs[i] + dx
+                if x < 0 or x >= width:
+                    continue
+                for dy in range(size):
+                    y = ys[i] + dy
+                    if 0 <= y < height:
+                        alpha_pixels[x, y] = alpha
+
+def update_and_compact(items, is_finished):
+    # Update every item and drop the finished ones in a single in-place pass. Survivors are
+    # shifted down in order, so there is no per-frame copy and no O(n) remove() per item.
+    live = 0
+    for item in items:
+        item.update()
+        if not is_finished(item):
+            items[live] = item
+            live += 1
+    del items[live:]
+
+def write_high_scores(high_scores):
+    try:
+        with open(HIGH_SCORES_PATH, 'w') as f:
+            json.dump(high_scores, f, separators=(',', ':')) # Compact: the file is only ever read back by the game
+        print("Score saved successfully!")
+    except IOError as e:
+        print(f"Error saving scores: {e}")
+
+def wait_for_high_scores_write():
+    # Block until the last background save has reached the disk
+    if high_scores_writer is not None:
+        high_scores_writer.join()
+
 def save_final_score(player_name, final_score):
+    global high_scores_writer
     score_entry = {
         'name': player_name,
         'score': int(final_score),
         'timestamp': pygame.time.get_ticks()
     }
-    high_scores = []
-    try:
-        with open(os.path.join(ASSET_PATH, 'highscores.json'), 'r') as f:
-            high_scores = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        high_scores = []
+    high_scores = list(load_high_scores()) # Copy, so the cached table isn't modified
     high_scores.append(score_entry)
     high_scores.sort(key=lambda x: x['score'], reverse=True)
-    try:
-        with open(os.path.join(ASSET_PATH, 'highscores.json'), 'w') as f:
-            json.dump(high_scores, f, indent=4)
-        print("Score saved successfully!")
-    except IOError as e:
-        print(f"Error saving scores: {e}")
+    high_scores_cache["mtime"] = None # Force the next load to re-read the new file
+    # The JSON dump and disk write happen off the game loop. The thread isn't a daemon,
+    # so quitting right after a save still lets it finish.
+    high_scores_writer = threading.Thread(target=write_high_scores, args=(high_scores,))
+    high_scores_writer.start()
 
 def load_high_scores():
+    # Callers must treat the returned list as read-only; it is shared with the cache
+    wait_for_high_scores_write() # Never read a file that a save is still writing
     try:
-        with open(os.path.join(ASSET_PATH, 'highscores.json'), 'r') as f:
+        mtime = os.stat(HIGH_SCORES_PATH).st_mtime_ns
+        if mtime == high_scores_cache["mtime"]:
+            return high_scores_cache["scores"]
+        with open(HIGH_SCORES_PATH, 'r') as f:
             scores = json.load(f)
             print(f"Loaded high scores: {scores}")
+            high_scores_cache["mtime"] = mtime
+            high_scores_cache["scores"] = scores
             return scores
     except (FileNotFoundError, json.JSONDecodeError):
         print("No highscores.json found or file is empty/corrupt. Returning empty list.")
@@ -67,6 +290,9 @@ class Game:
 
         self.original_screen_width = 1000
         self.original_screen_height = 800
+        # Black hole center in game-surface coordinates; everything orbits around it
+        self.center_x = self.original_screen_width // 2
+        self.center_y = self.original_screen_height // 2
         self.screen = pygame.display.set_mode((self.original_screen_width, self.original_screen_height), pygame.RESIZABLE)
         self.game_surface = pygame.Surface((self.original_screen_width, self.original_screen_height))
         self.screen_width = self.original_screen_width # Current screen width
@@ -75,6 +301,8 @@ class Game:
         self.scale_factor = 1.0
         self.offset_x = 0
         self.offset_y = 0
+        self.scaled_size = None
+        self.scaled_surface = None
         self.name_input_max_length = 8
         self.current_level_number = 1
         self.current_level_data = None
@@ -86,16 +314,7 @@ class Game:
         self.current_music_path = None
 
         # Initial resize calculation based on actual window size
-        current_w, current_h = self.screen.get_size()
-        current_aspect_ratio = current_w / current_h
-        if current_aspect_ratio > self.aspect_ratio: # Wider than original
-            self.scale_factor = current_h / self.original_screen_height
-            self.offset_x = (current_w - int(self.original_screen_width * self.scale_factor)) // 2
-            self.offset_y = 0
-        else: # Taller than original or same aspect ratio
-            self.scale_factor = current_w / self.original_screen_width
-            self.offset_y = (current_h - int(self.original_screen_height * self.scale_factor)) // 2
-            self.offset_x = 0
+        self.update_letterbox(*self.screen.get_size())
 
         # Camera and Slow-motion
         self.slow_motion_factor = 1.0
@@ -107,6 +326,8 @@ class Game:
 
         self.clock = pygame.time.Clock()
         self.fps = 120
+        self.frame_time_scale = 1.0 # Last frame's duration relative to a nominal 1/fps frame
+        self.update_accumulator = 1.0 # Logic steps owed, in nominal 1/fps frames
 
         self.load_assets()
         self.initialize_ui_elements()
@@ -116,6 +337,19 @@ class Game:
 
         self.initialize_game_objects()
 
+        # Collision passes specialized per (following charge active, pirates present)
+        # so frames without those features don't pay for their checks
+        common_passes = (self._collide_ship_boosts, self._collide_ship_power_ups, self._collide_ship_obstacles)
+        pirate_passes = (self._build_obstacle_grid, self._collide_pirates_obstacles)
+        projectile_passes = (self._collide_ship_projectiles, self._collide_projectiles_obstacles)
+        charge_passes = (self._collide_ship_following_charge,)
+        self._collision_variants = {
+            (False, False): common_passes,
+            (False, True): common_passes + pirate_passes + projectile_passes,
+            (True, False): common_passes + charge_passes,
+            (True, True): common_passes + pirate_passes + charge_passes + projectile_passes,
+        }
+
     def load_assets(self):
         load_asteroid_textures()
         load_crystal_texture()
@@ -143,6 +377,7 @@ class Game:
         new_width = int(width * 0.8)
         new_height = int(height * 0.8)
         self.game_over_background_image = pygame.transform.scale(self.game_over_background_image, (new_width, new_height))
+        self.game_over_background_pos = self.game_over_background_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2)).topleft
         self.escaped_splash_image = pygame.image.load(os.path.join(ASSET_PATH, 'escaped_splash.png')).convert()
         self.escaped_splash_image = pygame.transform.scale(self.escaped_splash_image, (self.original_screen_width, self.original_screen_height))
         print("Escaped splash image loaded.")
@@ -212,17 +447,16 @@ class Game:
         
         # Create three layers of stars for parallax effect
         num_stars_per_layer = 1000 // 3
-        self.stars = []
-        # Layer 1: Fastest (original speed)
-        self.stars.extend([Star(self.original_screen_width, self.original_screen_height, 1.0) for _ in range(num_stars_per_layer)])
-        # Layer 2: Slower
-        self.stars.extend([Star(self.original_screen_width, self.original_screen_height, 0.5) for _ in range(num_stars_per_layer)])
-        # Layer 3: Very Slowest
-        self.stars.extend([Star(self.original_screen_width, self.original_screen_height, 0.2) for _ in range(1000 - 2 * num_stars_per_layer)]) # Ensure total is 1000
+        self.star_field = StarField(self.original_screen_width, self.original_screen_height, [
+            (1.0, num_stars_per_layer), # Layer 1: Fastest (original speed)
+            (0.5, num_stars_per_layer), # Layer 2: Slower
+            (0.2, 1000 - 2 * num_stars_per_layer), # Layer 3: Very Slowest (ensure total is 1000)
+        ])
 
         self.speed_boosts = []
         self.power_ups = []
         self.obstacles = []
+        self.clear_obstacle_orbits()
         self.particle_effects = []
         self.ship_debris = []
         self.cinematic_player = None # New: To manage the cinematic
@@ -249,6 +483,7 @@ class Game:
         self.dilation_font = pygame.font.Font(font_path, 24)
         self.how_to_play_font = pygame.font.Font(font_path, 20)
         self.level_font = pygame.font.Font(font_path, 24)
+        self.menu_item_space_width = self.menu_item_font.size(" ")[0] # Used for high score column padding
 
         # Colors
         self.light_green = (144, 238, 144)
@@ -258,29 +493,52 @@ class Game:
         self.black = (0, 0, 0)
         self.dark_purple = (30, 0, 60)
         self.track_color = (50, 50, 50)
+        self.tracks_surface = None
+        self.tracks_surface_key = None
         self.speed_boost_color = (0, 255, 0)
 
+        # Rendered text surfaces keyed by (font, text, color); filled lazily by render_cached_text
+        self.text_cache = {}
+        self.timer_label = ""
+        self.timer_label_seconds = None # Whole seconds self.timer_label was formatted for
+        self.paragraph_layout_cache = {}
+        self.menu_text_blits = None # Menu labels and instructions with their positions, laid out on first draw
+        # Pre-baked high score box, rebuilt only when the score list changes
+        self.high_scores_panel_key = None
+        self.high_scores_panel_surface = None
+        self.high_scores_panel_pos = (0, 0)
+
         # UI Text Renderings
-        self.title_text_render = self.title_font.render("BLACK HOLE RUN COMMENCING!", True, self.light_green)
+        self.title_text_render = self.title_font.render("BLACK HOLE RUN COMMENCING!", True, self.light_green).convert_alpha()
         self.title_rect = self.title_text_render.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 7))
-        self.start_text = self.start_font.render("press any key to start", True, self.light_green)
+        self.start_text = self.start_font.render("press any key to start", True, self.light_green).convert_alpha()
         self.start_rect = self.start_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 4.5))
-        self.score_text = self.start_font.render("press h for High Scores", True, self.light_green)
+        self.score_text = self.start_font.render("press h for High Scores", True, self.light_green).convert_alpha()
         self.score_rect = self.score_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 3.5))
-        self.destroyed_text = self.game_over_font_large.render("YOU WERE DESTROYED", True, self.red)
+        self.destroyed_text = self.game_over_font_large.render("YOU WERE DESTROYED", True, self.red).convert_alpha()
         self.destroyed_rect = self.destroyed_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 3))
-        self.restart_text = self.game_over_font_small.render("Press 'ENTER' to try again", True, self.light_green)
+        self.restart_text = self.game_over_font_small.render("Press 'ENTER' to try again", True, self.light_green).convert_alpha()
         self.restart_rect = self.restart_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
-        self.quit_text = self.game_over_font_small.render("Press 'Q' to quit", True, self.light_green)
+        self.quit_text = self.game_over_font_small.render("Press 'Q' to quit", True, self.light_green).convert_alpha()
         self.quit_rect = self.quit_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height * 2 / 3))
-        self.escaped_message_text = self.escaped_font_large.render("YOU ESCAPED THE BLACK HOLE!", True, self.light_green)
+        self.escaped_message_text = self.escaped_font_large.render("YOU ESCAPED THE BLACK HOLE!", True, self.light_green).convert_alpha()
         self.escaped_rect = self.escaped_message_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 4))
-        self.restart_text_escaped = self.escaped_font_small.render("Press 'ENTER' to try again", True, self.light_green)
+        self.restart_text_escaped = self.escaped_font_small.render("Press 'ENTER' to try again", True, self.light_green).convert_alpha()
         self.restart_rect_escaped = self.restart_text_escaped.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 1.4))
-        self.quit_text_escaped = self.escaped_font_small.render("Press 'Q' to quit", True, self.light_green)
+        self.quit_text_escaped = self.escaped_font_small.render("Press 'Q' to quit", True, self.light_green).convert_alpha()
         self.quit_rect_escaped = self.quit_text_escaped.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 1.2))
+        # The game over text never changes, so its shadowed lines are placed once here
+        game_over_texts = [
+            self.place_text_with_shadow("YOU WERE DESTROYED", self.game_over_font_large, self.red, topleft=self.destroyed_rect.topleft),
+            self.place_text_with_shadow("Press 'ENTER' to try again", self.game_over_font_small, self.light_green, topleft=self.restart_rect.topleft),
+            self.place_text_with_shadow("Press 'Q' to quit", self.game_over_font_small, self.light_green, topleft=self.quit_rect.topleft),
+        ]
+        self.game_over_text_blits = [(text_surface, text_rect.topleft) for text_surface, text_rect in game_over_texts]
         self.color_cycle = 0
         self.asteroid_rotation_angle = 0
+        self.rotated_asteroid_splash = None
+        self.rotated_asteroid_splash_step = None
+        self.rotated_asteroid_splash_rect = None
         self.glow_alpha = 0
         self.glow_direction = 1
         self.glow_speed = 4
@@ -294,33 +552,59 @@ class Game:
         self.menu_energy_crystal.base_color = CRYSTAL_COLORS[self.menu_energy_crystal.color_key]
         self.menu_crystal_large = Crystal(self.original_screen_width // 2, self.original_screen_height // 2, base_avg_radius=250)
 
+        # How to Play box (allocated once, blitted every menu frame)
+        menu_box_width = int(self.original_screen_width * 0.8)
+        menu_box_height = int(self.original_screen_height * 0.8) + 60
+        self.menu_box = pygame.Surface((menu_box_width, menu_box_height), pygame.SRCALPHA).convert_alpha()
+        self.menu_box.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
+        self.menu_box_pos = ((self.original_screen_width - menu_box_width) // 2, self.original_screen_height // 10)
+
+        # Pause Menu Overlay (allocated once, blitted every paused frame)
+        self.dim_overlay = pygame.Surface((self.original_screen_width, self.original_screen_height), pygame.SRCALPHA).convert_alpha()
+        self.dim_overlay_alpha = 150
+        self.dim_overlay.fill((0, 0, 0, self.dim_overlay_alpha))
+
         # Pause Menu Text
         self.paused_font = pygame.font.Font(font_path, 74)
-        self.paused_text = self.paused_font.render("PAUSED", True, self.white)
+        self.paused_text = self.paused_font.render("PAUSED", True, self.white).convert_alpha()
         self.paused_rect = self.paused_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 4))
 
-        self.continue_text = self.start_font.render("Continue (C)", True, self.light_green)
+        self.continue_text = self.start_font.render("Continue (C)", True, self.light_green).convert_alpha()
         self.continue_rect = self.continue_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 - 50))
 
-        self.main_menu_text = self.start_font.render("Main Menu (M)", True, self.light_green)
+        self.main_menu_text = self.start_font.render("Main Menu (M)", True, self.light_green).convert_alpha()
         self.main_menu_rect = self.main_menu_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 20))
 
-        self.quit_pause_text = self.start_font.render("Quit (Q)", True, self.light_green)
+        self.quit_pause_text = self.start_font.render("Quit (Q)", True, self.light_green).convert_alpha()
         self.quit_pause_rect = self.quit_pause_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 90))
+        self.pause_menu_blits = [
+            (self.paused_text, self.paused_rect),
+            (self.continue_text, self.continue_rect),
+            (self.main_menu_text, self.main_menu_rect),
+            (self.quit_pause_text, self.quit_pause_rect),
+        ]
 
         # Level Complete Text
         self.level_complete_font_large = pygame.font.Font(font_path, 74)
-        self.level_complete_text = self.level_complete_font_large.render("LEVEL COMPLETE!", True, self.light_green)
+        self.level_complete_text = self.level_complete_font_large.render("LEVEL COMPLETE!", True, self.light_green).convert_alpha()
         self.level_complete_rect = self.level_complete_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 3))
 
-        self.next_level_text = self.game_over_font_small.render("Press 'ENTER' for next level", True, self.light_green)
+        self.next_level_text = self.game_over_font_small.render("Press 'ENTER' for next level", True, self.light_green).convert_alpha()
         self.next_level_rect = self.next_level_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
 
-        self.return_to_menu_level_text = self.game_over_font_small.render("Press 'M' to return to Menu", True, self.light_green)
+        self.return_to_menu_level_text = self.game_over_font_small.render("Press 'M' to return to Menu", True, self.light_green).convert_alpha()
         self.return_to_menu_level_rect = self.return_to_menu_level_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 50))
 
-        self.quit_level_text = self.game_over_font_small.render("Press 'Q' to quit", True, self.light_green)
+        self.quit_level_text = self.game_over_font_small.render("Press 'Q' to quit", True, self.light_green).convert_alpha()
         self.quit_level_rect = self.quit_level_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height * 2 / 3))
+        level_complete_texts = [
+            self.place_text_with_shadow("LEVEL COMPLETE!", self.level_complete_font_large, self.light_green, topleft=self.level_complete_rect.topleft),
+            self.place_text_with_shadow("Press 'ENTER' for next level", self.game_over_font_small, self.light_green, topleft=self.next_level_rect.topleft),
+            self.place_text_with_shadow("Press 'M' to return to Menu", self.game_over_font_small, self.light_green, topleft=self.return_to_menu_level_rect.topleft),
+            self.place_text_with_shadow("Press 'Q' to quit", self.game_over_font_small, self.light_green, topleft=self.quit_level_rect.topleft),
+        ]
+        self.level_complete_blits = [(self.escaped_splash_image, (0, 0))] # Use escaped splash for now
+        self.level_complete_blits.extend((text_surface, text_rect.topleft) for text_surface, text_rect in level_complete_texts)
 
         # Jitter effect variables
         self.jitter_timer = random.uniform(0.5, 1.5) * self.fps
@@ -328,7 +612,8 @@ class Game:
         self.jitter_sequence = []
         self.jitter_flash_duration = 2 # Duration of each flash in frames
         self.jitter_flash_timer = 0
-        self.current_jitter_surface = None
+        self.current_jitter = None # (surface, topleft) of the flash being shown
+        self.jitter_variants = [None] * GAME_OVER_JITTER_VARIANTS # Each rotozoomed and centered the first time it is picked
 
         # Level Intro Animation
         self.level_intro_font_initial_size = 200
@@ -389,6 +674,7 @@ class Game:
         self.speed_boosts.clear()
         self.power_ups.clear()
         self.obstacles.clear()
+        self.clear_obstacle_orbits()
         self.particle_effects.clear()
         self.ship_debris.clear()
         self.cinematic_player = None
@@ -417,6 +703,47 @@ class Game:
         self.level_intro_active = True
         self.level_intro_timer = self.level_intro_total_duration
 
+    def on_enter_escaped_state(self):
+        # The score and score table can't change while the escaped screen is up, so work them out once
+        self.final_score = self.calculate_final_score()
+        self.current_high_scores = load_high_scores()
+        static_texts = [
+            self.place_text_with_shadow("YOU ESCAPED THE BLACK HOLE!", self.escaped_font_large, self.light_green, topleft=self.escaped_rect.topleft),
+            self.place_text_with_shadow("Final Score:", self.escaped_font, self.light_green, center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2)),
+            self.place_text_with_shadow(f"{int(self.final_score):,}", self.escaped_font, self.light_green, midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2)),
+            self.place_text_with_shadow("Press 'ENTER' to try again", self.escaped_font_small, self.light_green, topleft=self.restart_rect_escaped.topleft),
+            self.place_text_with_shadow("Press 'Q' to quit", self.escaped_font_small, self.light_green, topleft=self.quit_rect_escaped.topleft),
+        ]
+        self.escaped_static_blits = [(self.escaped_splash_image, (0, 0))]
+        self.escaped_static_blits.extend((text_surface, text_rect.topleft) for text_surface, text_rect in static_texts)
+
+        # Determine the high score threshold dynamically
+        if len(self.current_high_scores) < 10:  # If fewer than 10 scores, any score is a high score
+            dynamic_threshold = 0
+        else:
+            # Get the 10th score (lowest in top 10) and set threshold to 1 above it
+            dynamic_threshold = self.current_high_scores[9]['score'] + 1
+
+        print(f"Final Score: {self.final_score}, Dynamic Threshold: {dynamic_threshold}")
+
+        # Check if score qualifies for high score entry
+        if self.final_score >= dynamic_threshold:
+            self.state_manager.set_state("ESCAPED_INPUT_NAME")
+        else:
+            self.save_score_if_needed() # Save score even if not high score, but without name
+
+    def on_enter_escaped_input_name_state(self):
+        # Everything except the typed name is fixed while this screen is up
+        static_texts = [
+            self.place_text_with_shadow("YOU ESCAPED THE BLACK HOLE!", self.escaped_font_large, self.light_green, topleft=self.escaped_rect.topleft),
+            self.place_text_with_shadow("Final Score:", self.escaped_font, self.light_green, center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2 - 50)),
+            self.place_text_with_shadow(f"{int(self.final_score):,}", self.escaped_font, self.light_green, midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2 - 50)),
+            self.place_text_with_shadow("Enter your name (up to 8 letters):", self.escaped_font_small, self.white, center=(self.original_screen_width // 2, self.original_screen_height // 2 + 50)),
+            self.place_text_with_shadow("Press ENTER to save, ESC to skip", self.escaped_font_small, self.white, center=(self.original_screen_width // 2, self.original_screen_height // 2 + 150)),
+        ]
+        self.input_name_static_blits = [(self.escaped_splash_image, (0, 0))]
+        self.input_name_static_blits.extend((text_surface, text_rect.topleft) for text_surface, text_rect in static_texts)
+
     def on_enter_high_scores_state(self):
         self.current_high_scores = load_high_scores()
         chosen_color = random.choice(['green', 'yellow'])
@@ -495,48 +822,48 @@ class Game:
                     sys.exit()
 
     def run_escaping_update(self):
+        ship = self.player_ship
         # Phase 1: Spinning
         if self.escape_rotations_completed < self.target_rotations:
             # Gradually increase orbital radius during spin
-            self.player_ship.orbital_radius += 0.1 # Smaller increment per frame
+            ship.orbital_radius += 0.1 # Smaller increment per frame
 
             # Gradually accelerate during spin
-            self.player_ship.base_tangential_speed = min(self.player_ship.max_tangential_speed, self.player_ship.base_tangential_speed + 0.01)
-            current_tangential_speed = self.player_ship.base_tangential_speed
+            ship.base_tangential_speed = min(ship.max_tangential_speed, ship.base_tangential_speed + 0.01)
+            current_tangential_speed = ship.base_tangential_speed
 
             # Update angle
-            current_angular_speed = current_tangential_speed / self.player_ship.orbital_radius
-            self.player_ship.angle += current_angular_speed
+            current_angular_speed = current_tangential_speed / ship.orbital_radius
+            ship.angle += current_angular_speed
             self.total_angle_rotated_in_escape += current_angular_speed
 
             # Check for full rotations
-            if self.total_angle_rotated_in_escape >= (self.escape_rotations_completed + 1) * 2 * math.pi:
+            if self.total_angle_rotated_in_escape >= (self.escape_rotations_completed + 1) * TWO_PI:
                 self.escape_rotations_completed += 1
                 print(f"Rotations completed: {self.escape_rotations_completed}")
 
         # Phase 2: Accelerating off-screen
         else:
-            self.player_ship.orbital_radius += 5  # Make it move outwards faster
-            self.player_ship.base_tangential_speed += 0.2 # Make it speed up faster
+            ship.orbital_radius += 5  # Make it move outwards faster
+            ship.base_tangential_speed += 0.2 # Make it speed up faster
 
-            current_angular_speed = self.player_ship.base_tangential_speed / self.player_ship.orbital_radius
-            self.player_ship.angle += current_angular_speed
+            current_angular_speed = ship.base_tangential_speed / ship.orbital_radius
+            ship.angle += current_angular_speed
 
         # Update ship's x, y based on the new orbital_radius and angle
-        self.player_ship.x = self.original_screen_width // 2 + self.player_ship.orbital_radius * math.cos(self.player_ship.angle)
-        self.player_ship.y = self.original_screen_height // 2 + self.player_ship.orbital_radius * math.sin(self.player_ship.angle)
+        ship.x = self.center_x + ship.orbital_radius * math.cos(ship.angle)
+        ship.y = self.center_y + ship.orbital_radius * math.sin(ship.angle)
 
         # Update the ship's internal speed attribute (used by stars)
-        self.player_ship.speed = current_angular_speed
+        ship.speed = current_angular_speed
 
         # Update stars based on the ship's new speed
-        for star in self.stars:
-            star.update(self.player_ship.speed)
+        self.star_field.update(ship.speed)
 
         # Create an accurate bounding box for the drawn ship
-        ship_visual_size = max(self.player_ship.image_orig.get_width(), self.player_ship.image_orig.get_height()) * self.player_ship.display_scale
+        ship_visual_size = max(ship.image_orig.get_width(), ship.image_orig.get_height()) * ship.display_scale
         ship_rect = pygame.Rect(0, 0, ship_visual_size, ship_visual_size)
-        ship_rect.center = (self.player_ship.x, self.player_ship.y)
+        ship_rect.center = (ship.x, ship.y)
 
         # Check if the ship is completely off-screen
         if not self.screen.get_rect().colliderect(ship_rect):
@@ -552,13 +879,14 @@ class Game:
         self.player_ship.display_scale = 1.7 * shrink_factor
 
         # Move ship towards black hole center
-        dx = (self.original_screen_width // 2) - self.player_ship.x
-        dy = (self.original_screen_height // 2) - self.player_ship.y
-        distance = math.hypot(dx, dy)
-        if distance > 0:
+        dx = self.center_x - self.player_ship.x
+        dy = self.center_y - self.player_ship.y
+        distance_squared = dx * dx + dy * dy
+        if distance_squared > 0:
             move_speed = 5 # Adjust how fast it gets sucked in
-            self.player_ship.x += (dx / distance) * move_speed
-            self.player_ship.y += (dy / distance) * move_speed
+            step = move_speed / math.sqrt(distance_squared)
+            self.player_ship.x += dx * step
+            self.player_ship.y += dy * step
 
         # Generate electrocution particles
         if self.electrocuted_timer % 5 == 0: # Emit particles every few frames
@@ -585,10 +913,8 @@ class Game:
 
     def run_electrocuted_draw(self, game_surface):
         game_surface.fill(self.dark_purple) # Clear game_surface
-        for star in self.stars:
-            star.draw(game_surface)
-        self.draw_tracks(game_surface)
-        self.draw_black_hole(game_surface)
+        self.star_field.draw(game_surface)
+        self.draw_tracks_and_black_hole(game_surface)
         self.player_ship.draw(game_surface) # Draw the shrinking ship
         for effect in self.particle_effects:
             effect.draw(game_surface)
@@ -608,45 +934,33 @@ class Game:
                 self.survival_timer -= 1
         
         # These should continue to update for ambiance
-        for star in self.stars:
-            star.update(self.player_ship.speed)
+        self.star_field.update(self.player_ship.speed)
         for boost in self.speed_boosts:
             boost.update()
         for power_up in self.power_ups:
             power_up.update()
+        # All boosts share one crystal graphic, as do all power-ups, so each is animated once here
+        if SpeedBoost.shared_crystal is not None:
+            SpeedBoost.shared_crystal.update()
+        if PowerUp.shared_crystal is not None:
+            PowerUp.shared_crystal.update()
+        self.update_obstacle_orbits()
         for obstacle in self.obstacles:
             obstacle.update()
-        # Remove inactive mines
-        self.obstacles = [o for o in self.obstacles if not (isinstance(o, BallLightningMine) and o.state == "done")]
+        # Remove inactive mines and finished explosions in one sweep
+        self.obstacles = [o for o in self.obstacles
+                          if not (isinstance(o, BallLightningMine) and o.state == "done") and not getattr(o, 'explosion_finished', False)]
         self.following_charge.update(self.player_ship.x, self.player_ship.y, self.player_ship.orbital_radius, self.player_ship.speed)
-        for effect in self.particle_effects:
-            effect.update()
-        for debris in self.sucking_debris[:]:
-            debris.update()
-            if debris.lifetime <= 0:
-                self.sucking_debris.remove(debris)
-
-        for debris in self.exploding_debris[:]:
-            debris.update()
-            if debris.lifetime <= 0:
-                self.exploding_debris.remove(debris)
-
-        for pirate in self.pirates[:]:
-            pirate.update()
-            if pirate.is_destroyed:
-                self.pirates.remove(pirate)
-        
-        for projectile in self.pirate_projectiles[:]:
-            projectile.update()
-            if projectile.lifetime <= 0:
-                self.pirate_projectiles.remove(projectile)
+        # Spent particle systems used to stay in the list (updated and drawn empty) until the level ended
+        update_and_compact(self.particle_effects, lambda effect: not effect.is_active)
+        update_and_compact(self.sucking_debris, lambda debris: debris.lifetime <= 0)
+        update_and_compact(self.exploding_debris, lambda debris: debris.lifetime <= 0)
+        update_and_compact(self.pirates, lambda pirate: pirate.is_destroyed)
+        update_and_compact(self.pirate_projectiles, lambda projectile: projectile.lifetime <= 0)
 
         # Update ship debris after it's created
         if self.player_ship.is_destroyed:
-            for piece in self.ship_debris[:]:
-                piece.update()
-                if piece.lifetime <= 0:
-                    self.ship_debris.remove(piece)
+            update_and_compact(self.ship_debris, lambda piece: piece.lifetime <= 0)
         
         # Check for destruction condition
         if self.player_ship.current_structure <= 0 and not self.player_ship.is_destroyed:
@@ -668,12 +982,61 @@ class Game:
             self.current_level_number += 1
             self.reset_level_specific_variables()
 
+    def clear_obstacle_orbits(self):
+        # Arrays from the last orbit pass, reused by the ship collision test on the next frame
+        self.orbiting_obstacles = []
+        self.orbiting_xs = np.empty(0)
+        self.orbiting_ys = np.empty(0)
+        self.orbiting_radii = np.empty(0)
+        self.orbiting_tracks = np.empty(0, dtype=np.intp)
+
+    def update_obstacle_orbits(self):
+        # Advance every orbiting asteroid in one NumPy pass and cache its screen position
+        orbiting = [o for o in self.obstacles if not isinstance(o, BallLightningMine) and not getattr(o, 'exploded', False)]
+        if not orbiting:
+            self.clear_obstacle_orbits()
+            return
+        if orbiting != self.orbiting_obstacles:
+            # Only gathered when an obstacle spawns, explodes or is removed; in between, the
+            # arrays are stepped in place and carry the orbit state from frame to frame
+            count = len(orbiting)
+            self.orbit_arrays = (
+                np.fromiter((o.radius for o in orbiting), dtype=np.float64, count=count),
+                np.fromiter((o.target_radius for o in orbiting), dtype=np.float64, count=count),
+                np.fromiter((o.entry_speed for o in orbiting), dtype=np.float64, count=count),
+                np.fromiter((o.entering_screen for o in orbiting), dtype=bool, count=count),
+                np.fromiter((o.angle for o in orbiting), dtype=np.float64, count=count),
+                np.fromiter((o.orbital_speed for o in orbiting), dtype=np.float64, count=count),
+            )
+            self.orbiting_obstacles = orbiting
+            self.orbiting_radii = np.fromiter((o.obstacle_radius for o in orbiting), dtype=np.float64, count=count)
+            self.orbiting_tracks = np.fromiter((o.track for o in orbiting), dtype=np.intp, count=count)
+        radius, target_radius, entry_speed, entering, angle, orbital_speed = self.orbit_arrays
+
+        tick_obstacle_orbits(radius, target_radius, entry_speed, entering, angle, orbital_speed)
+        xs = self.center_x + radius * np.cos(angle)
+        ys = self.center_y + radius * np.sin(angle)
+        # Whole-pixel draw positions, rounded for every obstacle at once
+        pixel_xs = np.rint(xs).astype(np.int32)
+        pixel_ys = np.rint(ys).astype(np.int32)
+
+        self.orbiting_xs = xs
+        self.orbiting_ys = ys
+
+        # Obstacles still read their own position when drawn, and the next gather reads these back
+        for obstacle, r, e, a, x, y, px, py in zip(orbiting, radius.tolist(), entering.tolist(), angle.tolist(),
+                                                   xs.tolist(), ys.tolist(), pixel_xs.tolist(), pixel_ys.tolist()):
+            obstacle.radius = r
+            obstacle.entering_screen = e
+            obstacle.angle = a
+            obstacle.x = x
+            obstacle.y = y
+            obstacle.pixel_x = px
+            obstacle.pixel_y = py
+
     def handle_dilation(self):
-        track_dilation_rate = [1, 0.20, 0.10][self.player_ship.track]
-        speed_effect = (self.player_ship.base_tangential_speed / self.player_ship.max_tangential_speed)
-        speed_influence = [30.0, 10.0, -50.5][self.player_ship.track]
-        dilation_modifier = 1.0 + (speed_effect * speed_influence)
-        self.dilation_score += track_dilation_rate * dilation_modifier
+        ship = self.player_ship
+        self.dilation_score += compute_dilation(ship.track, ship.base_tangential_speed, ship.max_tangential_speed)
 
     def handle_spawning(self):
         if not self.current_level_data: # Should not happen if level is loaded correctly
@@ -714,205 +1077,232 @@ class Game:
         self.level_timer += 1
 
     def handle_collisions(self):
-        # Ship with Speed Boosts
-        for boost in self.speed_boosts[:]:
-            boost_x = self.original_screen_width // 2 + boost.radius * math.cos(boost.angle)
-            boost_y = self.original_screen_height // 2 + boost.radius * math.sin(boost.angle)
+        pirates_present = bool(self.pirates or self.pirate_projectiles)
+        for collision_pass in self._collision_variants[(self.following_charge.active, pirates_present)]:
+            collision_pass()
+
+    def _collide_ship_boosts(self):
+        # Ship with Speed Boosts. Walked backwards so a collected boost can be swapped with
+        # the last one and popped, without copying the list first.
+        speed_boosts = self.speed_boosts
+        for i in range(len(speed_boosts) - 1, -1, -1):
+            boost = speed_boosts[i]
+            boost_x = boost.x
+            boost_y = boost.y
             if boost.track == self.player_ship.track and check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, boost.crystal_graphic.base_avg_radius, boost_x, boost_y):
                 if self.player_ship.collect_boost():
                     self.num_boosts_collected += 1
-                self.speed_boosts.remove(boost)
+                speed_boosts[i] = speed_boosts[-1]
+                speed_boosts.pop()
                 self.particle_effects.append(BoostParticleSystem((boost_x, boost_y)))
 
-        # Ship with Power Ups
-        for power_up in self.power_ups[:]:
-            power_up_x = self.original_screen_width // 2 + power_up.radius * math.cos(power_up.angle)
-            power_up_y = self.original_screen_height // 2 + power_up.radius * math.sin(power_up.angle)
+    def _collide_ship_power_ups(self):
+        # Ship with Power Ups, swap-removed the same way as boosts
+        power_ups = self.power_ups
+        for i in range(len(power_ups) - 1, -1, -1):
+            power_up = power_ups[i]
+            power_up_x = power_up.x
+            power_up_y = power_up.y
             if power_up.track == self.player_ship.track and check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, power_up.powerup_radius, power_up_x, power_up_y):
                 self.player_ship.collect_energy(30)
-                self.power_ups.remove(power_up)
+                power_ups[i] = power_ups[-1]
+                power_ups.pop()
                 self.particle_effects.append(PowerUpParticleSystem((power_up_x, power_up_y)))
 
-        # Ship with Obstacles
-        for obstacle in self.obstacles[:]:
+    def _collide_ship_obstacles(self):
+        # Ship with Obstacles. Mines are left out: their explosion logic is self-contained in
+        # their own update() and the main loop removes them once their state is "done".
+        # Asteroids are tested in one batch against the arrays from the last orbit pass, which
+        # hold the same positions as obstacle.x/y; asteroids spawned since are still entering.
+        # Asteroids removed since that pass (by a mine blast or a pirate) are skipped.
+        hits = find_circle_hits(self.player_ship.x, self.player_ship.y, self.player_ship.radius,
+                                self.orbiting_xs, self.orbiting_ys, self.orbiting_radii, self.orbiting_tracks, self.player_ship.track)
+        for index in hits.tolist():
+            obstacle = self.orbiting_obstacles[index]
+            if getattr(obstacle, 'exploded', False) or obstacle not in self.obstacles:
+                continue
+            obstacle_x = obstacle.x
+            obstacle_y = obstacle.y
+            # Get color from the asteroid that was hit and create particles at its location
+            obstacle_color = ASTEROID_COLORS.get(obstacle.asteroid.color_key, self.red)
+            effect_position = (obstacle_x, obstacle_y)
+
+            if self.player_ship.shield_active:
+                self.player_ship.deactivate_shield()
+                self.obstacles.remove(obstacle)
+                self.particle_effects.append(SuckingParticleSystem(effect_position, obstacle_color, self))
+            else:
+                damage = 10 if isinstance(obstacle, ExplodingObstacle) else 5
+                self.player_ship.take_damage(damage)
+                self.asteroid_hit_counter += 1
+                if self.asteroid_hit_counter == 3 and self.slow_down_sound:
+                    self.slow_down_sound.play()
+
+                if isinstance(obstacle, ExplodingObstacle):
+                    obstacle.exploded = True
+                    random.choice(self.mini_explosion_sounds).play()
+                    # Create exploding debris that flies outwards
+                    asteroid_image_to_shatter = obstacle.asteroid.get_current_image()
+                    animated_color = obstacle.color # Use the obstacle's current glow color
+                    self.exploding_debris.extend(create_exploding_debris(asteroid_image_to_shatter, obstacle_x, obstacle_y, animated_color))
+                else:
+                    self.obstacles.remove(obstacle)
+                    if self.rock_break_sounds:
+                        random.choice(self.rock_break_sounds).play()
+                    # Create regular debris that gets sucked in
+                    asteroid_image_to_shatter = obstacle.asteroid.get_current_image()
+                    base_color = ASTEROID_COLORS.get(obstacle.asteroid.color_key, self.red)
+                    brightness_factor = ANIMATION_SEQUENCE_INDICES[obstacle.asteroid.current_animation_frame_index] / 7.0
+                    animated_color = tuple(min(255, int(c * (0.5 + brightness_factor * 0.5))) for c in base_color)
+                    self.sucking_debris.extend(create_asteroid_debris(asteroid_image_to_shatter, obstacle_x, obstacle_y, self, animated_color))
+
+    def _build_obstacle_grid(self):
+        # Bucket asteroids by screen cell and mines by track once per frame so the
+        # pirate and projectile passes only test nearby obstacles
+        self.obstacle_grid = {}
+        self.mines_by_track = {}
+        for obstacle in self.obstacles:
             if isinstance(obstacle, BallLightningMine):
-                # The mine's explosion logic is self-contained in its own update() method.
-                # The main loop will remove it once its state is "done".
-                pass
+                self.mines_by_track.setdefault(obstacle.track, []).append(obstacle)
             else:
-                obstacle_x = self.original_screen_width // 2 + obstacle.radius * math.cos(obstacle.angle)
-                obstacle_y = self.original_screen_height // 2 + obstacle.radius * math.sin(obstacle.angle)
-                if obstacle.track == self.player_ship.track and not getattr(obstacle, 'exploded', False) and check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, obstacle.obstacle_radius, obstacle_x, obstacle_y):
-                    # Get color from the asteroid that was hit and create particles at its location
-                    obstacle_color = ASTEROID_COLORS.get(obstacle.asteroid.color_key, self.red)
-                    effect_position = (obstacle_x, obstacle_y)
-
-                    if self.player_ship.shield_active:
-                        self.player_ship.deactivate_shield()
-                        self.obstacles.remove(obstacle)
-                        self.particle_effects.append(SuckingParticleSystem(effect_position, obstacle_color, self))
-                    else:
-                        damage = 10 if isinstance(obstacle, ExplodingObstacle) else 5
-                        self.player_ship.take_damage(damage)
-                        self.asteroid_hit_counter += 1
-                        if self.asteroid_hit_counter == 3 and self.slow_down_sound:
-                            self.slow_down_sound.play()
-
-                        if isinstance(obstacle, ExplodingObstacle):
-                            obstacle.exploded = True
-                            random.choice(self.mini_explosion_sounds).play()
-                            # Create exploding debris that flies outwards
-                            asteroid_image_to_shatter = obstacle.asteroid.get_current_image()
-                            animated_color = obstacle.color # Use the obstacle's current glow color
-                            self.exploding_debris.extend(create_exploding_debris(asteroid_image_to_shatter, obstacle_x, obstacle_y, animated_color))
-                        else:
-                            self.obstacles.remove(obstacle)
-                            if self.rock_break_sounds:
-                                random.choice(self.rock_break_sounds).play()
-                            # Create regular debris that gets sucked in
-                            asteroid_image_to_shatter = obstacle.asteroid.get_current_image()
-                            base_color = ASTEROID_COLORS.get(obstacle.asteroid.color_key, self.red)
-                            brightness_factor = ANIMATION_SEQUENCE_INDICES[obstacle.asteroid.current_animation_frame_index] / 7.0
-                            animated_color = tuple(min(255, int(c * (0.5 + brightness_factor * 0.5))) for c in base_color)
-                            self.sucking_debris.extend(create_asteroid_debris(asteroid_image_to_shatter, obstacle_x, obstacle_y, self, animated_color))
+                cell = (int(obstacle.x // COLLISION_CELL_SIZE), int(obstacle.y // COLLISION_CELL_SIZE))
+                self.obstacle_grid.setdefault(cell, []).append((obstacle, obstacle.x, obstacle.y))
+
+    def _nearby_obstacles(self, x, y):
+        cell_x = int(x // COLLISION_CELL_SIZE)
+        cell_y = int(y // COLLISION_CELL_SIZE)
+        grid = self.obstacle_grid
+        if not grid:
+            return
+        for dx, dy in COLLISION_NEIGHBOR_OFFSETS:
+            bucket = grid.get((cell_x + dx, cell_y + dy))
+            if bucket:
+                yield bucket
+
+    def _remove_gridded_obstacle(self, bucket, entry):
+        bucket.remove(entry)
+        if entry[0] in self.obstacles:
+            self.obstacles.remove(entry[0])
 
+    def _collide_pirates_obstacles(self):
         # Pirates with Obstacles
         for pirate in self.pirates[:]:
-            for obstacle in self.obstacles[:]:
-                if isinstance(obstacle, BallLightningMine):
-                    if obstacle.state == 'exploding' and pirate.track == obstacle.track:
-                        pirate.take_damage(1000) # Instant destruction
-                else:
-                    # Pirate takes damage from regular/exploding asteroids
-                    obstacle_x = self.original_screen_width // 2 + obstacle.radius * math.cos(obstacle.angle)
-                    obstacle_y = self.original_screen_height // 2 + obstacle.radius * math.sin(obstacle.angle)
+            for mine in self.mines_by_track.get(pirate.track, ()):
+                if mine.state == 'exploding':
+                    pirate.take_damage(1000) # Instant destruction
+            # Pirate takes damage from regular/exploding asteroids
+            for bucket in self._nearby_obstacles(pirate.x, pirate.y):
+                for entry in bucket[:]:
+                    obstacle, obstacle_x, obstacle_y = entry
                     if check_collision(pirate.pirate_radius, pirate.x, pirate.y, obstacle.obstacle_radius, obstacle_x, obstacle_y):
                         pirate.take_damage(10) # Pirate takes 10 damage from asteroid
-                        self.obstacles.remove(obstacle) # Asteroid is destroyed
+                        self._remove_gridded_obstacle(bucket, entry) # Asteroid is destroyed
                         if self.rock_break_sounds:
                             random.choice(self.rock_break_sounds).play()
 
-        # Ship with Following Charge
-        if self.following_charge.active:
-            if check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, self.following_charge.radius, self.following_charge.position[0], self.following_charge.position[1]):
-                if self.player_ship.shield_active:
-                    self.following_charge.deactivate()
-                    self.charge_spawn_timer = 0
-                    self.player_ship.deactivate_shield()
-                else:
-                    self.state_manager.set_state("ELECTROCUTED")
-
-        # Ship with Pirate Projectiles
-        for projectile in self.pirate_projectiles[:]:
-            if check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, projectile.radius, projectile.x, projectile.y):
-                if self.player_ship.shield_active:
-                    self.player_ship.deactivate_shield()
+    def _collide_ship_following_charge(self):
+        # Ship with Following Charge (only dispatched while the charge is active)
+        ship = self.player_ship
+        charge = self.following_charge
+        charge_x, charge_y = charge.position
+        dx = ship.x - charge_x
+        dy = ship.y - charge_y
+        hit_distance = ship.radius + charge.radius
+        if dx * dx + dy * dy < hit_distance * hit_distance:
+            if ship.shield_active:
+                charge.deactivate()
+                self.charge_spawn_timer = 0
+                ship.deactivate_shield()
+            else:
+                self.state_manager.set_state("ELECTROCUTED")
+
+    def _collide_ship_projectiles(self):
+        # Ship with Pirate Projectiles. Survivors are compacted in place in the same pass,
+        # instead of copying the list and remove()-ing each hit.
+        ship = self.player_ship
+        ship_x, ship_y = ship.x, ship.y
+        projectiles = self.pirate_projectiles
+        live = 0
+        for projectile in projectiles:
+            dx = projectile.x - ship_x
+            dy = projectile.y - ship_y
+            hit_distance = ship.radius + projectile.radius
+            if dx * dx + dy * dy < hit_distance * hit_distance:
+                if ship.shield_active:
+                    ship.deactivate_shield()
                 else:
-                    self.player_ship.take_damage(projectile.damage)
-                self.pirate_projectiles.remove(projectile)
+                    ship.take_damage(projectile.damage)
                 self.particle_effects.append(ExplosionParticleSystem((projectile.x, projectile.y), projectile.color))
+            else:
+                projectiles[live] = projectile
+                live += 1
+        del projectiles[live:]
 
+    def _collide_projectiles_obstacles(self):
         # Pirate Projectiles with Obstacles
         for projectile in self.pirate_projectiles[:]:
-            for obstacle in self.obstacles[:]:
-                if not isinstance(obstacle, BallLightningMine):
-                    obstacle_x = self.original_screen_width // 2 + obstacle.radius * math.cos(obstacle.angle)
-                    obstacle_y = self.original_screen_height // 2 + obstacle.radius * math.sin(obstacle.angle)
+            hit = False
+            for bucket in self._nearby_obstacles(projectile.x, projectile.y):
+                for entry in bucket:
+                    obstacle, obstacle_x, obstacle_y = entry
                     if check_collision(projectile.radius, projectile.x, projectile.y, obstacle.obstacle_radius, obstacle_x, obstacle_y):
                         if projectile in self.pirate_projectiles:
                             self.pirate_projectiles.remove(projectile)
-                        if obstacle in self.obstacles:
-                            self.obstacles.remove(obstacle)
+                        self._remove_gridded_obstacle(bucket, entry)
                         self.particle_effects.append(ExplosionParticleSystem((obstacle_x, obstacle_y), (255, 255, 255))) # White explosion
                         if self.rock_break_sounds:
                             random.choice(self.rock_break_sounds).play()
-                        break # Move to the next projectile once this one is destroyed
+                        hit = True
+                        break
+                if hit:
+                    break # Move to the next projectile once this one is destroyed
 
     def run_menu_draw(self, game_surface):
-        game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation
-            star.draw(game_surface)
+        self.draw_menu_background(game_surface)
         self.asteroid_rotation_angle += 0.05  # Slow rotation speed
-        rotated_asteroid = pygame.transform.rotate(self.asteroid_splash_image, self.asteroid_rotation_angle)
-        asteroid_rect = rotated_asteroid.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
-        game_surface.blit(rotated_asteroid, asteroid_rect)
+        rotation_step = int(self.asteroid_rotation_angle / MENU_ASTEROID_ROTATION_STEP)
+        if rotation_step != self.rotated_asteroid_splash_step:
+            self.rotated_asteroid_splash = pygame.transform.rotate(self.asteroid_splash_image, rotation_step * MENU_ASTEROID_ROTATION_STEP)
+            self.rotated_asteroid_splash_rect = self.rotated_asteroid_splash.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
+            self.rotated_asteroid_splash_step = rotation_step
+        game_surface.blit(self.rotated_asteroid_splash, self.rotated_asteroid_splash_rect)
 
         # Draw semi-transparent black box for menu content
-        box_width = int(self.original_screen_width * 0.8)
-        box_height = int(self.original_screen_height * 0.8) + 60
-        box_x = (self.original_screen_width - box_width) // 2
-        box_y = self.original_screen_height // 10 # Adjust as needed
-        
-        alpha_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        alpha_surface.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
-        game_surface.blit(alpha_surface, (box_x, box_y))
+        game_surface.blit(self.menu_box, self.menu_box_pos)
 
         menu_item_y = self.original_screen_height // 9
         item_spacing = 60
         icon_size = 40
         text_offset_x = icon_size + 20
         menu_y_offset = 20
-        shadow_color = (0, 0, 0)  # Black shadow
         icon_center_x = self.original_screen_width // 4
 
-        # Speed Boost
-        row_center_y = menu_item_y + menu_y_offset
-        self.menu_speed_boost_crystal.update()
-        boost_icon = self.menu_speed_boost_crystal.get_current_image()
-        boost_icon_rect = boost_icon.get_rect(center=(icon_center_x, row_center_y))
-        boost_text = self.how_to_play_font.render("Speed Boost: Increases ship speed.", True, self.white)
-        boost_text_rect = boost_text.get_rect(midleft=(icon_center_x + text_offset_x, row_center_y))
-        shadow_boost_text = self.how_to_play_font.render("Speed Boost: Increases ship speed.", True, shadow_color)
-        shadow_boost_text_rect = shadow_boost_text.get_rect(midleft=(boost_text_rect.left + 2, boost_text_rect.centery + 2))
-        game_surface.blit(boost_icon, boost_icon_rect)
-        game_surface.blit(shadow_boost_text, shadow_boost_text_rect)
-        game_surface.blit(boost_text, boost_text_rect)
-        menu_item_y += item_spacing
-
-        # Power-Up (Energy)
-        row_center_y = menu_item_y + menu_y_offset
-        self.menu_energy_crystal.update()
-        power_up_icon = self.menu_energy_crystal.get_current_image()
-        power_up_icon_rect = power_up_icon.get_rect(center=(icon_center_x, row_center_y))
-        power_up_text = self.how_to_play_font.render("Energy: Replenishes energy for shields.", True, self.white)
-        power_up_text_rect = power_up_text.get_rect(midleft=(icon_center_x + text_offset_x, row_center_y))
-        shadow_power_up_text = self.how_to_play_font.render("Energy: Replenishes energy for shields.", True, shadow_color)
-        shadow_power_up_text_rect = shadow_power_up_text.get_rect(midleft=(power_up_text_rect.left + 2, power_up_text_rect.centery + 2))
-        game_surface.blit(power_up_icon, power_up_icon_rect)
-        game_surface.blit(shadow_power_up_text, shadow_power_up_text_rect)
-        game_surface.blit(power_up_text, power_up_text_rect)
-        menu_item_y += item_spacing
-
-        # Obstacle
-        row_center_y = menu_item_y + menu_y_offset
-        self.menu_asteroid.update()
-        asteroid_icon = self.menu_asteroid.get_current_image()
-        asteroid_icon_rect = asteroid_icon.get_rect(center=(icon_center_x, row_center_y))
-        obstacle_text = self.how_to_play_font.render("Asteroid: Avoid! Reduces hull integrity.", True, self.white)
-        obstacle_text_rect = obstacle_text.get_rect(midleft=(icon_center_x + text_offset_x, row_center_y))
-        shadow_obstacle_text = self.how_to_play_font.render("Asteroid: Avoid! Reduces hull integrity.", True, shadow_color)
-        shadow_obstacle_text_rect = shadow_obstacle_text.get_rect(midleft=(obstacle_text_rect.left + 2, obstacle_text_rect.centery + 2))
-        game_surface.blit(asteroid_icon, asteroid_icon_rect)
-        game_surface.blit(shadow_obstacle_text, shadow_obstacle_text_rect)
-        game_surface.blit(obstacle_text, obstacle_text_rect)
-        menu_item_y += item_spacing
-
-        # Following Charge
-        row_center_y = menu_item_y + menu_y_offset
-        self.menu_ball_lightning.update()
-        charge_icon = self.menu_ball_lightning.get_current_image()
-        charge_icon_rect = charge_icon.get_rect(center=(icon_center_x, row_center_y))
-        charge_text = self.how_to_play_font.render("Electrical Charge: Chases ship and destroys it.", True, self.white)
-        charge_text_rect = charge_text.get_rect(midleft=(icon_center_x + text_offset_x, row_center_y))
-        shadow_charge_text = self.how_to_play_font.render("Electrical Charge: Chases ship and destroys it.", True, shadow_color)
-        shadow_charge_text_rect = shadow_charge_text.get_rect(midleft=(charge_text_rect.left + 2, charge_text_rect.centery + 2))
-        game_surface.blit(charge_icon, charge_icon_rect)
-        game_surface.blit(shadow_charge_text, shadow_charge_text_rect)
-        game_surface.blit(charge_text, charge_text_rect)
-        menu_item_y += item_spacing
-
-        instructions_rect = pygame.Rect(self.original_screen_width // 4, menu_item_y + 40, self.original_screen_width // 2, 100)
+        # Speed Boost, Energy, Asteroid and Following Charge icons animate, so they are drawn every frame
+        menu_icons = (self.menu_speed_boost_crystal, self.menu_energy_crystal, self.menu_asteroid, self.menu_ball_lightning)
+        for row, menu_icon in enumerate(menu_icons):
+            menu_icon.update()
+            icon = menu_icon.get_current_image()
+            icon_rect = icon.get_rect(center=(icon_center_x, menu_item_y + row * item_spacing + menu_y_offset))
+            game_surface.blit(icon, icon_rect)
+
+        # The text beside and below the icons never changes; it is laid out once and blitted in one call
+        if self.menu_text_blits is None:
+            self.menu_text_blits = self.build_menu_text_blits(icon_center_x + text_offset_x, menu_item_y, menu_y_offset, item_spacing)
+        game_surface.blits(self.menu_text_blits, doreturn=False)
+
+    def build_menu_text_blits(self, text_x, menu_item_y, menu_y_offset, item_spacing):
+        labels = (
+            "Speed Boost: Increases ship speed.",
+            "Energy: Replenishes energy for shields.",
+            "Asteroid: Avoid! Reduces hull integrity.",
+            "Electrical Charge: Chases ship and destroys it.",
+        )
+        blits = []
+        for row, label in enumerate(labels):
+            text_surface, text_rect = self.place_text_with_shadow(label, self.how_to_play_font, self.white, shadow_offset=2, midleft=(text_x, menu_item_y + row * item_spacing + menu_y_offset))
+            blits.append((text_surface, text_rect.topleft))
+
+        instructions_rect = pygame.Rect(self.original_screen_width // 4, menu_item_y + len(labels) * item_spacing + 40, self.original_screen_width // 2, 100)
         instructions_text = (
         "You are trapped in a black hole!\n"
         "- Steer your ship through the orbital tracks using the LEFT and RIGHT arrow keys.\n"
@@ -922,7 +1312,8 @@ class Game:
         "- Stay on the outer ring as much as possible to avoid time dilation!\n"
         "- Survive!"
         )
-        self.draw_paragraph(game_surface, instructions_text, self.how_to_play_font, self.white, instructions_rect, shadow_color=shadow_color)
+        blits.extend(self.layout_paragraph(instructions_text, self.how_to_play_font, self.white, instructions_rect, shadow_color=(0, 0, 0)))
+        return blits
 
     def run_splash_screen_draw(self, game_surface):
 
@@ -960,23 +1351,31 @@ class Game:
 
     def run_game_draw(self, game_surface):
 
+        # The star field sits between the background and the tracks, so the scene can't be cached
+        # as one surface; the background is opaque and display-format, so its blit is a plain copy
         game_surface.blit(self.background_image, (0, 0))
         # game_surface.blit(self.second_background_image, (self.second_bg_x, self.second_bg_y)) # Temporarily disabled
-        for star in self.stars:
-            star.draw(game_surface)
-        self.draw_tracks(game_surface)
-        self.draw_black_hole(game_surface)
-        if not self.player_ship.is_destroyed:
-            self.player_ship.draw(game_surface)
+        self.star_field.draw(game_surface)
+        self.draw_tracks_and_black_hole(game_surface)
+        ship = self.player_ship
+        if not ship.is_destroyed:
+            ship.draw(game_surface)
         else:
             for piece in self.ship_debris:
                 piece.draw(game_surface)
-        for boost in self.speed_boosts:
-            boost.draw(game_surface)
-        for power_up in self.power_ups:
-            power_up.draw(game_surface)
+        # Boosts, power-ups and asteroids are one image each, so they are drawn in a single batch.
+        # Mines are made of several primitives and keep their own draw.
+        entity_blits = [boost.get_blit() for boost in self.speed_boosts]
+        entity_blits += [power_up.get_blit() for power_up in self.power_ups]
+        mines = []
         for obstacle in self.obstacles:
-            obstacle.draw(game_surface)
+            if isinstance(obstacle, BallLightningMine):
+                mines.append(obstacle)
+            else:
+                entity_blits.append(obstacle.get_blit())
+        game_surface.blits(entity_blits, doreturn=False)
+        for mine in mines:
+            mine.draw(game_surface)
         self.following_charge.draw(game_surface)
         for effect in self.particle_effects:
             effect.draw(game_surface)
@@ -1017,33 +1416,39 @@ class Game:
         game_surface.blit(text_surface, text_rect)
 
     def draw_game_ui(self, game_surface):
-        total_milliseconds = self.survival_timer * 1000 // self.fps
-        minutes = total_milliseconds // 60000
-        seconds = (total_milliseconds % 60000) // 1000
-        milliseconds = (total_milliseconds % 1000) // 10
-        timer_text_surface = self.timer_font.render(f"Time: {minutes:02}:{seconds:02}:{milliseconds:02}", True, self.light_green)
-        game_surface.blit(timer_text_surface, (40, 40))
-        dilation_text_surface = self.dilation_font.render(f"Dilation: {int(self.dilation_score)}", True, self.light_green)
-        game_surface.blit(dilation_text_surface, (40, 70))
-        energy_text_surface = self.timer_font.render(f"Energy: {int(self.player_ship.current_energy)}", True, self.light_green)
-        game_surface.blit(energy_text_surface, (40, 100))
-        structure_text_surface = self.timer_font.render(f"Hull Integrity: {int(self.player_ship.current_structure)}", True, self.light_green)
-        game_surface.blit(structure_text_surface, (40, 130))
-
-        level_text_surface = self.level_font.render(f"Level: {self.current_level_number}", True, self.light_green)
-        game_surface.blit(level_text_surface, (40, 160))
+        total_seconds, hundredths = divmod(max(0, int(self.survival_timer * 100 // self.fps)), 100)
+        # The "Time: MM:SS:" label only changes once a second, so it is only formatted then
+        if total_seconds != self.timer_label_seconds:
+            minutes, seconds = divmod(total_seconds, 60)
+            self.timer_label = f"Time: {minutes:02}:{seconds:02}:"
+            self.timer_label_seconds = total_seconds
+        # Bound once; every HUD line goes through the same cache, font and color
+        render = self.render_cached_text
+        timer_font = self.timer_font
+        color = self.light_green
+        ship = self.player_ship
+
+        # The hundredths change every frame, so they are drawn as their own cached piece
+        # after the minutes and seconds, which only change once a second
+        timer_text_surface = render(self.timer_label, timer_font, color)
+        hud_blits = [
+            (timer_text_surface, (40, 40)),
+            (render(TWO_DIGIT_LABELS[hundredths], timer_font, color), (40 + timer_text_surface.get_width(), 40)),
+            (render(f"Dilation: {int(self.dilation_score)}", self.dilation_font, color), (40, 70)),
+            (render(f"Energy: {int(ship.current_energy)}", timer_font, color), (40, 100)),
+            (render(f"Hull Integrity: {int(ship.current_structure)}", timer_font, color), (40, 130)),
+            (render(f"Level: {self.current_level_number}", self.level_font, color), (40, 160)),
+        ]
 
         # Level Title
-        if self.current_level_data and 'level_name' in self.current_level_data:
-            level_title_text = self.escaped_font.render(self.current_level_data['level_name'], True, self.light_green)
-            level_title_rect = level_title_text.get_rect(topright=(self.original_screen_width - 40, 40))
-            game_surface.blit(level_title_text, level_title_rect)
+        level_data = self.current_level_data
+        if level_data and 'level_name' in level_data:
+            level_title_text = render(level_data['level_name'], self.escaped_font, color)
+            hud_blits.append((level_title_text, level_title_text.get_rect(topright=(self.original_screen_width - 40, 40))))
+        game_surface.blits(hud_blits, doreturn=False)
 
     def run_game_over_draw(self, game_surface):
-        game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation for the background
-            star.draw(game_surface)
+        self.draw_menu_background(game_surface)
 
         # --- Jitter Effect Logic ---
         self.jitter_timer -= 1
@@ -1052,63 +1457,50 @@ class Game:
             self.jitter_sequence = []
             num_flashes = random.randint(6, 12)
             for _ in range(num_flashes):
-                scale = random.uniform(0.95, 1.05)
-                angle = random.uniform(-5, 5)
-                self.jitter_sequence.append((scale, angle))
+                self.jitter_sequence.append(random.randrange(GAME_OVER_JITTER_VARIANTS))
             self.jitter_flash_timer = self.jitter_flash_duration
 
         # --- Drawing Logic ---
-        img_to_draw = self.game_over_background_image
+        img_to_draw, img_pos = self.game_over_background_image, self.game_over_background_pos
         if self.jitter_active:
             self.jitter_flash_timer -= 1
-            if self.current_jitter_surface is None:
+            if self.current_jitter is None:
                 # Get the next jitter effect from the sequence
                 if self.jitter_sequence:
-                    scale, angle = self.jitter_sequence.pop(0)
-                    # Use rotozoom for combined rotation and scaling
-                    self.current_jitter_surface = pygame.transform.rotozoom(self.game_over_background_image, angle, scale)
+                    variant = self.jitter_sequence.pop(0)
+                    if self.jitter_variants[variant] is None:
+                        scale = random.uniform(0.95, 1.05)
+                        angle = random.uniform(-5, 5)
+                        # Use rotozoom for combined rotation and scaling
+                        jitter_surface = pygame.transform.rotozoom(self.game_over_background_image, angle, scale)
+                        jitter_pos = jitter_surface.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2)).topleft
+                        self.jitter_variants[variant] = (jitter_surface, jitter_pos)
+                    self.current_jitter = self.jitter_variants[variant]
                 else:
                     # Sequence is over
                     self.jitter_active = False
                     self.jitter_timer = random.randint(1, 2) * self.fps
-                    self.current_jitter_surface = None
+                    self.current_jitter = None
 
-            if self.current_jitter_surface:
-                img_to_draw = self.current_jitter_surface
+            if self.current_jitter:
+                img_to_draw, img_pos = self.current_jitter
 
             if self.jitter_flash_timer <= 0:
                 # Reset for the next flash in the sequence
-                self.current_jitter_surface = None
+                self.current_jitter = None
                 self.jitter_flash_timer = self.jitter_flash_duration
 
-        # Center and draw the appropriate image
-        img_rect = img_to_draw.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
-        game_surface.blit(img_to_draw, img_rect.topleft)
+        # Draw the appropriate image, already centered
+        game_surface.blit(img_to_draw, img_pos)
 
 
         # --- Text with Shadows ---
-        shadow_color = (0, 0, 0)
-
-        # Destroyed Text
-        shadow_destroyed_text = self.game_over_font_large.render("YOU WERE DESTROYED", True, shadow_color)
-        game_surface.blit(shadow_destroyed_text, (self.destroyed_rect.x + 3, self.destroyed_rect.y + 3))
-        game_surface.blit(self.destroyed_text, self.destroyed_rect)
-
-        # Restart Text
-        shadow_restart_text = self.game_over_font_small.render("Press 'ENTER' to try again", True, shadow_color)
-        game_surface.blit(shadow_restart_text, (self.restart_rect.x + 3, self.restart_rect.y + 3))
-        game_surface.blit(self.restart_text, self.restart_rect)
-
-        # Quit Text
-        shadow_quit_text = self.game_over_font_small.render("Press 'Q' to quit", True, shadow_color)
-        game_surface.blit(shadow_quit_text, (self.quit_rect.x + 3, self.quit_rect.y + 3))
-        game_surface.blit(self.quit_text, self.quit_rect)
+        game_surface.blits(self.game_over_text_blits, doreturn=False)
 
     """def run_game_over_draw(self, game_surface):
         game_surface.fill(self.black)
-        for star in self.stars:
-            star.update(0.01) # Slow constant rotation for the background
-            star.draw(game_surface)
+        self.star_field.update(MENU_STAR_ROTATION_SPEED * self.frame_time_scale) # Slow constant rotation for the background
+        self.star_field.draw(game_surface)
 
         # Center and draw the main image
         img_rect = self.game_over_background_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
@@ -1133,89 +1525,13 @@ class Game:
         game_surface.blit(self.quit_text, self.quit_rect)"""
 
     def run_escaped_draw(self, game_surface):
-        self.final_score = self.calculate_final_score()
-
-        # Determine the high score threshold dynamically
-        current_high_scores = load_high_scores()
-        if len(current_high_scores) < 10:  # If fewer than 10 scores, any score is a high score
-            dynamic_threshold = 0
-        else:
-            # Get the 10th score (lowest in top 10) and set threshold to 1 above it
-            dynamic_threshold = current_high_scores[9]['score'] + 1
-
-        print(f"Final Score: {self.final_score}, Dynamic Threshold: {dynamic_threshold}")
-
-        # Check if score qualifies for high score entry
-        if self.final_score >= dynamic_threshold:
-            self.state_manager.set_state("ESCAPED_INPUT_NAME")
-            return # Exit to let the new state handle drawing
-
-        # If not qualifying, just display score and options
-        self.save_score_if_needed() # Save score even if not high score, but without name
-        game_surface.blit(self.escaped_splash_image, (0, 0))
-        # Text with Shadows
-        shadow_color = (0, 0, 0) # Black shadow
-
-        # Escaped Message Text
-        shadow_escaped_message_text = self.escaped_font_large.render("YOU ESCAPED THE BLACK HOLE!", True, shadow_color)
-        game_surface.blit(shadow_escaped_message_text, (self.escaped_rect.x + 3, self.escaped_rect.y + 3))
-        game_surface.blit(self.escaped_message_text, self.escaped_rect)
-
-        # Final Score Label
-        final_score_label_text = self.escaped_font.render("Final Score:", True, self.light_green)
-        final_score_label_rect = final_score_label_text.get_rect(center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2))
-        shadow_final_score_label_text = self.escaped_font.render("Final Score:", True, shadow_color)
-        game_surface.blit(shadow_final_score_label_text, (final_score_label_rect.x + 3, final_score_label_rect.y + 3))
-        game_surface.blit(final_score_label_text, final_score_label_rect)
-
-        # Final Score Value
-        final_score_value_text = self.escaped_font.render(f"{int(self.final_score):,}", True, self.light_green)
-        final_score_value_rect = final_score_value_text.get_rect(midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2))
-        shadow_final_score_value_text = self.escaped_font.render(f"{int(self.final_score):,}", True, shadow_color)
-        game_surface.blit(shadow_final_score_value_text, (final_score_value_rect.x + 3, final_score_value_rect.y + 3))
-        game_surface.blit(final_score_value_text, final_score_value_rect)
-
-        # Restart Text
-        shadow_restart_text_escaped = self.escaped_font_small.render("Press 'ENTER' to try again", True, shadow_color)
-        game_surface.blit(shadow_restart_text_escaped, (self.restart_rect_escaped.x + 3, self.restart_rect_escaped.y + 3))
-        game_surface.blit(self.restart_text_escaped, self.restart_rect_escaped)
-
-        # Quit Text
-        shadow_quit_text_escaped = self.escaped_font_small.render("Press 'Q' to quit", True, shadow_color)
-        game_surface.blit(shadow_quit_text_escaped, (self.quit_rect_escaped.x + 3, self.quit_rect_escaped.y + 3))
-        game_surface.blit(self.quit_text_escaped, self.quit_rect_escaped)
+        # Only reached when the score didn't qualify for name entry (see on_enter_escaped_state),
+        # which also laid out the background and text
+        game_surface.blits(self.escaped_static_blits, doreturn=False)
 
     def run_escaped_input_name_draw(self, game_surface):
-        game_surface.blit(self.escaped_splash_image, (0, 0))
-        # Text with Shadows
-        shadow_color = (0, 0, 0) # Black shadow
-
-        # Escaped Message Text
-        shadow_escaped_message_text = self.escaped_font_large.render("YOU ESCAPED THE BLACK HOLE!", True, shadow_color)
-        game_surface.blit(shadow_escaped_message_text, (self.escaped_rect.x + 3, self.escaped_rect.y + 3))
-        game_surface.blit(self.escaped_message_text, self.escaped_rect)
-
-
-        # Final Score Label
-        final_score_label_text = self.escaped_font.render("Final Score:", True, self.light_green)
-        final_score_label_rect = final_score_label_text.get_rect(center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2 - 50))
-        shadow_final_score_label_text = self.escaped_font.render("Final Score:", True, shadow_color)
-        game_surface.blit(shadow_final_score_label_text, (final_score_label_rect.x + 3, final_score_label_rect.y + 3))
-        game_surface.blit(final_score_label_text, final_score_label_rect)
-
-        # Final Score Value
-        final_score_value_text = self.escaped_font.render(f"{int(self.final_score):,}", True, self.light_green)
-        final_score_value_rect = final_score_value_text.get_rect(midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2 - 50))
-        shadow_final_score_value_text = self.escaped_font.render(f"{int(self.final_score):,}", True, shadow_color)
-        game_surface.blit(shadow_final_score_value_text, (final_score_value_rect.x + 3, final_score_value_rect.y + 3))
-        game_surface.blit(final_score_value_text, final_score_value_rect)
-
-        # Prompt Text
-        prompt_text = self.escaped_font_small.render("Enter your name (up to 8 letters):", True, self.white)
-        prompt_rect = prompt_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 50))
-        shadow_prompt_text = self.escaped_font_small.render("Enter your name (up to 8 letters):", True, shadow_color)
-        game_surface.blit(shadow_prompt_text, (prompt_rect.x + 3, prompt_rect.y + 3))
-        game_surface.blit(prompt_text, prompt_rect)
+        # Background and fixed text were laid out once in on_enter_escaped_input_name_state
+        game_surface.blits(self.input_name_static_blits, doreturn=False)
 
         # Blinking cursor
         self.name_input_cursor_timer += 1
@@ -1226,70 +1542,33 @@ class Game:
         if self.name_input_active and self.name_input_cursor_visible:
             display_name += "_"
 
-        # Name Text
-        name_text = self.escaped_font.render(display_name, True, self.light_green)
-        name_rect = name_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 100))
-        shadow_name_text = self.escaped_font.render(display_name, True, shadow_color)
-        game_surface.blit(shadow_name_text, (name_rect.x + 3, name_rect.y + 3))
-        game_surface.blit(name_text, name_rect)
-
-        # Instructions Text
-        instructions_text = self.escaped_font_small.render("Press ENTER to save, ESC to skip", True, self.white)
-        instructions_rect = instructions_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 150))
-        shadow_instructions_text = self.escaped_font_small.render("Press ENTER to save, ESC to skip", True, shadow_color)
-        game_surface.blit(shadow_instructions_text, (instructions_rect.x + 3, instructions_rect.y + 3))
-        game_surface.blit(instructions_text, instructions_rect)
+        self.blit_text_with_shadow(game_surface, display_name, self.escaped_font, self.light_green, center=(self.original_screen_width // 2, self.original_screen_height // 2 + 100))
 
     def run_pause_menu_draw(self, game_surface):
         # Draw the game in the background
         self.run_game_draw(game_surface)
 
         # Draw a semi-transparent overlay
-        overlay = pygame.Surface((self.original_screen_width, self.original_screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        game_surface.blit(overlay, (0, 0))
+        self.draw_dim_overlay(game_surface)
 
         # Draw the pause menu text
-        game_surface.blit(self.paused_text, self.paused_rect)
-        game_surface.blit(self.continue_text, self.continue_rect)
-        game_surface.blit(self.main_menu_text, self.main_menu_rect)
-        game_surface.blit(self.quit_pause_text, self.quit_pause_rect)
+        game_surface.blits(self.pause_menu_blits, doreturn=False)
 
-    def run_pause_menu_draw(self, game_surface):
-        # Draw the game in the background
-        self.run_game_draw(game_surface)
-
-        # Draw a semi-transparent overlay
-        overlay = pygame.Surface((self.original_screen_width, self.original_screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        game_surface.blit(overlay, (0, 0))
-
-        # Draw the pause menu text
-        game_surface.blit(self.paused_text, self.paused_rect)
-        game_surface.blit(self.continue_text, self.continue_rect)
-        game_surface.blit(self.main_menu_text, self.main_menu_rect)
-        game_surface.blit(self.quit_pause_text, self.quit_pause_rect)
-
-    def run_pause_menu_draw(self, game_surface):
-        # Draw the game in the background
-        self.run_game_draw(game_surface)
-
-        # Draw a semi-transparent overlay
-        overlay = pygame.Surface((self.original_screen_width, self.original_screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        game_surface.blit(overlay, (0, 0))
+    def draw_menu_background(self, game_surface):
+        # Shared by the menu, game over and high score screens, so the stars tick once per drawn frame
+        game_surface.blit(self.background_image, (0, 0))
+        self.star_field.update(MENU_STAR_ROTATION_SPEED * self.frame_time_scale)  # Slow constant rotation
+        self.star_field.draw(game_surface)
 
-        # Draw the pause menu text
-        game_surface.blit(self.paused_text, self.paused_rect)
-        game_surface.blit(self.continue_text, self.continue_rect)
-        game_surface.blit(self.main_menu_text, self.main_menu_rect)
-        game_surface.blit(self.quit_pause_text, self.quit_pause_rect)
+    def draw_dim_overlay(self, game_surface, alpha=150):
+        # Reuse the same pre-filled overlay; only rebuild it if a different alpha is requested
+        if self.dim_overlay_alpha != alpha:
+            self.dim_overlay.fill((0, 0, 0, alpha))
+            self.dim_overlay_alpha = alpha
+        game_surface.blit(self.dim_overlay, (0, 0))
 
     def run_high_scores_draw(self, game_surface):
-        game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation
-            star.draw(game_surface)
+        self.draw_menu_background(game_surface)
 
         # Draw the large crystal in the background
         self.menu_crystal_large.update()
@@ -1297,87 +1576,40 @@ class Game:
         crystal_rect = crystal_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
         game_surface.blit(crystal_image, crystal_rect)
 
-        # Draw semi-transparent black box
-        box_width = int(self.original_screen_width * 0.6)
-        box_height = int(self.original_screen_height * 0.7)
-        box_x = (self.original_screen_width - box_width) // 2
-        box_y = self.original_screen_height // 8 - 50 # Start slightly above title, moved up by 30 pixels
-        
-        alpha_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        alpha_surface.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
-        game_surface.blit(alpha_surface, (box_x, box_y))
-
-        high_scores = self.current_high_scores
-
-        title_text = self.title_font.render("HIGH SCORES", True, self.light_green)
-        title_rect = title_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 8))
-        game_surface.blit(title_text, title_rect)
-
-        y_offset = self.original_screen_height // 4
-        if not high_scores:
-            no_scores_text = self.menu_item_font.render("No scores yet. Play a game to set one!", True, self.white)
-            no_scores_rect = no_scores_text.get_rect(center=(self.original_screen_width // 2, y_offset + 50))
-            game_surface.blit(no_scores_text, no_scores_rect)
-        else:
-            header_name_text = self.escaped_font.render("NAME", True, self.white)
-            header_score_text = self.escaped_font.render("SCORE", True, self.white)
-
-            # Calculate positions to center them over their respective columns
-            # The score list is centered at original_screen_width // 2
-            # The name list is to the left of it, with 15 characters padding
-            name_x_pos = (self.original_screen_width // 2) - (header_name_text.get_width() // 2) - (self.menu_item_font.size(" ")[0] * 10) # 10 spaces for padding
-            score_x_pos = (self.original_screen_width // 2) + (header_score_text.get_width() // 2) + (self.menu_item_font.size(" ")[0] * 10) # 10 spaces for padding
-
-            game_surface.blit(header_name_text, (name_x_pos, y_offset - 20))
-            game_surface.blit(header_score_text, (score_x_pos - header_score_text.get_width(), y_offset - 20)) # Adjust score_x_pos to blit from left
-            y_offset += 40
+        # The score box only changes when the score list does, so it is baked into one surface
+        panel_key = tuple((entry.get('name', '---'), entry['score']) for entry in self.current_high_scores[:10])
+        if panel_key != self.high_scores_panel_key:
+            self.high_scores_panel_surface, self.high_scores_panel_pos = self.build_high_scores_panel()
+            self.high_scores_panel_key = panel_key
+        game_surface.blit(self.high_scores_panel_surface, self.high_scores_panel_pos)
 
-            for i, entry in enumerate(high_scores[:10]): # Display top 10 scores
-                player_name = entry.get('name', '---') # Safely get name, default to '---' if not present
-                score_line = f"{player_name:<15} {entry['score']:,}"
-                score_text = self.menu_item_font.render(score_line, True, self.white)
-                score_rect = score_text.get_rect(center=(self.original_screen_width // 2, y_offset + i * 35))
-                shadow_score_text = self.menu_item_font.render(score_line, True, (0,0,0)) # Black shadow
-                game_surface.blit(shadow_score_text, (score_rect.x + 3, score_rect.y + 3))
-                game_surface.blit(score_text, score_rect)
-        
-        return_text = self.start_font.render("Press ESC to return to Menu", True, self.light_green)
+        return_text = self.render_cached_text("Press ESC to return to Menu", self.start_font, self.light_green)
         return_rect = return_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height * 0.9))
         game_surface.blit(return_text, return_rect)
 
-    def run_high_scores_draw(self, game_surface):
-        game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation
-            star.draw(game_surface)
-
-        # Draw the large crystal in the background
-        self.menu_crystal_large.update()
-        crystal_image = self.menu_crystal_large.get_current_image()
-        crystal_rect = crystal_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
-        game_surface.blit(crystal_image, crystal_rect)
-
-        # Draw semi-transparent black box
+    def build_high_scores_panel(self):
+        # Semi-transparent black box
         box_width = int(self.original_screen_width * 0.6)
         box_height = int(self.original_screen_height * 0.7)
         box_x = (self.original_screen_width - box_width) // 2
         box_y = self.original_screen_height // 8 - 50 # Start slightly above title, moved up by 30 pixels
-        
-        alpha_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        alpha_surface.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
-        game_surface.blit(alpha_surface, (box_x, box_y))
 
+        panel = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
+
+        # Everything below is laid out in screen coordinates, then shifted into the box
+        center_x = self.original_screen_width // 2 - box_x
         high_scores = self.current_high_scores
 
         title_text = self.title_font.render("HIGH SCORES", True, self.light_green)
-        title_rect = title_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 8))
-        game_surface.blit(title_text, title_rect)
+        title_rect = title_text.get_rect(center=(center_x, self.original_screen_height // 8 - box_y))
+        panel.blit(title_text, title_rect)
 
-        y_offset = self.original_screen_height // 4
+        y_offset = self.original_screen_height // 4 - box_y
         if not high_scores:
             no_scores_text = self.menu_item_font.render("No scores yet. Play a game to set one!", True, self.white)
-            no_scores_rect = no_scores_text.get_rect(center=(self.original_screen_width // 2, y_offset + 50))
-            game_surface.blit(no_scores_text, no_scores_rect)
+            no_scores_rect = no_scores_text.get_rect(center=(center_x, y_offset + 50))
+            panel.blit(no_scores_text, no_scores_rect)
         else:
             header_name_text = self.escaped_font.render("NAME", True, self.white)
             header_score_text = self.escaped_font.render("SCORE", True, self.white)
@@ -1385,51 +1617,24 @@ class Game:
             # Calculate positions to center them over their respective columns
             # The score list is centered at original_screen_width // 2
             # The name list is to the left of it, with 15 characters padding
-            name_x_pos = (self.original_screen_width // 2) - (header_name_text.get_width() // 2) - (self.menu_item_font.size(" ")[0] * 10) # 10 spaces for padding
-            score_x_pos = (self.original_screen_width // 2) + (header_score_text.get_width() // 2) + (self.menu_item_font.size(" ")[0] * 10) # 10 spaces for padding
+            column_padding = self.menu_item_space_width * 10 # 10 spaces for padding
+            name_x_pos = center_x - (header_name_text.get_width() // 2) - column_padding
+            score_x_pos = center_x + (header_score_text.get_width() // 2) + column_padding
 
-            game_surface.blit(header_name_text, (name_x_pos, y_offset - 20))
-            game_surface.blit(header_score_text, (score_x_pos - header_score_text.get_width(), y_offset - 20)) # Adjust score_x_pos to blit from left
+            panel.blit(header_name_text, (name_x_pos, y_offset - 20))
+            panel.blit(header_score_text, (score_x_pos - header_score_text.get_width(), y_offset - 20)) # Adjust score_x_pos to blit from left
             y_offset += 40
 
             for i, entry in enumerate(high_scores[:10]): # Display top 10 scores
                 player_name = entry.get('name', '---') # Safely get name, default to '---' if not present
                 score_line = f"{player_name:<15} {entry['score']:,}"
-                score_text = self.menu_item_font.render(score_line, True, self.white)
-                score_rect = score_text.get_rect(center=(self.original_screen_width // 2, y_offset + i * 35))
-                shadow_score_text = self.menu_item_font.render(score_line, True, (0,0,0)) # Black shadow
-                game_surface.blit(shadow_score_text, (score_rect.x + 3, score_rect.y + 3))
-                game_surface.blit(score_text, score_rect)
-        
-        return_text = self.start_font.render("Press ESC to return to Menu", True, self.light_green)
-        return_rect = return_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height * 0.9))
-        game_surface.blit(return_text, return_rect)
-
-    def run_level_complete_draw(self, game_surface):
-        game_surface.blit(self.escaped_splash_image, (0, 0)) # Use escaped splash for now
-
-        # Text with Shadows
-        shadow_color = (0, 0, 0) # Black shadow
-
-        # Level Complete Text
-        shadow_level_complete_text = self.level_complete_font_large.render("LEVEL COMPLETE!", True, shadow_color)
-        game_surface.blit(shadow_level_complete_text, (self.level_complete_rect.x + 3, self.level_complete_rect.y + 3))
-        game_surface.blit(self.level_complete_text, self.level_complete_rect)
+                self.blit_text_with_shadow(panel, score_line, self.menu_item_font, self.white, center=(center_x, y_offset + i * 35))
 
-        # Next Level Text
-        shadow_next_level_text = self.game_over_font_small.render("Press 'ENTER' for next level", True, shadow_color)
-        game_surface.blit(shadow_next_level_text, (self.next_level_rect.x + 3, self.next_level_rect.y + 3))
-        game_surface.blit(self.next_level_text, self.next_level_rect)
+        return panel.convert_alpha(), (box_x, box_y)
 
-        # Return to Menu Text
-        shadow_return_to_menu_level_text = self.game_over_font_small.render("Press 'M' to return to Menu", True, shadow_color)
-        game_surface.blit(shadow_return_to_menu_level_text, (self.return_to_menu_level_rect.x + 3, self.return_to_menu_level_rect.y + 3))
-        game_surface.blit(self.return_to_menu_level_text, self.return_to_menu_level_rect)
-
-        # Quit Text
-        shadow_quit_level_text = self.game_over_font_small.render("Press 'Q' to quit", True, shadow_color)
-        game_surface.blit(shadow_quit_level_text, (self.quit_level_rect.x + 3, self.quit_level_rect.y + 3))
-        game_surface.blit(self.quit_level_text, self.quit_level_rect)
+    def run_level_complete_draw(self, game_surface):
+        # Background and text with shadows, laid out once in initialize_ui_elements
+        game_surface.blits(self.level_complete_blits, doreturn=False)
 
     def calculate_final_score(self):
         hull_bonus = 1  # Default bonus
@@ -1461,72 +1666,155 @@ class Game:
             save_final_score(self.player_name_input, self.final_score)
             self.score_saved_for_current_game = True
 
-    def draw_paragraph(self, surface, text, font, color, rect, shadow_color=None):
-        """Draws a paragraph of text onto a given surface within a specified rectangle."""
+    def render_cached_text(self, text, font, color):
+        # Text on the end/menu screens rarely changes, so only rasterize each string once
+        key = (id(font), text, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            if len(self.text_cache) > 512: # Keep typed names and old scores from piling up
+                self.text_cache.clear()
+            text_surface = font.render(text, True, color).convert_alpha() # Match the display format for fast blits
+            self.text_cache[key] = text_surface
+        return text_surface
+
+    def render_text_with_shadow(self, text, font, color, shadow_color=(0, 0, 0), shadow_offset=3):
+        # Bake the drop shadow under the text so each shadowed line is a single blit
+        key = (id(font), text, color, shadow_color, shadow_offset)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            if len(self.text_cache) > 512:
+                self.text_cache.clear()
+            foreground = font.render(text, True, color)
+            text_surface = pygame.Surface((foreground.get_width() + shadow_offset, foreground.get_height() + shadow_offset), pygame.SRCALPHA)
+            text_surface.blit(font.render(text, True, shadow_color), (shadow_offset, shadow_offset))
+            text_surface.blit(foreground, (0, 0))
+            text_surface = text_surface.convert_alpha()
+            self.text_cache[key] = text_surface
+        return text_surface
+
+    def place_text_with_shadow(self, text, font, color, shadow_color=(0, 0, 0), shadow_offset=3, **position):
+        # Position keywords (center=, midleft=, topleft=...) place the text itself, not the shadow
+        text_surface = self.render_text_with_shadow(text, font, color, shadow_color, shadow_offset)
+        text_rect = pygame.Rect(0, 0, text_surface.get_width() - shadow_offset, text_surface.get_height() - shadow_offset)
+        for anchor, value in position.items():
+            setattr(text_rect, anchor, value)
+        return text_surface, text_rect
+
+    def blit_text_with_shadow(self, surface, text, font, color, shadow_color=(0, 0, 0), shadow_offset=3, **position):
+        text_surface, text_rect = self.place_text_with_shadow(text, font, color, shadow_color, shadow_offset, **position)
+        surface.blit(text_surface, text_rect.topleft)
+        return text_rect
+
+    def wrap_paragraph(self, text, font, max_width):
         words = text.split('\n')
         lines = []
+        space_width = font.size(" ")[0]
         for line in words:
             words_in_line = line.split(' ')
             current_line = []
             line_width = 0
             for word in words_in_line:
-                word_surface = font.render(word, True, color)
-                word_width = word_surface.get_width()
-                if line_width + word_width < rect.width:
+                word_width = font.size(word)[0] # Measure only; no need to rasterize the word
+                if line_width + word_width < max_width:
                     current_line.append(word)
-                    line_width += word_width + font.size(" ")[0]
+                    line_width += word_width + space_width
                 else:
                     lines.append(" ".join(current_line))
                     current_line = [word]
-                    line_width = word_width + font.size(" ")[0]
+                    line_width = word_width + space_width
             lines.append(" ".join(current_line))
+        return lines
 
+    def draw_paragraph(self, surface, text, font, color, rect, shadow_color=None):
+        """Draws a paragraph of text onto a given surface within a specified rectangle."""
+        surface.blits(self.layout_paragraph(text, font, color, rect, shadow_color), doreturn=False)
+
+    def layout_paragraph(self, text, font, color, rect, shadow_color=None):
+        """Returns the (surface, position) blits that draw a paragraph within a specified rectangle."""
+        # The word wrap only depends on the text, font and width, so lay it out once
+        layout_key = (id(font), text, rect.width)
+        lines = self.paragraph_layout_cache.get(layout_key)
+        if lines is None:
+            lines = self.wrap_paragraph(text, font, rect.width)
+            self.paragraph_layout_cache[layout_key] = lines
+
+        blits = []
         y_offset = rect.top
         line_spacing = 5
         for line in lines:
             if shadow_color:
-                shadow_surface = font.render(line, True, shadow_color)
-                surface.blit(shadow_surface, (rect.left + 2, y_offset + 2))
-            line_surface = font.render(line, True, color)
-            surface.blit(line_surface, (rect.left, y_offset))
-            y_offset += line_surface.get_height() + line_spacing
+                line_surface, line_rect = self.place_text_with_shadow(line, font, color, shadow_color=shadow_color, shadow_offset=2, topleft=(rect.left, y_offset))
+                blits.append((line_surface, line_rect.topleft))
+            else:
+                line_surface = self.render_cached_text(line, font, color)
+                blits.append((line_surface, (rect.left, y_offset)))
+                line_rect = line_surface.get_rect()
+            y_offset += line_rect.height + line_spacing
+        return blits
             
-    def draw_tracks(self, game_surface, camera_x=0, camera_y=0):
-        for i in range(3):
-            center_radius = self.player_ship.orbital_radius_base + i * self.player_ship.track_width * self.player_ship.track_spacing_multiplier
-            inner_radius = center_radius - self.player_ship.track_width // 2
-            outer_radius = center_radius + self.player_ship.track_width // 2
-            pygame.draw.circle(game_surface, self.track_color, (self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y), int(inner_radius), 1)
-            pygame.draw.circle(game_surface, self.track_color, (self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y), int(outer_radius), 1)
-
-    def draw_black_hole(self, game_surface, camera_x=0, camera_y=0):
-        pygame.draw.circle(game_surface, self.black, (self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y), 50)
+    def draw_tracks_and_black_hole(self, game_surface, camera_x=0, camera_y=0):
+        # The track rings and the hole only depend on the ship's track layout, so rasterize them once and blit
+        ship = self.player_ship
+        tracks_key = (ship.track_radii, ship.track_width)
+        if tracks_key != self.tracks_surface_key:
+            self.tracks_surface = self.build_tracks_surface()
+            self.tracks_surface_key = tracks_key
+        tracks_rect = self.tracks_surface.get_rect(center=(self.center_x - camera_x, self.center_y - camera_y))
+        game_surface.blit(self.tracks_surface, tracks_rect)
+
+    def build_tracks_surface(self):
+        half_width = self.player_ship.track_width // 2
+        max_outer_radius = self.player_ship.track_radii[-1] + half_width
+        size = 2 * int(max_outer_radius) + 2
+        tracks_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (size // 2, size // 2)
+        for center_radius in self.player_ship.track_radii:
+            inner_radius = center_radius - half_width
+            outer_radius = center_radius + half_width
+            pygame.draw.circle(tracks_surface, self.track_color, center, int(inner_radius), 1)
+            pygame.draw.circle(tracks_surface, self.track_color, center, int(outer_radius), 1)
+        # The hole sits inside the innermost ring and is always drawn right after the tracks
+        pygame.draw.circle(tracks_surface, self.black, center, 50)
+        return tracks_surface.convert_alpha()
+
+    def apply_window_resize(self, size):
+        self.screen_width, self.screen_height = size
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+        self.update_letterbox(self.screen_width, self.screen_height)
+
+    def update_letterbox(self, width, height):
+        # Fit the game surface inside the window, keeping its aspect ratio. The smaller axis
+        # scale wins; the other axis gets centred bars (its offset works out to 0 on the fitted axis)
+        self.scale_factor = min(width / self.original_screen_width, height / self.original_screen_height)
+        self.offset_x = (width - int(self.original_screen_width * self.scale_factor)) // 2
+        self.offset_y = (height - int(self.original_screen_height * self.scale_factor)) // 2
+        game_width = int(self.original_screen_width * self.scale_factor)
+        game_height = int(self.original_screen_height * self.scale_factor)
+        self.game_rect = pygame.Rect(self.offset_x, self.offset_y, game_width, game_height)
+        self.partial_display_update = game_width * game_height < width * height * PARTIAL_UPDATE_MAX_WINDOW_FRACTION
+        self.full_flip_pending = True # The new bars have to reach the display once
 
     def run(self):
         while True:
             events = pygame.event.get()
+            resize_to = None
             for event in events:
                 if event.type == pygame.VIDEORESIZE:
-                    self.screen_width, self.screen_height = event.size
-                    self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
-                    current_aspect_ratio = self.screen_width / self.screen_height
-                    if current_aspect_ratio > self.aspect_ratio:
-                        self.scale_factor = self.screen_height / self.original_screen_height
-                        self.offset_x = (self.screen_width - int(self.original_screen_width * self.scale_factor)) // 2
-                        self.offset_y = 0
-                    else:
-                        self.scale_factor = self.screen_width / self.original_screen_width
-                        self.offset_y = (self.screen_height - int(self.original_screen_height * self.scale_factor)) // 2
-                        self.offset_x = 0
+                    resize_to = event.size # Dragging the window edge sends a burst; only the last size matters
                 self.state_manager.handle_events([event]) # Pass individual event to state manager
+            if resize_to is not None:
+                self.apply_window_resize(resize_to)
             
-            if self.state_manager.get_state() == "CINEMATIC":
-                if self.cinematic_player:
-                    self.cinematic_player.update()
-                    if self.cinematic_player.is_done():
-                        self.state_manager.set_state("GAME_OVER")
-            else:
-                self.state_manager.update()
+            update_steps = int(self.update_accumulator + UPDATE_STEP_TOLERANCE)
+            self.update_accumulator -= update_steps
+            for _ in range(update_steps):
+                if self.state_manager.get_state() == "CINEMATIC":
+                    if self.cinematic_player:
+                        self.cinematic_player.update()
+                        if self.cinematic_player.is_done():
+                            self.state_manager.set_state("GAME_OVER")
+                else:
+                    self.state_manager.update()
 
             if self.state_manager.get_state() == "CINEMATIC":
                 if self.cinematic_player:
@@ -1535,64 +1823,103 @@ class Game:
                 self.state_manager.draw(self.game_surface)
 
             # Scale the game_surface to the current screen size and blit it
-            scaled_surface = pygame.transform.scale(self.game_surface, (int(self.original_screen_width * self.scale_factor), int(self.original_screen_height * self.scale_factor)))
-            self.screen.blit(scaled_surface, (self.offset_x, self.offset_y))
-
-            pygame.display.flip()
-            self.clock.tick(self.fps)
+            scaled_size = (int(self.original_screen_width * self.scale_factor), int(self.original_screen_height * self.scale_factor))
+            if scaled_size == (self.original_screen_width, self.original_screen_height):
+                self.screen.blit(self.game_surface, (self.offset_x, self.offset_y))
+            else:
+                # Scale into a reused destination surface; only reallocate when the window size changes
+                if scaled_size != self.scaled_size:
+                    self.scaled_surface = pygame.Surface(scaled_size).convert()
+                    self.scaled_size = scaled_size
+                pygame.transform.scale(self.game_surface, scaled_size, self.scaled_surface)
+                self.screen.blit(self.scaled_surface, (self.offset_x, self.offset_y))
+
+            if self.partial_display_update and not self.full_flip_pending:
+                pygame.display.update(self.game_rect)
+            else:
+                pygame.display.flip()
+                self.full_flip_pending = False
+            if self.state_manager.get_state() in STATIC_SCREEN_STATES:
+                self.clock.tick(STATIC_SCREEN_FPS)
+                elapsed_frames = self.clock.get_time() * self.fps / 1000.0
+                # Static screens step once per drawn frame; their long frames aren't owed to gameplay
+                self.update_accumulator = 1.0
+            else:
+                self.clock.tick(self.fps)
+                elapsed_frames = self.clock.get_time() * self.fps / 1000.0
+                self.update_accumulator = min(self.update_accumulator + elapsed_frames, MAX_UPDATE_STEPS_PER_FRAME)
+            # Clamped so a long hitch (e.g. loading a level) doesn't make the stars jump
+            self.frame_time_scale = min(elapsed_frames, 4.0)
 
 # --- Entity Classes (Need to be adapted to take the game object) ---
 class SpeedBoost:
+    # Crystal graphic shown by every boost, created with the first one
+    shared_crystal = None
+
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.radius = self.game.player_ship.track_radii[track]
+        self.angle = random.uniform(0, TWO_PI)
+        # Boosts don't orbit, so their screen position is fixed for their whole lifetime
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
+        self.pixel_x = round(self.x)
+        self.pixel_y = round(self.y)
         self.lifetime = random.randint(240, 360)
-        self.crystal_graphic = Crystal(0, 0, base_avg_radius=15) # Initialize Crystal graphic
+        if SpeedBoost.shared_crystal is None:
+            SpeedBoost.shared_crystal = Crystal(0, 0, base_avg_radius=15)
+        self.crystal_graphic = SpeedBoost.shared_crystal
 
-    def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        
+    def get_blit(self, camera_x=0, camera_y=0):
+        """Returns the (image, position) pair that draws this entity, for batching with Surface.blits."""
         crystal_image = self.crystal_graphic.get_current_image()
-        crystal_rect = crystal_image.get_rect(center=(int(round(x)), int(round(y))))
-        game_surface.blit(crystal_image, crystal_rect)
+        return crystal_image, (self.pixel_x - camera_x - crystal_image.get_width() // 2, self.pixel_y - camera_y - crystal_image.get_height() // 2)
+
+    def draw(self, game_surface, camera_x=0, camera_y=0):
+        game_surface.blit(*self.get_blit(camera_x, camera_y))
 
     def update(self):
         self.lifetime -= 1
-        self.crystal_graphic.update() # Update the crystal graphic
 
 class PowerUp:
+    # Yellow crystal graphic shown by every power-up, created with the first one
+    shared_crystal = None
+
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.radius = self.game.player_ship.track_radii[track]
+        self.angle = random.uniform(0, TWO_PI)
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
+        self.pixel_x = round(self.x)
+        self.pixel_y = round(self.y)
         self.lifetime = random.randint(180, 300)
-        self.crystal_graphic = Crystal(0, 0, base_avg_radius=15)
-        self.crystal_graphic.color_key = 'yellow'
-        self.crystal_graphic.base_color = CRYSTAL_COLORS[self.crystal_graphic.color_key]
+        if PowerUp.shared_crystal is None:
+            PowerUp.shared_crystal = Crystal(0, 0, base_avg_radius=15)
+            PowerUp.shared_crystal.color_key = 'yellow'
+            PowerUp.shared_crystal.base_color = CRYSTAL_COLORS[PowerUp.shared_crystal.color_key]
+        self.crystal_graphic = PowerUp.shared_crystal
         self.powerup_radius = self.crystal_graphic.base_avg_radius
 
-    def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        
+    def get_blit(self, camera_x=0, camera_y=0):
+        """Returns the (image, position) pair that draws this entity, for batching with Surface.blits."""
         crystal_image = self.crystal_graphic.get_current_image()
-        crystal_rect = crystal_image.get_rect(center=(int(round(x)), int(round(y))))
-        game_surface.blit(crystal_image, crystal_rect)
+        return crystal_image, (self.pixel_x - camera_x - crystal_image.get_width() // 2, self.pixel_y - camera_y - crystal_image.get_height() // 2)
+
+    def draw(self, game_surface, camera_x=0, camera_y=0):
+        game_surface.blit(*self.get_blit(camera_x, camera_y))
 
     def update(self):
         self.lifetime -= 1
-        self.crystal_graphic.update()
 
 class Obstacle:
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.target_radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.target_radius = self.game.player_ship.track_radii[track]
+        self.angle = random.uniform(0, TWO_PI)
         self.entering_screen = True
         self.entry_speed = random.uniform(5, 10)
         self.orbital_speed = random.uniform(0.001, 0.002) * random.choice([-1, 1])
@@ -1601,6 +1928,11 @@ class Obstacle:
             self.radius = random.uniform(0, self.game.player_ship.orbital_radius_base - 50)
         else:
             self.radius = random.uniform(self.target_radius + 100, self.game.screen_width * 0.75)
+        # Screen position, refreshed each frame by Game.update_obstacle_orbits
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
+        self.pixel_x = round(self.x)
+        self.pixel_y = round(self.y)
 
         initial_asteroid_size = 20
         available_asteroid_types = list(ASTEROID_COLORS.keys())
@@ -1614,36 +1946,32 @@ class Obstacle:
         self.asteroid = Asteroid(0, 0, asteroid_type=random_asteroid_type, new_outer_radius=initial_asteroid_size)
         self.obstacle_radius = self.asteroid.outer_radius
 
-    def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        self.asteroid.x = x
-        self.asteroid.y = y
+    def get_blit(self, camera_x=0, camera_y=0):
+        """Returns the (image, position) pair that draws this obstacle, for batching with Surface.blits."""
+        # The asteroid's own x/y are kept in world space by update(); only the blit position is camera-relative
+        x = self.pixel_x - camera_x
+        y = self.pixel_y - camera_y
         asteroid_image = self.asteroid.get_current_image()
-        image_rect = asteroid_image.get_rect(center=(int(round(x)), int(round(y))))
-        game_surface.blit(asteroid_image, image_rect)
+        return asteroid_image, (x - asteroid_image.get_width() // 2, y - asteroid_image.get_height() // 2)
+
+    def draw(self, game_surface, camera_x=0, camera_y=0):
+        game_surface.blit(*self.get_blit(camera_x, camera_y))
 
     def update(self):
-        if self.entering_screen:
-            if self.radius < self.target_radius:
-                self.radius += self.entry_speed
-                if self.radius >= self.target_radius:
-                    self.entering_screen = False
-            else:
-                self.radius -= self.entry_speed
-                if self.radius <= self.target_radius:
-                    self.entering_screen = False
-        else:
-            self.angle += self.orbital_speed
-            if self.angle > 2 * math.pi:
-                self.angle -= 2 * math.pi
-            elif self.angle < 0:
-                self.angle += 2 * math.pi
+        # Entry/orbit movement is advanced for all obstacles at once in Game.update_obstacle_orbits
         self.asteroid.update()
-        self.asteroid.x = self.game.screen_width // 2 + self.radius * math.cos(self.angle)
-        self.asteroid.y = self.game.screen_height // 2 + self.radius * math.sin(self.angle)
+        self.asteroid.x = self.x
+        self.asteroid.y = self.y
 
 class ExplodingObstacle(Obstacle):
+    # Explosion frames depend only on radius and duration, so they are rendered once
+    # per (radius, duration) and shared by every instance
+    explosion_frames_cache = {}
+    # Glow ramps keyed by (bright, dark, steps); the glow only ever takes these values
+    color_ramp_cache = {}
+    # Drawn for the explosion's first, zero-radius frames
+    empty_blit = (pygame.Surface((0, 0)), (0, 0))
+
     def __init__(self, track, game):
         super().__init__(track, game)
         custom_asteroid_size = 25
@@ -1657,80 +1985,96 @@ class ExplodingObstacle(Obstacle):
         self.color_bright = (255, 100, 100)
         self.color_dark = self.game.red
         self.glow_speed = 0.05
-        self.glow_value = 0
+        self.color_ramp = self.get_color_ramp(self.color_bright, self.color_dark, round(1 / self.glow_speed))
+        self.glow_index = 0
         self.glow_direction = 1
+        self.color = self.color_ramp[0]
         self.explosion_radius = 180
         self.explosion_duration = 30
         self.exploded = False
         self.explosion_timer = 0
+        self.explosion_finished = False # Swept out of game.obstacles by Game.update
         self.explosion_color = (255, 165, 0)
-        self.x = self.calculate_x()
-        self.y = self.calculate_y()
-
-    def calculate_x(self):
-        return self.game.original_screen_width // 2 + self.radius * math.cos(self.angle)
 
-    def calculate_y(self):
-        return self.game.original_screen_height // 2 + self.radius * math.sin(self.angle)
-
-    def update_position(self):
-        self.x = self.calculate_x()
-        self.y = self.calculate_y()
-        self.asteroid.x = self.x
-        self.asteroid.y = self.y
+    @classmethod
+    def get_color_ramp(cls, color_bright, color_dark, steps):
+        key = (color_bright, color_dark, steps)
+        ramp = cls.color_ramp_cache.get(key)
+        if ramp is None:
+            ramp = []
+            for i in range(steps + 1):
+                glow_value = i / steps
+                r = int(color_bright[0] + (color_dark[0] - color_bright[0]) * glow_value)
+                g = int(color_bright[1] + (color_dark[1] - color_bright[1]) * glow_value)
+                b = int(color_bright[2] + (color_dark[2] - color_bright[2]) * glow_value)
+                ramp.append((r, g, b))
+            cls.color_ramp_cache[key] = ramp
+        return ramp
 
     def update_color(self):
-        self.glow_value += self.glow_speed * self.glow_direction
-        if self.glow_value >= 1:
-            self.glow_value = 1
+        # Ping-pong along the precomputed ramp between bright and dark
+        self.glow_index += self.glow_direction
+        if self.glow_index >= len(self.color_ramp) - 1:
+            self.glow_index = len(self.color_ramp) - 1
             self.glow_direction = -1
-        elif self.glow_value <= 0:
-            self.glow_value = 0
+        elif self.glow_index <= 0:
+            self.glow_index = 0
             self.glow_direction = 1
-        r = int(self.color_bright[0] + (self.color_dark[0] - self.color_bright[0]) * self.glow_value)
-        g = int(self.color_bright[1] + (self.color_dark[1] - self.color_bright[1]) * self.glow_value)
-        b = int(self.color_bright[2] + (self.color_dark[2] - self.color_bright[2]) * self.glow_value)
-        self.color = (r, g, b)
-
-    def draw(self, game_surface, camera_x=0, camera_y=0):
+        self.color = self.color_ramp[self.glow_index]
+
+    @classmethod
+    def get_explosion_frames(cls, explosion_radius, explosion_duration):
+        key = (explosion_radius, explosion_duration)
+        frames = cls.explosion_frames_cache.get(key)
+        if frames is None:
+            frames = []
+            for timer in range(explosion_duration):
+                progress = timer / explosion_duration
+                # Use an easing function for more dynamic expansion
+                eased_progress = 1 - (1 - progress)**3
+                base_radius = explosion_radius * eased_progress
+
+                max_radius = int(round(base_radius))
+                if max_radius <= 0:
+                    frames.append(None)
+                    continue
+
+                explosion_surf = pygame.Surface((max_radius * 2, max_radius * 2), pygame.SRCALPHA)
+                center = (max_radius, max_radius)
+
+                # Draw layers from largest to smallest for correct blending
+                pygame.draw.circle(explosion_surf, (255, 255, 0, 100), center, max_radius) # Yellow outer glow
+                if base_radius > 5:
+                    pygame.draw.circle(explosion_surf, (255, 165, 0, 150), center, int(round(base_radius * 0.8))) # Orange middle
+                if base_radius > 10:
+                    pygame.draw.circle(explosion_surf, (255, 0, 0, 200), center, int(round(base_radius * 0.2))) # Red core
+                frames.append(explosion_surf.convert_alpha())
+            cls.explosion_frames_cache[key] = frames
+        return frames
+
+    def get_blit(self, camera_x=0, camera_y=0):
         if self.exploded:
-            progress = self.explosion_timer / self.explosion_duration
-            # Use an easing function for more dynamic expansion
-            eased_progress = 1 - (1 - progress)**3
-            base_radius = self.explosion_radius * eased_progress
-
-            # Create a temporary surface for alpha blending
-            max_radius = int(round(base_radius))
-            if max_radius <= 0: return
-            
-            explosion_surf = pygame.Surface((max_radius * 2, max_radius * 2), pygame.SRCALPHA)
-            center = (max_radius, max_radius)
-
-            # Draw layers from largest to smallest for correct blending
-            pygame.draw.circle(explosion_surf, (255, 255, 0, 100), center, max_radius) # Yellow outer glow
-            if base_radius > 5:
-                pygame.draw.circle(explosion_surf, (255, 165, 0, 150), center, int(round(base_radius * 0.8))) # Orange middle
-            if base_radius > 10:
-                pygame.draw.circle(explosion_surf, (255, 0, 0, 200), center, int(round(base_radius * 0.2))) # Red core
-            
-            # Blit the combined explosion surface to the main screen
-            pos_x = int(round(self.x - camera_x))
-            pos_y = int(round(self.y - camera_y))
-            game_surface.blit(explosion_surf, (pos_x - max_radius, pos_y - max_radius))
+            frames = self.get_explosion_frames(self.explosion_radius, self.explosion_duration)
+            explosion_surf = frames[min(self.explosion_timer, len(frames) - 1)]
+            if explosion_surf is None:
+                return self.empty_blit
 
-        else:
-            super().draw(game_surface, camera_x, camera_y)
+            # The pre-rendered explosion frame, centred on the obstacle
+            max_radius = explosion_surf.get_width() // 2
+            pos_x = self.pixel_x - camera_x
+            pos_y = self.pixel_y - camera_y
+            return explosion_surf, (pos_x - max_radius, pos_y - max_radius)
+
+        return super().get_blit(camera_x, camera_y)
 
     def update(self):
         if not self.exploded:
             super().update()
             self.update_color()
-            self.update_position()
         else:
             self.explosion_timer += 1
             if self.explosion_timer >= self.explosion_duration:
-                if self in self.game.obstacles:
-                    self.game.obstacles.remove(self)
+                self.explosion_finished = True
 
 class FollowingCharge:
     def __init__(self):
@@ -1767,50 +2111,58 @@ class FollowingCharge:
             self.current_speed_multiplier += self.speed_increase_rate
             dx = ship_x - self.position[0]
             dy = ship_y - self.position[1]
-            distance = math.hypot(dx, dy)
-            if distance > 0:
-                self.position[0] += (dx / distance) * charge_speed
-                self.position[1] += (dy / distance) * charge_speed
+            distance_squared = dx * dx + dy * dy
+            if distance_squared > 0:
+                step = charge_speed / math.sqrt(distance_squared) # Normalize and scale in one factor
+                self.position[0] += dx * step
+                self.position[1] += dy * step
         self.ball_lightning_graphic.update()
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
         if self.active:
-            self.ball_lightning_graphic.set_position(int(self.position[0]), int(self.position[1]))
+            pixel_x = int(self.position[0])
+            pixel_y = int(self.position[1])
+            self.ball_lightning_graphic.set_position(pixel_x, pixel_y)
             lightning_image = self.ball_lightning_graphic.get_current_image()
-            image_rect = lightning_image.get_rect(center=(int(self.position[0] - camera_x), int(self.position[1] - camera_y)))
-            game_surface.blit(lightning_image, image_rect)
+            game_surface.blit(lightning_image, (pixel_x - camera_x - lightning_image.get_width() // 2, pixel_y - camera_y - lightning_image.get_height() // 2))
 
-class Star:
-    def __init__(self, screen_width, screen_height, speed_multiplier):
+class StarField:
+    # All stars live in NumPy arrays (one entry per star) and are rasterized into a single
+    # alpha layer each frame, so the whole field costs one blit instead of one per star.
+    def __init__(self, screen_width, screen_height, layers):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.speed_multiplier = speed_multiplier # New attribute for parallax effect
-        self.radius = random.uniform(0, max(self.screen_width, self.screen_height) / 2)
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.size = random.randint(1, 3)
-        self.color = (255, 255, 255)
-        self.alpha = random.randint(50, 255)
-        self.alpha_change = random.choice([-5, 5])
-        self.surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.surface.fill(self.color)
-        self.surface.set_alpha(self.alpha)
+        self.center_x = screen_width // 2
+        self.center_y = screen_height // 2
+        # Compact dtypes keep the whole field in a few small contiguous buffers
+        # Parallax layers are stored back to back; each layer's speed multiplier applies to its slice
+        self.layer_multipliers = np.array([multiplier for multiplier, count in layers], dtype=np.float32)
+        self.layer_ends = np.cumsum([count for multiplier, count in layers]).astype(np.intp)
+        num_stars = int(self.layer_ends[-1])
+        self.radius = np.random.uniform(0, max(self.screen_width, self.screen_height) / 2, num_stars).astype(np.float32)
+        self.angle = np.random.uniform(0, TWO_PI, num_stars).astype(np.float32)
+        self.size = np.random.randint(1, 4, num_stars, dtype=np.int16)
+        self.alpha = np.random.randint(50, 256, num_stars, dtype=np.int16)
+        self.alpha_change = np.random.choice(np.array([-5, 5], dtype=np.int16), num_stars)
+        # White layer whose per-pixel alpha is rewritten every frame
+        self.surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((255, 255, 255, 0))
 
     def update(self, ship_speed):
-        angular_speed = -ship_speed * 0.5 * self.speed_multiplier # Apply speed multiplier
-        self.angle += angular_speed
-        if self.angle > 2 * math.pi:
-            self.angle -= 2 * math.pi
-        elif self.angle < 0:
-            self.angle += 2 * math.pi
-        self.alpha += self.alpha_change
-        if self.alpha <= 50 or self.alpha >= 255:
-            self.alpha_change *= -1
-        self.surface.set_alpha(self.alpha)
+        tick_star_field(self.angle, self.alpha, self.alpha_change, self.layer_ends, self.layer_multipliers, -ship_speed * 0.5)
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        game_surface.blit(self.surface, (int(x - self.size // 2), int(y - self.size // 2)))
+        sin, cos = sincos_lookup(self.angle)
+        xs = (self.center_x + self.radius * cos - camera_x - self.size // 2).astype(np.intp)
+        ys = (self.center_y + self.radius * sin - camera_y - self.size // 2).astype(np.intp)
+        alphas = np.clip(self.alpha, 0, 255).astype(np.uint8)
+
+        alpha_pixels = pygame.surfarray.pixels_alpha(self.surface)
+        alpha_pixels.fill(0)
+        stamp_star_alpha(alpha_pixels, xs, ys, self.size, alphas)
+        del alpha_pixels # Release the pixel lock before blitting
+
+        game_surface.blit(self.surface, (0, 0))
 
 if __name__ == "__main__":
     game = Game()
@@ -23,7 +23,19 @@ import os
 # --- Asset Path ---
 ASSET_PATH = "assets"
 
+# --- Angles ---
+TWO_PI = 2 * math.pi
+# Orbit positions call math.cos/math.sin directly. A Python-level lookup table was
+# measured slower, since the index arithmetic costs more than the libm calls.
 
+# --- HUD ---
+# Zero-padded "00".."99", indexed by the timer's hundredths instead of formatting them every frame
+TWO_DIGIT_LABELS = tuple(f"{i:02}" for i in range(100))
+
+# --- Game Over Screen ---
+# Distinct rotozoomed game over images the jitter flashes pick from. Each is ~3 MB, so the
+# pool stays small; flashes last 2 frames, too short to notice repeats.
+GAME_OVER_JITTER_VARIANTS = 12
 
 # --- Helper functions (can be outside the class) ---
 def check_collision(obj1_radius, obj1_x, obj1_y, obj2_radius, obj2_x, obj2_y):
@@ -31,6 +43,18 @@ def check_collision(obj1_radius, obj1_x, obj1_y, obj2_radius, obj2_x, obj2_y):
     radii_sum_squared = (obj1_radius + obj2_radius)**2
     return distance_squared < radii_sum_squared
 
+def tick_obstacle_orbits(radius, target_radius, entry_speed, entering, angle, orbital_speed):
+    # Vectorized version of the per-obstacle entry/orbit step; all arguments are updated in place
+    orbiting = ~entering
+    inward = entering & (radius < target_radius)
+    outward = entering & ~inward
+    np.add(radius, entry_speed, out=radius, where=inward)
+    np.subtract(radius, entry_speed, out=radius, where=outward)
+    arrived = (inward & (radius >= target_radius)) | (outward & (radius <= target_radius))
+    entering &= ~arrived
+    np.add(angle, orbital_speed, out=angle, where=orbiting)
+    np.mod(angle, TWO_PI, out=angle)
+
 def save_final_score(player_name, final_score):
     score_entry = {
         'name': player_name,
@@ -47,7 +71,7 @@ def save_final_score(player_name, final_score):
     high_scores.sort(key=lambda x: x['score'], reverse=True)
     try:
         with open(os.path.join(ASSET_PATH, 'highscores.json'), 'w') as f:
-            json.dump(high_scores, f, indent=4)
+            json.dump(high_scores, f, separators=(',', ':')) # Compact: the file is only ever read back by the game
         print("Score saved successfully!")
     except IOError as e:
         print(f"Error saving scores: {e}")
@@ -72,6 +96,9 @@ class Game:
 
         self.original_screen_width = 1000
         self.original_screen_height = 800
+        # Screen center in game coordinates; everything orbits this point
+        self.center_x = self.original_screen_width // 2
+        self.center_y = self.original_screen_height // 2
         self.screen = pygame.display.set_mode((self.original_screen_width, self.original_screen_height), pygame.RESIZABLE)
         self.game_surface = pygame.Surface((self.original_screen_width, self.original_screen_height))
         self.screen_width = self.original_screen_width # Current screen width
@@ -80,6 +107,9 @@ class Game:
         self.scale_factor = 1.0
         self.offset_x = 0
         self.offset_y = 0
+        # Destination for the scaled game surface, reallocated only when the window size changes
+        self.scaled_surface = None
+        self.scaled_size = None
 
         # Initial resize calculation based on actual window size
         current_w, current_h = self.screen.get_size()
@@ -142,6 +172,7 @@ class Game:
         new_width = int(width * 0.8)
         new_height = int(height * 0.8)
         self.game_over_background_image = pygame.transform.scale(self.game_over_background_image, (new_width, new_height))
+        self.game_over_background_pos = self.game_over_background_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2)).topleft
         self.escaped_splash_image = pygame.image.load(os.path.join(ASSET_PATH, 'escaped_splash.png')).convert()
         self.escaped_splash_image = pygame.transform.scale(self.escaped_splash_image, (self.original_screen_width, self.original_screen_height))
         print("Escaped splash image loaded.")
@@ -170,13 +201,11 @@ class Game:
         
         # Create three layers of stars for parallax effect
         num_stars_per_layer = 1000 // 3
-        self.stars = []
-        # Layer 1: Fastest (original speed)
-        self.stars.extend([Star(self.original_screen_width, self.original_screen_height, 1.0) for _ in range(num_stars_per_layer)])
-        # Layer 2: Slower
-        self.stars.extend([Star(self.original_screen_width, self.original_screen_height, 0.5) for _ in range(num_stars_per_layer)])
-        # Layer 3: Very Slowest
-        self.stars.extend([Star(self.original_screen_width, self.original_screen_height, 0.2) for _ in range(1000 - 2 * num_stars_per_layer)]) # Ensure total is 1000
+        self.star_field = StarField(self.original_screen_width, self.original_screen_height, [
+            (1.0, num_stars_per_layer), # Layer 1: Fastest (original speed)
+            (0.5, num_stars_per_layer), # Layer 2: Slower
+            (0.2, 1000 - 2 * num_stars_per_layer), # Layer 3: Very Slowest, ensure total is 1000
+        ])
 
         self.speed_boosts = []
         self.power_ups = []
@@ -212,6 +241,17 @@ class Game:
         self.black = (0, 0, 0)
         self.dark_purple = (30, 0, 60)
         self.track_color = (50, 50, 50)
+        # Track rings pre-rasterized into one surface, rebuilt if the track layout changes
+        self.tracks_surface = None
+        self.tracks_surface_key = None
+        # Last (text, surface) rendered for each HUD line; a line is only re-rendered when its text changes
+        self.hud_text_surfaces = {}
+        self.timer_label = ""
+        self.timer_label_seconds = None # Whole seconds self.timer_label was formatted for
+        # Rendered paragraph lines (shadow, text) keyed by font, text, colors and wrap width
+        self.paragraph_cache = {}
+        # Score box and footer of the high-score screen, laid out on state entry
+        self.high_scores_blits = []
         self.speed_boost_color = (0, 255, 0)
 
         # UI Text Renderings
@@ -268,12 +308,14 @@ class Game:
         self.jitter_sequence = []
         self.jitter_flash_duration = 2 # Duration of each flash in frames
         self.jitter_flash_timer = 0
-        self.current_jitter_surface = None
+        self.current_jitter = None # (surface, topleft) of the flash being shown
+        self.jitter_variants = [None] * GAME_OVER_JITTER_VARIANTS # Each rotozoomed and centered the first time it is picked
 
     def reset_game_variables(self):
         pygame.time.set_timer(pygame.USEREVENT + 1, 0) # Disable any lingering game over timers
         self.player_ship.reset()
         self.survival_timer_start_time = pygame.time.get_ticks()
+        self.final_score = 0
         self.survival_timer = 60 * self.fps
         self.speed_boosts.clear()
         self.power_ups.clear()
@@ -303,11 +345,62 @@ class Game:
         self.electrocuted_timer = 0
         self.electrocuted_duration = 90 # Duration of the electrocution effect in frames
 
+    def calculate_final_score(self):
+        # Any positive dilation counts as 1; negative dilation scales the score
+        if self.dilation_score > 0:
+            processed_dilation = 1
+        else:
+            processed_dilation = abs(self.dilation_score)
+        return processed_dilation * self.num_boosts_collected * 100
+
+    def on_enter_escaped_state(self):
+        # Dilation and boosts are frozen once the ship has escaped, so score it once
+        self.final_score = self.calculate_final_score()
+        self.escaped_static_blits = [(self.escaped_splash_image, (0, 0))]
+        self.escaped_static_blits += self.shadowed_text_blits("YOU ESCAPED THE BLACK HOLE!", self.escaped_font_large, self.light_green, topleft=self.escaped_rect.topleft)
+        self.escaped_static_blits += self.shadowed_text_blits("Final Score:", self.escaped_font, self.light_green, center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2))
+        self.escaped_static_blits += self.shadowed_text_blits(f"{int(self.final_score):,}", self.escaped_font, self.light_green, midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2))
+        self.escaped_static_blits += self.shadowed_text_blits("Press 'ENTER' to try again", self.escaped_font_small, self.light_green, topleft=self.restart_rect_escaped.topleft)
+        self.escaped_static_blits += self.shadowed_text_blits("Press 'Q' to quit", self.escaped_font_small, self.light_green, topleft=self.quit_rect_escaped.topleft)
+
+        # Determine the high score threshold dynamically
+        current_high_scores = load_high_scores()
+        if len(current_high_scores) < 10:  # If fewer than 10 scores, any score is a high score
+            dynamic_threshold = 0
+        else:
+            # Get the 10th score (lowest in top 10) and set threshold to 1 above it
+            dynamic_threshold = current_high_scores[9]['score'] + 1
+
+        print(f"Final Score: {self.final_score}, Dynamic Threshold: {dynamic_threshold}")
+
+        # Check if score qualifies for high score entry
+        if self.final_score >= dynamic_threshold:
+            self.state_manager.set_state("ESCAPED_INPUT_NAME")
+        else:
+            self.save_score_if_needed() # Save score even if not high score, but without name
+
+    def on_enter_escaped_input_name_state(self):
+        # Everything except the typed name is fixed while this screen is up
+        self.input_name_static_blits = [(self.escaped_splash_image, (0, 0))]
+        self.input_name_static_blits += self.shadowed_text_blits("YOU ESCAPED THE BLACK HOLE!", self.escaped_font_large, self.light_green, topleft=self.escaped_rect.topleft)
+        self.input_name_static_blits += self.shadowed_text_blits("Final Score:", self.escaped_font, self.light_green, center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2 - 50))
+        self.input_name_static_blits += self.shadowed_text_blits(f"{int(self.final_score):,}", self.escaped_font, self.light_green, midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2 - 50))
+        self.input_name_static_blits += self.shadowed_text_blits("Enter your name (up to 8 letters):", self.escaped_font_small, self.white, center=(self.original_screen_width // 2, self.original_screen_height // 2 + 50))
+        self.input_name_static_blits += self.shadowed_text_blits("Press ENTER to save, ESC to skip", self.escaped_font_small, self.white, center=(self.original_screen_width // 2, self.original_screen_height // 2 + 150))
+
+    def shadowed_text_blits(self, text, font, color, shadow_color=(0, 0, 0), **position):
+        # (surface, pos) pairs for a line and its drop shadow 3px down-right; position keywords place the text
+        text_surface = font.render(text, True, color)
+        text_rect = text_surface.get_rect(**position)
+        shadow_surface = font.render(text, True, shadow_color)
+        return [(shadow_surface, (text_rect.x + 3, text_rect.y + 3)), (text_surface, text_rect.topleft)]
+
     def on_enter_high_scores_state(self):
         self.current_high_scores = load_high_scores()
         chosen_color = random.choice(['green', 'yellow'])
         self.menu_crystal_large.color_key = chosen_color
         self.menu_crystal_large.base_color = CRYSTAL_COLORS[chosen_color]
+        self.high_scores_blits = self.build_high_scores_blits()
 
     def handle_menu_events(self, event):
         if event.type == pygame.KEYDOWN:
@@ -404,8 +497,7 @@ class Game:
         self.player_ship.speed = current_angular_speed
 
         # Update stars based on the ship's new speed
-        for star in self.stars:
-            star.update(self.player_ship.speed)
+        self.star_field.update(self.player_ship.speed)
 
         # Create an accurate bounding box for the drawn ship
         ship_visual_size = max(self.player_ship.image_orig.get_width(), self.player_ship.image_orig.get_height()) * self.player_ship.display_scale
@@ -428,11 +520,12 @@ class Game:
         # Move ship towards black hole center
         dx = (self.original_screen_width // 2) - self.player_ship.x
         dy = (self.original_screen_height // 2) - self.player_ship.y
-        distance = math.hypot(dx, dy)
-        if distance > 0:
+        distance_squared = dx * dx + dy * dy
+        if distance_squared > 0:
             move_speed = 5 # Adjust how fast it gets sucked in
-            self.player_ship.x += (dx / distance) * move_speed
-            self.player_ship.y += (dy / distance) * move_speed
+            step = move_speed / math.sqrt(distance_squared)
+            self.player_ship.x += dx * step
+            self.player_ship.y += dy * step
 
         # Generate electrocution particles
         if self.electrocuted_timer % 5 == 0: # Emit particles every few frames
@@ -472,10 +565,8 @@ class Game:
 
     def run_electrocuted_draw(self, game_surface):
         game_surface.fill(self.dark_purple) # Clear game_surface
-        for star in self.stars:
-            star.draw(game_surface)
-        self.draw_tracks(game_surface)
-        self.draw_black_hole(game_surface)
+        self.star_field.draw(game_surface)
+        self.draw_tracks_and_black_hole(game_surface)
         self.player_ship.draw(game_surface) # Draw the shrinking ship
         for effect in self.particle_effects:
             effect.draw(game_surface)
@@ -490,16 +581,22 @@ class Game:
             self.survival_timer -= 1
         
         # These should continue to update for ambiance
-        for star in self.stars:
-            star.update(self.player_ship.speed)
+        self.star_field.update(self.player_ship.speed)
         for boost in self.speed_boosts:
             boost.update()
         for power_up in self.power_ups:
             power_up.update()
+        # All boosts share one crystal graphic, as do all power-ups, so each is animated once here
+        if SpeedBoost.shared_crystal is not None:
+            SpeedBoost.shared_crystal.update()
+        if PowerUp.shared_crystal is not None:
+            PowerUp.shared_crystal.update()
+        self.update_obstacle_orbits()
         for obstacle in self.obstacles:
             obstacle.update()
-        # Remove inactive mines
-        self.obstacles = [o for o in self.obstacles if not (isinstance(o, BallLightningMine) and o.state == "done")]
+        # Remove inactive mines and finished explosions in one sweep
+        self.obstacles = [o for o in self.obstacles
+                          if not (isinstance(o, BallLightningMine) and o.state == "done") and not getattr(o, 'explosion_finished', False)]
         self.following_charge.update(self.player_ship.x, self.player_ship.y, self.player_ship.orbital_radius, self.player_ship.speed)
         for effect in self.particle_effects:
             effect.update()
@@ -567,12 +664,52 @@ class Game:
         if not self.following_charge.active and self.charge_spawn_timer >= 300:
             self.following_charge.activate()
 
+    def update_obstacle_orbits(self):
+        # Advance every orbiting asteroid in one NumPy pass instead of one Obstacle.update at a time
+        orbiting = [o for o in self.obstacles if not isinstance(o, BallLightningMine) and not getattr(o, 'exploded', False)]
+        if not orbiting:
+            return
+        count = len(orbiting)
+        radius = np.fromiter((o.radius for o in orbiting), dtype=np.float64, count=count)
+        target_radius = np.fromiter((o.target_radius for o in orbiting), dtype=np.float64, count=count)
+        entry_speed = np.fromiter((o.entry_speed for o in orbiting), dtype=np.float64, count=count)
+        entering = np.fromiter((o.entering_screen for o in orbiting), dtype=bool, count=count)
+        angle = np.fromiter((o.angle for o in orbiting), dtype=np.float64, count=count)
+        orbital_speed = np.fromiter((o.orbital_speed for o in orbiting), dtype=np.float64, count=count)
+
+        tick_obstacle_orbits(radius, target_radius, entry_speed, entering, angle, orbital_speed)
+
+        # Screen positions are worked out here once, for both the collision pass and the draw
+        center_x, center_y = self.center_x, self.center_y
+        cos, sin = math.cos, math.sin
+        for obstacle, r, e, a in zip(orbiting, radius.tolist(), entering.tolist(), angle.tolist()):
+            obstacle.radius = r
+            obstacle.entering_screen = e
+            obstacle.angle = a
+            obstacle.x = center_x + r * cos(a)
+            obstacle.y = center_y + r * sin(a)
+
     def handle_collisions(self):
+        # The ship only ever touches things on its own track, so everything else is skipped
+        # before any position math
+        ship_track = self.player_ship.track
+
+        # The ship doesn't move while collisions are resolved, so its position and radius are
+        # bound once into a specialised test instead of being looked up on every call
+        ship_x, ship_y, ship_radius = self.player_ship.x, self.player_ship.y, self.player_ship.radius
+
+        def ship_hits(radius, x, y, ship_x=ship_x, ship_y=ship_y, ship_radius=ship_radius):
+            dx = x - ship_x
+            dy = y - ship_y
+            radii_sum = ship_radius + radius
+            return dx * dx + dy * dy < radii_sum * radii_sum
+
         # Ship with Speed Boosts
         for boost in self.speed_boosts[:]:
-            boost_x = self.original_screen_width // 2 + boost.radius * math.cos(boost.angle)
-            boost_y = self.original_screen_height // 2 + boost.radius * math.sin(boost.angle)
-            if boost.track == self.player_ship.track and check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, boost.crystal_graphic.base_avg_radius, boost_x, boost_y):
+            if boost.track != ship_track:
+                continue
+            boost_x, boost_y = boost.x, boost.y
+            if ship_hits(boost.crystal_graphic.base_avg_radius, boost_x, boost_y):
                 if self.player_ship.collect_boost():
                     self.num_boosts_collected += 1
                 self.speed_boosts.remove(boost)
@@ -580,9 +717,10 @@ class Game:
 
         # Ship with Power Ups
         for power_up in self.power_ups[:]:
-            power_up_x = self.original_screen_width // 2 + power_up.radius * math.cos(power_up.angle)
-            power_up_y = self.original_screen_height // 2 + power_up.radius * math.sin(power_up.angle)
-            if power_up.track == self.player_ship.track and check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, power_up.powerup_radius, power_up_x, power_up_y):
+            if power_up.track != ship_track:
+                continue
+            power_up_x, power_up_y = power_up.x, power_up.y
+            if ship_hits(power_up.powerup_radius, power_up_x, power_up_y):
                 self.player_ship.collect_energy(30)
                 self.power_ups.remove(power_up)
                 self.particle_effects.append(PowerUpParticleSystem((power_up_x, power_up_y)))
@@ -593,10 +731,9 @@ class Game:
                 # The mine's explosion logic is self-contained in its own update() method.
                 # The main loop will remove it once its state is "done".
                 pass
-            else:
-                obstacle_x = self.original_screen_width // 2 + obstacle.radius * math.cos(obstacle.angle)
-                obstacle_y = self.original_screen_height // 2 + obstacle.radius * math.sin(obstacle.angle)
-                if obstacle.track == self.player_ship.track and check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, obstacle.obstacle_radius, obstacle_x, obstacle_y):
+            elif obstacle.track == ship_track:
+                obstacle_x, obstacle_y = obstacle.x, obstacle.y
+                if ship_hits(obstacle.obstacle_radius, obstacle_x, obstacle_y):
                     # Get color from the asteroid that was hit and create particles at its location
                     obstacle_color = obstacle.asteroid.get_color()
                     effect_position = (obstacle_x, obstacle_y)
@@ -615,7 +752,7 @@ class Game:
 
         # Ship with Following Charge
         if self.following_charge.active:
-            if check_collision(self.player_ship.radius, self.player_ship.x, self.player_ship.y, self.following_charge.radius, self.following_charge.position[0], self.following_charge.position[1]):
+            if ship_hits(self.following_charge.radius, self.following_charge.position[0], self.following_charge.position[1]):
                 if self.player_ship.shield_active:
                     self.following_charge.deactivate()
                     self.charge_spawn_timer = 0
@@ -623,11 +760,14 @@ class Game:
                 else:
                     self.state_manager.set_state("ELECTROCUTED")
 
-    def run_menu_draw(self, game_surface):
+    def draw_menu_background(self, game_surface):
+        # Shared by the menu, game over and high score screens, so the stars tick once per drawn frame
         game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation
-            star.draw(game_surface)
+        self.star_field.update(0.01)  # Slow constant rotation
+        self.star_field.draw(game_surface)
+
+    def run_menu_draw(self, game_surface):
+        self.draw_menu_background(game_surface)
         self.menu_asteroid.update()
         # For menu asteroid, we'll manually set its position and render it
         # as it's not part of the game loop's orbital mechanics.
@@ -803,21 +943,21 @@ class Game:
 
     def run_game_draw(self, game_surface):
 
+        # The star field sits between the background and the tracks, so the scene can't be cached
+        # as one surface; the background is opaque and display-format, so its blit is a plain copy
         game_surface.blit(self.background_image, (0, 0))
         # game_surface.blit(self.second_background_image, (self.second_bg_x, self.second_bg_y)) # Temporarily disabled
-        for star in self.stars:
-            star.draw(game_surface)
-        self.draw_tracks(game_surface)
-        self.draw_black_hole(game_surface)
+        self.star_field.draw(game_surface)
+        self.draw_tracks_and_black_hole(game_surface)
         if not self.player_ship.is_destroyed:
             self.player_ship.draw(game_surface)
         else:
             for piece in self.ship_debris:
                 piece.draw(game_surface)
-        for boost in self.speed_boosts:
-            boost.draw(game_surface)
-        for power_up in self.power_ups:
-            power_up.draw(game_surface)
+        # Boosts and power-ups are one image each, so they are drawn in a single batch
+        crystal_blits = [boost.get_blit() for boost in self.speed_boosts]
+        crystal_blits += [power_up.get_blit() for power_up in self.power_ups]
+        game_surface.blits(crystal_blits, doreturn=False)
         for obstacle in self.obstacles:
             obstacle.draw(game_surface)
         self.following_charge.draw(game_surface)
@@ -828,24 +968,38 @@ class Game:
         self.draw_game_ui(game_surface)
 
     def draw_game_ui(self, game_surface):
-        total_milliseconds = self.survival_timer * 1000 // self.fps
-        minutes = total_milliseconds // 60000
-        seconds = (total_milliseconds % 60000) // 1000
-        milliseconds = (total_milliseconds % 1000) // 10
-        timer_text_surface = self.timer_font.render(f"Time: {minutes:02}:{seconds:02}:{milliseconds:02}", True, self.light_green)
-        game_surface.blit(timer_text_surface, (40, 40))
-        dilation_text_surface = self.dilation_font.render(f"Dilation: {int(self.dilation_score)}", True, self.light_green)
-        game_surface.blit(dilation_text_surface, (40, 70))
-        energy_text_surface = self.timer_font.render(f"Energy: {int(self.player_ship.current_energy)}", True, self.light_green)
-        game_surface.blit(energy_text_surface, (40, 100))
-        structure_text_surface = self.timer_font.render(f"Hull Integrity: {int(self.player_ship.current_structure)}", True, self.light_green)
-        game_surface.blit(structure_text_surface, (40, 130))
+        total_seconds, hundredths = divmod(max(0, int(self.survival_timer * 100 // self.fps)), 100)
+        # The "Time: MM:SS:" label only changes once a second, so it is only formatted then
+        if total_seconds != self.timer_label_seconds:
+            minutes, seconds = divmod(total_seconds, 60)
+            self.timer_label = f"Time: {minutes:02}:{seconds:02}:"
+            self.timer_label_seconds = total_seconds
+        # Bound once; every HUD line goes through the same cache and font
+        render = self.render_hud_text
+        timer_font = self.timer_font
+        ship = self.player_ship
+
+        # The hundredths change every frame, so they are a separate line from the minutes and
+        # seconds, which only change once a second
+        timer_text_surface = render("timer", self.timer_label, timer_font)
+        game_surface.blits((
+            (timer_text_surface, (40, 40)),
+            (render("timer_hundredths", TWO_DIGIT_LABELS[hundredths], timer_font), (40 + timer_text_surface.get_width(), 40)),
+            (render("dilation", f"Dilation: {int(self.dilation_score)}", self.dilation_font), (40, 70)),
+            (render("energy", f"Energy: {int(ship.current_energy)}", timer_font), (40, 100)),
+            (render("structure", f"Hull Integrity: {int(ship.current_structure)}", timer_font), (40, 130)),
+        ), doreturn=False)
+
+    def render_hud_text(self, line, text, font):
+        cached = self.hud_text_surfaces.get(line)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        text_surface = font.render(text, True, self.light_green).convert_alpha()
+        self.hud_text_surfaces[line] = (text, text_surface)
+        return text_surface
 
     def run_game_over_draw(self, game_surface):
-        game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation for the background
-            star.draw(game_surface)
+        self.draw_menu_background(game_surface)
 
         # --- Jitter Effect Logic ---
         self.jitter_timer -= 1
@@ -854,38 +1008,41 @@ class Game:
             self.jitter_sequence = []
             num_flashes = random.randint(6, 12)
             for _ in range(num_flashes):
-                scale = random.uniform(0.95, 1.05)
-                angle = random.uniform(-5, 5)
-                self.jitter_sequence.append((scale, angle))
+                self.jitter_sequence.append(random.randrange(GAME_OVER_JITTER_VARIANTS))
             self.jitter_flash_timer = self.jitter_flash_duration
 
         # --- Drawing Logic ---
-        img_to_draw = self.game_over_background_image
+        img_to_draw, img_pos = self.game_over_background_image, self.game_over_background_pos
         if self.jitter_active:
             self.jitter_flash_timer -= 1
-            if self.current_jitter_surface is None:
+            if self.current_jitter is None:
                 # Get the next jitter effect from the sequence
                 if self.jitter_sequence:
-                    scale, angle = self.jitter_sequence.pop(0)
-                    # Use rotozoom for combined rotation and scaling
-                    self.current_jitter_surface = pygame.transform.rotozoom(self.game_over_background_image, angle, scale)
+                    variant = self.jitter_sequence.pop(0)
+                    if self.jitter_variants[variant] is None:
+                        scale = random.uniform(0.95, 1.05)
+                        angle = random.uniform(-5, 5)
+                        # Use rotozoom for combined rotation and scaling
+                        jitter_surface = pygame.transform.rotozoom(self.game_over_background_image, angle, scale)
+                        jitter_pos = jitter_surface.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2)).topleft
+                        self.jitter_variants[variant] = (jitter_surface, jitter_pos)
+                    self.current_jitter = self.jitter_variants[variant]
                 else:
                     # Sequence is over
                     self.jitter_active = False
                     self.jitter_timer = random.randint(1, 2) * self.fps
-                    self.current_jitter_surface = None
+                    self.current_jitter = None
 
-            if self.current_jitter_surface:
-                img_to_draw = self.current_jitter_surface
+            if self.current_jitter:
+                img_to_draw, img_pos = self.current_jitter
 
             if self.jitter_flash_timer <= 0:
                 # Reset for the next flash in the sequence
-                self.current_jitter_surface = None
+                self.current_jitter = None
                 self.jitter_flash_timer = self.jitter_flash_duration
 
-        # Center and draw the appropriate image
-        img_rect = img_to_draw.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
-        game_surface.blit(img_to_draw, img_rect.topleft)
+        # Draw the appropriate image, already centered
+        game_surface.blit(img_to_draw, img_pos)
 
 
         # --- Text with Shadows ---
@@ -908,9 +1065,8 @@ class Game:
 
     """def run_game_over_draw(self, game_surface):
         game_surface.fill(self.black)
-        for star in self.stars:
-            star.update(0.01) # Slow constant rotation for the background
-            star.draw(game_surface)
+        self.star_field.update(0.01) # Slow constant rotation for the background
+        self.star_field.draw(game_surface)
 
         # Center and draw the main image
         img_rect = self.game_over_background_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
@@ -935,95 +1091,13 @@ class Game:
         game_surface.blit(self.quit_text, self.quit_rect)"""
 
     def run_escaped_draw(self, game_surface):
-        # Calculate final score
-        if self.dilation_score > 0:
-            processed_dilation = 1
-        else:
-            processed_dilation = abs(self.dilation_score)
-        final_score = processed_dilation * self.num_boosts_collected * 100
-
-        # Determine the high score threshold dynamically
-        current_high_scores = load_high_scores()
-        if len(current_high_scores) < 10:  # If fewer than 10 scores, any score is a high score
-            dynamic_threshold = 0
-        else:
-            # Get the 10th score (lowest in top 10) and set threshold to 1 above it
-            dynamic_threshold = current_high_scores[9]['score'] + 1
-
-        print(f"Final Score: {final_score}, Dynamic Threshold: {dynamic_threshold}")
-
-        # Check if score qualifies for high score entry
-        if final_score >= dynamic_threshold:
-            self.state_manager.set_state("ESCAPED_INPUT_NAME")
-            return # Exit to let the new state handle drawing
-
-        # If not qualifying, just display score and options
-        self.save_score_if_needed() # Save score even if not high score, but without name
-        game_surface.blit(self.escaped_splash_image, (0, 0))
-        # Text with Shadows
-        shadow_color = (0, 0, 0) # Black shadow
-
-        # Escaped Message Text
-        shadow_escaped_message_text = self.escaped_font_large.render("YOU ESCAPED THE BLACK HOLE!", True, shadow_color)
-        game_surface.blit(shadow_escaped_message_text, (self.escaped_rect.x + 3, self.escaped_rect.y + 3))
-        game_surface.blit(self.escaped_message_text, self.escaped_rect)
-
-        # Final Score Label
-        final_score_label_text = self.escaped_font.render("Final Score:", True, self.light_green)
-        final_score_label_rect = final_score_label_text.get_rect(center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2))
-        shadow_final_score_label_text = self.escaped_font.render("Final Score:", True, shadow_color)
-        game_surface.blit(shadow_final_score_label_text, (final_score_label_rect.x + 3, final_score_label_rect.y + 3))
-        game_surface.blit(final_score_label_text, final_score_label_rect)
-
-        # Final Score Value
-        final_score_value_text = self.escaped_font.render(f"{int(final_score):,}", True, self.light_green)
-        final_score_value_rect = final_score_value_text.get_rect(midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2))
-        shadow_final_score_value_text = self.escaped_font.render(f"{int(final_score):,}", True, shadow_color)
-        game_surface.blit(shadow_final_score_value_text, (final_score_value_rect.x + 3, final_score_value_rect.y + 3))
-        game_surface.blit(final_score_value_text, final_score_value_rect)
-
-        # Restart Text
-        shadow_restart_text_escaped = self.escaped_font_small.render("Press 'ENTER' to try again", True, shadow_color)
-        game_surface.blit(shadow_restart_text_escaped, (self.restart_rect_escaped.x + 3, self.restart_rect_escaped.y + 3))
-        game_surface.blit(self.restart_text_escaped, self.restart_rect_escaped)
-
-        # Quit Text
-        shadow_quit_text_escaped = self.escaped_font_small.render("Press 'Q' to quit", True, shadow_color)
-        game_surface.blit(shadow_quit_text_escaped, (self.quit_rect_escaped.x + 3, self.quit_rect_escaped.y + 3))
-        game_surface.blit(self.quit_text_escaped, self.quit_rect_escaped)
+        # Only reached when the score didn't qualify for name entry (see on_enter_escaped_state),
+        # which also laid out the background and text
+        game_surface.blits(self.escaped_static_blits, doreturn=False)
 
     def run_escaped_input_name_draw(self, game_surface):
-        game_surface.blit(self.escaped_splash_image, (0, 0))
-        # Text with Shadows
-        shadow_color = (0, 0, 0) # Black shadow
-
-        # Escaped Message Text
-        shadow_escaped_message_text = self.escaped_font_large.render("YOU ESCAPED THE BLACK HOLE!", True, shadow_color)
-        game_surface.blit(shadow_escaped_message_text, (self.escaped_rect.x + 3, self.escaped_rect.y + 3))
-        game_surface.blit(self.escaped_message_text, self.escaped_rect)
-
-        final_score = (abs(self.dilation_score) if self.dilation_score < 0 else 1) * self.num_boosts_collected * 100
-
-        # Final Score Label
-        final_score_label_text = self.escaped_font.render("Final Score:", True, self.light_green)
-        final_score_label_rect = final_score_label_text.get_rect(center=(self.original_screen_width // 2 - 100, self.original_screen_height // 2 - 50))
-        shadow_final_score_label_text = self.escaped_font.render("Final Score:", True, shadow_color)
-        game_surface.blit(shadow_final_score_label_text, (final_score_label_rect.x + 3, final_score_label_rect.y + 3))
-        game_surface.blit(final_score_label_text, final_score_label_rect)
-
-        # Final Score Value
-        final_score_value_text = self.escaped_font.render(f"{int(final_score):,}", True, self.light_green)
-        final_score_value_rect = final_score_value_text.get_rect(midleft=(self.original_screen_width // 2 + 40, self.original_screen_height // 2 - 50))
-        shadow_final_score_value_text = self.escaped_font.render(f"{int(final_score):,}", True, shadow_color)
-        game_surface.blit(shadow_final_score_value_text, (final_score_value_rect.x + 3, final_score_value_rect.y + 3))
-        game_surface.blit(final_score_value_text, final_score_value_rect)
-
-        # Prompt Text
-        prompt_text = self.escaped_font_small.render("Enter your name (up to 8 letters):", True, self.white)
-        prompt_rect = prompt_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 50))
-        shadow_prompt_text = self.escaped_font_small.render("Enter your name (up to 8 letters):", True, shadow_color)
-        game_surface.blit(shadow_prompt_text, (prompt_rect.x + 3, prompt_rect.y + 3))
-        game_surface.blit(prompt_text, prompt_rect)
+        # Background and fixed text were laid out once in on_enter_escaped_input_name_state
+        game_surface.blits(self.input_name_static_blits, doreturn=False)
 
         # Blinking cursor
         self.name_input_cursor_timer += 1
@@ -1035,18 +1109,7 @@ class Game:
             display_name += "_"
 
         # Name Text
-        name_text = self.escaped_font.render(display_name, True, self.light_green)
-        name_rect = name_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 100))
-        shadow_name_text = self.escaped_font.render(display_name, True, shadow_color)
-        game_surface.blit(shadow_name_text, (name_rect.x + 3, name_rect.y + 3))
-        game_surface.blit(name_text, name_rect)
-
-        # Instructions Text
-        instructions_text = self.escaped_font_small.render("Press ENTER to save, ESC to skip", True, self.white)
-        instructions_rect = instructions_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2 + 150))
-        shadow_instructions_text = self.escaped_font_small.render("Press ENTER to save, ESC to skip", True, shadow_color)
-        game_surface.blit(shadow_instructions_text, (instructions_rect.x + 3, instructions_rect.y + 3))
-        game_surface.blit(instructions_text, instructions_rect)
+        game_surface.blits(self.shadowed_text_blits(display_name, self.escaped_font, self.light_green, center=(self.original_screen_width // 2, self.original_screen_height // 2 + 100)), doreturn=False)
 
     def run_pause_menu_draw(self, game_surface):
         # Draw the game in the background
@@ -1094,10 +1157,7 @@ class Game:
         game_surface.blit(self.quit_pause_text, self.quit_pause_rect)
 
     def run_high_scores_draw(self, game_surface):
-        game_surface.blit(self.background_image, (0, 0))
-        for star in self.stars:
-            star.update(0.01)  # Slow constant rotation
-            star.draw(game_surface)
+        self.draw_menu_background(game_surface)
 
         # Draw the large crystal in the background
         self.menu_crystal_large.update()
@@ -1105,27 +1165,32 @@ class Game:
         crystal_rect = crystal_image.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 2))
         game_surface.blit(crystal_image, crystal_rect)
 
-        # Draw semi-transparent black box
+        # The score box and footer only change when the score list does, which is on state entry
+        game_surface.blits(self.high_scores_blits, doreturn=False)
+
+    def build_high_scores_blits(self):
+        # Semi-transparent black box
         box_width = int(self.original_screen_width * 0.6)
         box_height = int(self.original_screen_height * 0.7)
         box_x = (self.original_screen_width - box_width) // 2
         box_y = self.original_screen_height // 8 - 50 # Start slightly above title, moved up by 30 pixels
-        
-        alpha_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        alpha_surface.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
-        game_surface.blit(alpha_surface, (box_x, box_y))
 
+        panel = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 100)) # Black with 100 alpha (out of 255)
+
+        # Everything below is laid out in screen coordinates, then shifted into the box
+        center_x = self.original_screen_width // 2 - box_x
         high_scores = self.current_high_scores
 
         title_text = self.title_font.render("HIGH SCORES", True, self.light_green)
-        title_rect = title_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height // 8))
-        game_surface.blit(title_text, title_rect)
+        title_rect = title_text.get_rect(center=(center_x, self.original_screen_height // 8 - box_y))
+        panel.blit(title_text, title_rect)
 
-        y_offset = self.original_screen_height // 4
+        y_offset = self.original_screen_height // 4 - box_y
         if not high_scores:
             no_scores_text = self.menu_item_font.render("No scores yet. Play a game to set one!", True, self.white)
-            no_scores_rect = no_scores_text.get_rect(center=(self.original_screen_width // 2, y_offset + 50))
-            game_surface.blit(no_scores_text, no_scores_rect)
+            no_scores_rect = no_scores_text.get_rect(center=(center_x, y_offset + 50))
+            panel.blit(no_scores_text, no_scores_rect)
         else:
             header_name_text = self.escaped_font.render("NAME", True, self.white)
             header_score_text = self.escaped_font.render("SCORE", True, self.white)
@@ -1133,77 +1198,96 @@ class Game:
             # Calculate positions to center them over their respective columns
             # The score list is centered at original_screen_width // 2
             # The name list is to the left of it, with 15 characters padding
-            name_x_pos = (self.original_screen_width // 2) - (header_name_text.get_width() // 2) - (self.menu_item_font.size(" ")[0] * 10) # 10 spaces for padding
-            score_x_pos = (self.original_screen_width // 2) + (header_score_text.get_width() // 2) + (self.menu_item_font.size(" ")[0] * 10) # 10 spaces for padding
+            column_padding = self.menu_item_font.size(" ")[0] * 10 # 10 spaces for padding
+            name_x_pos = center_x - (header_name_text.get_width() // 2) - column_padding
+            score_x_pos = center_x + (header_score_text.get_width() // 2) + column_padding
 
-            game_surface.blit(header_name_text, (name_x_pos, y_offset - 20))
-            game_surface.blit(header_score_text, (score_x_pos - header_score_text.get_width(), y_offset - 20)) # Adjust score_x_pos to blit from left
+            panel.blit(header_name_text, (name_x_pos, y_offset - 20))
+            panel.blit(header_score_text, (score_x_pos - header_score_text.get_width(), y_offset - 20)) # Adjust score_x_pos to blit from left
             y_offset += 40
 
             for i, entry in enumerate(high_scores[:10]): # Display top 10 scores
                 player_name = entry.get('name', '---') # Safely get name, default to '---' if not present
                 score_line = f"{player_name:<15} {entry['score']:,}"
                 score_text = self.menu_item_font.render(score_line, True, self.white)
-                score_rect = score_text.get_rect(center=(self.original_screen_width // 2, y_offset + i * 35))
+                score_rect = score_text.get_rect(center=(center_x, y_offset + i * 35))
                 shadow_score_text = self.menu_item_font.render(score_line, True, (0,0,0)) # Black shadow
-                game_surface.blit(shadow_score_text, (score_rect.x + 3, score_rect.y + 3))
-                game_surface.blit(score_text, score_rect)
-        
+                panel.blit(shadow_score_text, (score_rect.x + 3, score_rect.y + 3))
+                panel.blit(score_text, score_rect)
+
         return_text = self.start_font.render("Press ESC to return to Menu", True, self.light_green)
         return_rect = return_text.get_rect(center=(self.original_screen_width // 2, self.original_screen_height * 0.9))
-        game_surface.blit(return_text, return_rect)
+        return [(panel.convert_alpha(), (box_x, box_y)), (return_text, return_rect)]
 
     def save_score_if_needed(self):
         if not self.score_saved_for_current_game:
-            time_survived_ms = pygame.time.get_ticks() - self.survival_timer_start_time
-            if self.dilation_score > 0:
-                processed_dilation = 1
-            else:
-                processed_dilation = abs(self.dilation_score)
-            final_score = processed_dilation * self.num_boosts_collected * 100
-            save_final_score(self.player_name_input, final_score)
+            save_final_score(self.player_name_input, self.final_score)
             self.score_saved_for_current_game = True
 
     def draw_paragraph(self, surface, text, font, color, rect, shadow_color=None):
         """Draws a paragraph of text onto a given surface within a specified rectangle."""
+        # The wrapped and rendered lines only depend on these, so they are built once
+        cache_key = (id(font), text, color, shadow_color, rect.width)
+        rendered_lines = self.paragraph_cache.get(cache_key)
+        if rendered_lines is None:
+            rendered_lines = []
+            for line in self.wrap_paragraph(text, font, rect.width):
+                shadow_surface = font.render(line, True, shadow_color) if shadow_color else None
+                rendered_lines.append((shadow_surface, font.render(line, True, color)))
+            self.paragraph_cache[cache_key] = rendered_lines
+
+        y_offset = rect.top
+        line_spacing = 5
+        for shadow_surface, line_surface in rendered_lines:
+            if shadow_surface is not None:
+                surface.blit(shadow_surface, (rect.left + 2, y_offset + 2))
+            surface.blit(line_surface, (rect.left, y_offset))
+            y_offset += line_surface.get_height() + line_spacing
+
+    def wrap_paragraph(self, text, font, max_width):
         words = text.split('\n')
         lines = []
+        space_width = font.size(" ")[0]
         for line in words:
             words_in_line = line.split(' ')
             current_line = []
             line_width = 0
             for word in words_in_line:
-                word_surface = font.render(word, True, color)
-                word_width = word_surface.get_width()
-                if line_width + word_width < rect.width:
+                word_width = font.size(word)[0] # Measure only; no need to rasterize the word
+                if line_width + word_width < max_width:
                     current_line.append(word)
-                    line_width += word_width + font.size(" ")[0]
+                    line_width += word_width + space_width
                 else:
                     lines.append(" ".join(current_line))
                     current_line = [word]
-                    line_width = word_width + font.size(" ")[0]
+                    line_width = word_width + space_width
             lines.append(" ".join(current_line))
-
-        y_offset = rect.top
-        line_spacing = 5
-        for line in lines:
-            if shadow_color:
-                shadow_surface = font.render(line, True, shadow_color)
-                surface.blit(shadow_surface, (rect.left + 2, y_offset + 2))
-            line_surface = font.render(line, True, color)
-            surface.blit(line_surface, (rect.left, y_offset))
-            y_offset += line_surface.get_height() + line_spacing
+        return lines
             
-    def draw_tracks(self, game_surface, camera_x=0, camera_y=0):
-        for i in range(3):
-            center_radius = self.player_ship.orbital_radius_base + i * self.player_ship.track_width * self.player_ship.track_spacing_multiplier
-            inner_radius = center_radius - self.player_ship.track_width // 2
-            outer_radius = center_radius + self.player_ship.track_width // 2
-            pygame.draw.circle(game_surface, self.track_color, (self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y), int(inner_radius), 1)
-            pygame.draw.circle(game_surface, self.track_color, (self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y), int(outer_radius), 1)
-
-    def draw_black_hole(self, game_surface, camera_x=0, camera_y=0):
-        pygame.draw.circle(game_surface, self.black, (self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y), 50)
+    def draw_tracks_and_black_hole(self, game_surface, camera_x=0, camera_y=0):
+        # The track rings and the hole only depend on the ship's track layout, so rasterize them once and blit
+        ship = self.player_ship
+        tracks_key = (ship.track_radii, ship.track_width)
+        if tracks_key != self.tracks_surface_key:
+            self.tracks_surface = self.build_tracks_surface()
+            self.tracks_surface_key = tracks_key
+        tracks_rect = self.tracks_surface.get_rect(center=(self.original_screen_width // 2 - camera_x, self.original_screen_height // 2 - camera_y))
+        game_surface.blit(self.tracks_surface, tracks_rect)
+
+    def build_tracks_surface(self):
+        half_width = self.player_ship.track_width // 2
+        max_outer_radius = self.player_ship.track_radii[-1] + half_width
+        size = 2 * int(max_outer_radius) + 2
+        tracks_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (size // 2, size // 2)
+        for center_radius in self.player_ship.track_radii:
+            inner_radius = center_radius - half_width
+            outer_radius = center_radius + half_width
+            pygame.draw.circle(tracks_surface, self.track_color, center, int(inner_radius), 1)
+            pygame.draw.circle(tracks_surface, self.track_color, center, int(outer_radius), 1)
+        # The hole sits inside the innermost ring and is always drawn right after the tracks
+        pygame.draw.circle(tracks_surface, self.black, center, 50)
+        return tracks_surface.convert_alpha()
 
     def run(self):
         while True:
@@ -1238,63 +1322,89 @@ class Game:
                 self.state_manager.draw(self.game_surface)
 
             # Scale the game_surface to the current screen size and blit it
-            scaled_surface = pygame.transform.scale(self.game_surface, (int(self.original_screen_width * self.scale_factor), int(self.original_screen_height * self.scale_factor)))
-            self.screen.blit(scaled_surface, (self.offset_x, self.offset_y))
+            scaled_size = (int(self.original_screen_width * self.scale_factor), int(self.original_screen_height * self.scale_factor))
+            if scaled_size == (self.original_screen_width, self.original_screen_height):
+                self.screen.blit(self.game_surface, (self.offset_x, self.offset_y))
+            else:
+                # Scale into a reused destination surface; only reallocate when the window size changes
+                if scaled_size != self.scaled_size:
+                    self.scaled_surface = pygame.Surface(scaled_size).convert()
+                    self.scaled_size = scaled_size
+                pygame.transform.scale(self.game_surface, scaled_size, self.scaled_surface)
+                self.screen.blit(self.scaled_surface, (self.offset_x, self.offset_y))
 
             pygame.display.flip()
             self.clock.tick(self.fps)
 
 # --- Entity Classes (Need to be adapted to take the game object) ---
 class SpeedBoost:
+    # Crystal graphic shown by every boost, created with the first one
+    shared_crystal = None
+
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
+        self.radius = self.game.player_ship.track_radii[track]
         self.angle = random.uniform(0, 2 * math.pi)
         self.lifetime = random.randint(240, 360)
-        self.crystal_graphic = Crystal(0, 0, base_avg_radius=15) # Initialize Crystal graphic
+        # Boosts don't orbit, so their screen position is fixed for their whole lifetime
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
+        self.pixel_x = int(round(self.x))
+        self.pixel_y = int(round(self.y))
+        if SpeedBoost.shared_crystal is None:
+            SpeedBoost.shared_crystal = Crystal(0, 0, base_avg_radius=15)
+        self.crystal_graphic = SpeedBoost.shared_crystal
+
+    def get_blit(self, camera_x=0, camera_y=0):
+        """Returns the (image, position) pair that draws this entity, for batching with Surface.blits."""
+        crystal_image = self.crystal_graphic.get_current_image()
+        return crystal_image, (self.pixel_x - camera_x - crystal_image.get_width() // 2, self.pixel_y - camera_y - crystal_image.get_height() // 2)
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        
-        crystal_image = self.crystal_graphic.get_current_image()
-        crystal_rect = crystal_image.get_rect(center=(int(round(x)), int(round(y))))
-        game_surface.blit(crystal_image, crystal_rect)
+        game_surface.blit(*self.get_blit(camera_x, camera_y))
 
     def update(self):
         self.lifetime -= 1
-        self.crystal_graphic.update() # Update the crystal graphic
 
 class PowerUp:
+    # Yellow crystal graphic shown by every power-up, created with the first one
+    shared_crystal = None
+
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
+        self.radius = self.game.player_ship.track_radii[track]
         self.angle = random.uniform(0, 2 * math.pi)
         self.lifetime = random.randint(180, 300)
-        self.crystal_graphic = Crystal(0, 0, base_avg_radius=15)
-        self.crystal_graphic.color_key = 'yellow'
-        self.crystal_graphic.base_color = CRYSTAL_COLORS[self.crystal_graphic.color_key]
+        # Power-ups don't orbit either
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
+        self.pixel_x = int(round(self.x))
+        self.pixel_y = int(round(self.y))
+        if PowerUp.shared_crystal is None:
+            PowerUp.shared_crystal = Crystal(0, 0, base_avg_radius=15)
+            PowerUp.shared_crystal.color_key = 'yellow'
+            PowerUp.shared_crystal.base_color = CRYSTAL_COLORS[PowerUp.shared_crystal.color_key]
+        self.crystal_graphic = PowerUp.shared_crystal
         self.powerup_radius = self.crystal_graphic.base_avg_radius
 
-    def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        
+    def get_blit(self, camera_x=0, camera_y=0):
+        """Returns the (image, position) pair that draws this entity, for batching with Surface.blits."""
         crystal_image = self.crystal_graphic.get_current_image()
-        crystal_rect = crystal_image.get_rect(center=(int(round(x)), int(round(y))))
-        game_surface.blit(crystal_image, crystal_rect)
+        return crystal_image, (self.pixel_x - camera_x - crystal_image.get_width() // 2, self.pixel_y - camera_y - crystal_image.get_height() // 2)
+
+    def draw(self, game_surface, camera_x=0, camera_y=0):
+        game_surface.blit(*self.get_blit(camera_x, camera_y))
 
     def update(self):
         self.lifetime -= 1
-        self.crystal_graphic.update()
 
 class Obstacle:
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.target_radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
+        self.target_radius = self.game.player_ship.track_radii[track]
         self.angle = random.uniform(0, 2 * math.pi)
         self.entering_screen = True
         self.entry_speed = random.uniform(5, 10)
@@ -1304,6 +1414,9 @@ class Obstacle:
             self.radius = random.uniform(0, self.game.player_ship.orbital_radius_base - 50)
         else:
             self.radius = random.uniform(self.target_radius + 100, self.game.screen_width * 0.75)
+        # Screen position, refreshed each frame by Game.update_obstacle_orbits
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
 
         initial_asteroid_size = 20
         available_asteroid_types = list(ASTEROID_COLORS.keys())
@@ -1318,21 +1431,14 @@ class Obstacle:
         # Initialize Asteroid3D with a dummy z-coordinate for now, will be updated dynamically
         self.asteroid = Asteroid3D(0, 0, 0, asteroid_type=random_asteroid_type, new_outer_radius=initial_asteroid_size)
         self.obstacle_radius = self.asteroid.outer_radius # Use outer_radius from Asteroid3D
+        # Depth depends only on the track: the outer track (track 2) is further back (larger Z),
+        # the inner track (track 0) closer. x/y follow the orbit and are synced in update().
+        self.asteroid.position[0] = self.x
+        self.asteroid.position[1] = self.y
+        self.asteroid.position[2] = 100 + (self.track * 50) # 100 for track 0, 150 for track 1, 200 for track 2
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
-        # Calculate the 3D position of the asteroid
-        # We'll use the track radius for X and Y, and a fixed Z for now
-        # The Z position will influence perceived size and perspective
-        asteroid_3d_x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle)
-        asteroid_3d_y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle)
-        # Adjust Z based on track to give a sense of depth
-        # Outer track (track 2) is further back (larger Z), inner track (track 0) is closer (smaller Z)
-        asteroid_3d_z = 100 + (self.track * 50) # Example: 100 for track 0, 150 for track 1, 200 for track 2
-
-        self.asteroid.position[0] = asteroid_3d_x
-        self.asteroid.position[1] = asteroid_3d_y
-        self.asteroid.position[2] = asteroid_3d_z # Set the Z position
-
+        # The asteroid's 3D position was synced with the orbit in update()
         # Get transformed vertices from the Asteroid3D object
         transformed_vertices = self.asteroid.get_transformed_vertices()
         asteroid_color = self.asteroid.get_color()
@@ -1406,27 +1512,20 @@ class Obstacle:
         
 
     def update(self):
-        if self.entering_screen:
-            if self.radius < self.target_radius:
-                self.radius += self.entry_speed
-                if self.radius >= self.target_radius:
-                    self.entering_screen = False
-            else:
-                self.radius -= self.entry_speed
-                if self.radius <= self.target_radius:
-                    self.entering_screen = False
-        else:
-            self.angle += self.orbital_speed
-            if self.angle > 2 * math.pi:
-                self.angle -= 2 * math.pi
-            elif self.angle < 0:
-                self.angle += 2 * math.pi
+        # Entry/orbit movement is advanced for all obstacles at once in Game.update_obstacle_orbits
         self.asteroid.update()
-        # The asteroid's 3D position is set in the draw method based on its orbital parameters.
-        # The Asteroid3D object itself handles its internal rotation.
-        # No need to set x and y here, as they are derived from the orbital parameters in draw.
+        # self.x/self.y were already advanced by Game.update_obstacle_orbits this frame; the
+        # Asteroid3D object itself handles its internal rotation
+        self.asteroid.position[0] = self.x
+        self.asteroid.position[1] = self.y
 
 class ExplodingObstacle(Obstacle):
+    # Glow ramps keyed by (bright, dark, steps); the glow only ever takes these values
+    color_ramp_cache = {}
+    # Explosion frames depend only on radius, duration and color, so they are rendered once
+    # per (radius, duration, color) and shared by every instance
+    explosion_frames_cache = {}
+
     def __init__(self, track, game):
         super().__init__(track, game)
         custom_asteroid_size = 25
@@ -1440,34 +1539,68 @@ class ExplodingObstacle(Obstacle):
         self.color_bright = (255, 100, 100)
         self.color_dark = self.game.red
         self.glow_speed = 0.05
-        self.glow_value = 0
+        self.color_ramp = self.get_color_ramp(self.color_bright, self.color_dark, round(1 / self.glow_speed))
+        self.glow_index = 0
         self.glow_direction = 1
+        self.color = self.color_ramp[0]
         self.explosion_radius = 180
         self.explosion_duration = 30
         self.exploded = False
         self.explosion_timer = 0
+        self.explosion_finished = False # Swept out of game.obstacles by Game.update
         self.explosion_color = (255, 165, 0)
-        self.x = self.calculate_x()
-        self.y = self.calculate_y()
-
-    def calculate_x(self):
-        return self.game.original_screen_width // 2 + self.radius * math.cos(self.angle)
-
-    def calculate_y(self):
-        return self.game.original_screen_height // 2 + self.radius * math.sin(self.angle)
 
-    def update_position(self):
-        self.x = self.calculate_x()
-        self.y = self.calculate_y()
-        self.asteroid.x = self.x
-        self.asteroid.y = self.y
-
-    
+    @classmethod
+    def get_color_ramp(cls, color_bright, color_dark, steps):
+        key = (color_bright, color_dark, steps)
+        ramp = cls.color_ramp_cache.get(key)
+        if ramp is None:
+            ramp = []
+            for i in range(steps + 1):
+                glow_value = i / steps
+                r = int(color_bright[0] + (color_dark[0] - color_bright[0]) * glow_value)
+                g = int(color_bright[1] + (color_dark[1] - color_bright[1]) * glow_value)
+                b = int(color_bright[2] + (color_dark[2] - color_bright[2]) * glow_value)
+                ramp.append((r, g, b))
+            cls.color_ramp_cache[key] = ramp
+        return ramp
+
+    @classmethod
+    def get_explosion_frames(cls, explosion_radius, explosion_duration, explosion_color):
+        # One pre-drawn disc per frame of the animation, indexed by explosion_timer
+        key = (explosion_radius, explosion_duration, explosion_color)
+        frames = cls.explosion_frames_cache.get(key)
+        if frames is None:
+            frames = []
+            for timer in range(explosion_duration):
+                radius = int(explosion_radius * timer / explosion_duration + 0.5)
+                if radius <= 0:
+                    frames.append(None) # Nothing to draw yet
+                    continue
+                explosion_surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+                pygame.draw.circle(explosion_surf, explosion_color, (radius, radius), radius)
+                frames.append(explosion_surf.convert_alpha())
+            cls.explosion_frames_cache[key] = frames
+        return frames
+
+    def update_color(self):
+        # Ping-pong along the precomputed ramp between bright and dark
+        self.glow_index += self.glow_direction
+        if self.glow_index >= len(self.color_ramp) - 1:
+            self.glow_index = len(self.color_ramp) - 1
+            self.glow_direction = -1
+        elif self.glow_index <= 0:
+            self.glow_index = 0
+            self.glow_direction = 1
+        self.color = self.color_ramp[self.glow_index]
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
         if self.exploded:
-            current_radius = int(round(self.explosion_radius * (self.explosion_timer / self.explosion_duration)))
-            pygame.draw.circle(game_surface, self.explosion_color, (int(round(self.x - camera_x)), int(round(self.y - camera_y))), current_radius)
+            frames = self.get_explosion_frames(self.explosion_radius, self.explosion_duration, self.explosion_color)
+            explosion_surf = frames[min(self.explosion_timer, self.explosion_duration - 1)]
+            if explosion_surf is not None:
+                radius = explosion_surf.get_width() // 2
+                game_surface.blit(explosion_surf, (round(self.x - camera_x) - radius, round(self.y - camera_y) - radius))
         else:
             super().draw(game_surface, camera_x, camera_y)
 
@@ -1475,12 +1608,10 @@ class ExplodingObstacle(Obstacle):
         if not self.exploded:
             super().update()
             self.update_color()
-            self.update_position()
         else:
             self.explosion_timer += 1
             if self.explosion_timer >= self.explosion_duration:
-                if self in self.game.obstacles:
-                    self.game.obstacles.remove(self)
+                self.explosion_finished = True
 
 class FollowingCharge:
     def __init__(self):
@@ -1517,50 +1648,62 @@ class FollowingCharge:
             self.current_speed_multiplier += self.speed_increase_rate
             dx = ship_x - self.position[0]
             dy = ship_y - self.position[1]
-            distance = math.hypot(dx, dy)
-            if distance > 0:
-                self.position[0] += (dx / distance) * charge_speed
-                self.position[1] += (dy / distance) * charge_speed
+            distance_squared = dx * dx + dy * dy
+            if distance_squared > 0:
+                step = charge_speed / math.sqrt(distance_squared) # Normalize and scale in one factor
+                self.position[0] += dx * step
+                self.position[1] += dy * step
         self.ball_lightning_graphic.update()
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
         if self.active:
-            self.ball_lightning_graphic.set_position(int(self.position[0]), int(self.position[1]))
+            pixel_x = int(self.position[0])
+            pixel_y = int(self.position[1])
+            self.ball_lightning_graphic.set_position(pixel_x, pixel_y)
             lightning_image = self.ball_lightning_graphic.get_current_image()
-            image_rect = lightning_image.get_rect(center=(int(self.position[0] - camera_x), int(self.position[1] - camera_y)))
-            game_surface.blit(lightning_image, image_rect)
+            game_surface.blit(lightning_image, (pixel_x - camera_x - lightning_image.get_width() // 2, pixel_y - camera_y - lightning_image.get_height() // 2))
 
-class Star:
-    def __init__(self, screen_width, screen_height, speed_multiplier):
+class StarField:
+    # All stars live in NumPy arrays (one entry per star) and are rasterized into a single
+    # alpha layer each frame, so the whole field costs one blit instead of one per star.
+    def __init__(self, screen_width, screen_height, layers):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.speed_multiplier = speed_multiplier # New attribute for parallax effect
-        self.radius = random.uniform(0, max(self.screen_width, self.screen_height) / 2)
-        self.angle = random.uniform(0, 2 * math.pi)
-        self.size = random.randint(1, 3)
-        self.color = (255, 255, 255)
-        self.alpha = random.randint(50, 255)
-        self.alpha_change = random.choice([-5, 5])
-        self.surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.surface.fill(self.color)
-        self.surface.set_alpha(self.alpha)
+        self.speed_multiplier = np.concatenate([np.full(count, multiplier) for multiplier, count in layers]) # Parallax per layer
+        num_stars = len(self.speed_multiplier)
+        self.radius = np.random.uniform(0, max(self.screen_width, self.screen_height) / 2, num_stars)
+        self.angle = np.random.uniform(0, TWO_PI, num_stars)
+        self.size = np.random.randint(1, 4, num_stars)
+        self.alpha = np.random.randint(50, 256, num_stars)
+        self.alpha_change = np.random.choice([-5, 5], num_stars)
+        # White layer whose per-pixel alpha is rewritten every frame
+        self.surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((255, 255, 255, 0))
 
     def update(self, ship_speed):
-        angular_speed = -ship_speed * 0.5 * self.speed_multiplier # Apply speed multiplier
-        self.angle += angular_speed
-        if self.angle > 2 * math.pi:
-            self.angle -= 2 * math.pi
-        elif self.angle < 0:
-            self.angle += 2 * math.pi
+        self.angle += -ship_speed * 0.5 * self.speed_multiplier # Apply speed multiplier
+        np.mod(self.angle, TWO_PI, out=self.angle)
         self.alpha += self.alpha_change
-        if self.alpha <= 50 or self.alpha >= 255:
-            self.alpha_change *= -1
-        self.surface.set_alpha(self.alpha)
+        reverse = (self.alpha <= 50) | (self.alpha >= 255)
+        self.alpha_change[reverse] *= -1
 
     def draw(self, game_surface, camera_x=0, camera_y=0):
-        x = self.screen_width // 2 + self.radius * math.cos(self.angle) - camera_x
-        y = self.screen_height // 2 + self.radius * math.sin(self.angle) - camera_y
-        game_surface.blit(self.surface, (int(x - self.size // 2), int(y - self.size // 2)))
+        xs = (self.screen_width // 2 + self.radius * np.cos(self.angle) - camera_x - self.size // 2).astype(np.intp)
+        ys = (self.screen_height // 2 + self.radius * np.sin(self.angle) - camera_y - self.size // 2).astype(np.intp)
+        alphas = np.clip(self.alpha, 0, 255).astype(np.uint8)
+
+        alpha_pixels = pygame.surfarray.pixels_alpha(self.surface)
+        alpha_pixels.fill(0)
+        # Stars are 1-3 px squares; stamp each pixel offset for the stars large enough to cover it
+        for dx in range(3):
+            for dy in range(3):
+                px = xs + dx
+                py = ys + dy
+                mask = (self.size > max(dx, dy)) & (px >= 0) & (px < self.screen_width) & (py >= 0) & (py < self.screen_height)
+                alpha_pixels[px[mask], py[mask]] = alphas[mask]
+        del alpha_pixels # Release the pixel lock before blitting
+
+        game_surface.blit(self.surface, (0, 0))
 
 if __name__ == "__main__":
     game = Game()
@@ -147,6 +147,13 @@ class Crystal:
 
         self._select_texture_patches_for_sections()
 
+        # Unrotated crystal surface, rebuilt only when its animation frame, color or texture patches change
+        self._base_image = None
+        self._base_image_key = None
+        # Last rotation of the base image, reused while neither it nor the angle changes
+        self._rotated_image = None
+        self._rotated_angle = None
+
     def _generate_section_shape(self, avg_radius, num_vertices, irregularity, spikiness, thickness_strength, major_axis_multiplier, minor_axis_multiplier):
         shape_points = []
         angle_step = (2 * math.pi) / num_vertices
@@ -299,6 +306,18 @@ class Crystal:
             self._select_texture_patches_for_sections()
 
     def get_current_image(self):
+        image_key = (self.current_animation_frame_index, self.color_key, self.base_color,
+                     self.rear_patch_coords, self.mid_patch_coords, self.front_patch_coords)
+        if image_key != self._base_image_key:
+            self._base_image = self._build_base_image()
+            self._base_image_key = image_key
+            self._rotated_image = None
+        if self._rotated_image is None or self._rotated_angle != self.rotation_angle:
+            self._rotated_image = pygame.transform.rotate(self._base_image, self.rotation_angle)
+            self._rotated_angle = self.rotation_angle
+        return self._rotated_image
+
+    def _build_base_image(self):
         # Determine the size of the surface needed to contain the crystal
         # Add a small buffer for rotation and visual effects
         overall_width = self.overall_max_x - self.overall_min_x
@@ -364,9 +383,8 @@ class Crystal:
             section_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
             
             crystal_surface.blit(section_surface, (0,0)) # Blit section onto main crystal surface
-        
-        rotated_surface = pygame.transform.rotate(crystal_surface, self.rotation_angle)
-        return rotated_surface
+
+        return crystal_surface
 
 if __name__ == '__main__':
     pygame.init()
@@ -3,9 +3,62 @@ import pygame
 import sys
 
 class GameStateManager:
+    # Game method handling each state, by name; resolved to bound methods once in __init__
+    EVENT_HANDLERS = {
+        "SPLASH": "handle_splash_screen_events",
+        "MENU": "handle_menu_events",
+        "GAME": "handle_game_events",
+        "PAUSED": "handle_pause_menu_events",
+        "GAME_OVER": "handle_end_screen_events",
+        "ESCAPED": "handle_end_screen_events",
+        "ESCAPING": "handle_end_screen_events",
+        "ELECTROCUTED": "handle_end_screen_events",
+        "ESCAPED_INPUT_NAME": "handle_end_screen_events",
+        "DESTRUCTION": "handle_end_screen_events",
+        "LEVEL_COMPLETE": "handle_end_screen_events",
+        "HIGH_SCORES": "handle_high_scores_events",
+    }
+    UPDATE_HANDLERS = {
+        "GAME": "run_game_update",
+        "ESCAPING": "run_escaping_update",
+        "ELECTROCUTED": "run_electrocuted_update",
+    }
+    DRAW_HANDLERS = {
+        "SPLASH": "run_splash_screen_draw",
+        "MENU": "run_menu_draw",
+        "GAME": "run_game_draw",
+        "PAUSED": "run_pause_menu_draw",
+        "GAME_OVER": "run_game_over_draw",
+        "ESCAPED": "run_escaped_draw",
+        "ESCAPED_INPUT_NAME": "run_escaped_input_name_draw",
+        "LEVEL_COMPLETE": "run_level_complete_draw",
+        "ESCAPING": "run_game_draw", # Draw game elements during escaping animation
+        "ELECTROCUTED": "run_electrocuted_draw",
+        "HIGH_SCORES": "run_high_scores_draw",
+    }
+    ENTER_HANDLERS = {
+        "HIGH_SCORES": "on_enter_high_scores_state",
+        "ESCAPED": "on_enter_escaped_state",
+        "ESCAPED_INPUT_NAME": "on_enter_escaped_input_name_state",
+    }
+
     def __init__(self, initial_state, game):
         self.current_state = initial_state
         self.game = game
+        # Per-state dispatch tables, so every event, update and draw is a single dict lookup
+        self.event_handlers = self.bind_handlers(self.EVENT_HANDLERS)
+        self.update_handlers = self.bind_handlers(self.UPDATE_HANDLERS)
+        self.draw_handlers = self.bind_handlers(self.DRAW_HANDLERS)
+        self.enter_handlers = self.bind_handlers(self.ENTER_HANDLERS)
+
+    def bind_handlers(self, handler_names):
+        # Handlers a game variant doesn't define are left out, so that state does nothing there
+        handlers = {}
+        for state, method_name in handler_names.items():
+            method = getattr(self.game, method_name, None)
+            if method is not None:
+                handlers[state] = method
+        return handlers
 
     def get_state(self):
         return self.current_state
@@ -14,8 +67,9 @@ class GameStateManager:
         print(f"Transitioning from {self.current_state} to {new_state}")
         self.current_state = new_state
         self.game.manage_music() # Manage music on every state change
-        if new_state == "HIGH_SCORES":
-            self.game.on_enter_high_scores_state()
+        on_enter = self.enter_handlers.get(new_state)
+        if on_enter is not None:
+            on_enter()
 
     def handle_events(self, events):
         # Generic events that can happen in any state
@@ -23,51 +77,19 @@ class GameStateManager:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
-            
-            # State-specific event handling delegated to the main game class
-            if self.current_state == "SPLASH":
-                self.game.handle_splash_screen_events(event)
-            elif self.current_state == "MENU":
-                self.game.handle_menu_events(event)
-            elif self.current_state == "GAME":
-                self.game.handle_game_events(event)
-            elif self.current_state == "PAUSED":
-                self.game.handle_pause_menu_events(event)
-            elif self.current_state in ["GAME_OVER", "ESCAPED", "ESCAPING", "ELECTROCUTED", "ESCAPED_INPUT_NAME", "DESTRUCTION", "LEVEL_COMPLETE"]:
-                self.game.handle_end_screen_events(event)
-            elif self.current_state == "HIGH_SCORES":
-                self.game.handle_high_scores_events(event)
+
+            # State-specific event handling delegated to the main game class.
+            # Looked up per event, since a handler may change the state.
+            handler = self.event_handlers.get(self.current_state)
+            if handler is not None:
+                handler(event)
 
     def update(self):
-        if self.current_state == "GAME":
-            self.game.run_game_update()
-        elif self.current_state == "ESCAPING":
-            self.game.run_escaping_update()
-        elif self.current_state == "ELECTROCUTED":
-            self.game.run_electrocuted_update()
+        handler = self.update_handlers.get(self.current_state)
+        if handler is not None:
+            handler()
 
     def draw(self, screen):
-        if self.current_state == "SPLASH":
-            self.game.run_splash_screen_draw(screen)
-        elif self.current_state == "MENU":
-            self.game.run_menu_draw(screen)
-        elif self.current_state == "GAME":
-            self.game.run_game_draw(screen)
-        elif self.current_state == "PAUSED":
-            self.game.run_pause_menu_draw(screen)
-        elif self.current_state == "GAME_OVER":
-            self.game.run_game_over_draw(screen)
-        elif self.current_state == "ESCAPED":
-            self.game.run_escaped_draw(screen)
-        elif self.current_state == "ESCAPED_INPUT_NAME":
-            self.game.run_escaped_input_name_draw(screen)
-        elif self.current_state == "LEVEL_COMPLETE":
-            self.game.run_level_complete_draw(screen)
-        elif self.current_state == "LEVEL_COMPLETE":
-            self.game.run_level_complete_draw(screen)
-        elif self.current_state == "ESCAPING":
-            self.game.run_game_draw(screen) # Draw game elements during escaping animation
-        elif self.current_state == "ELECTROCUTED":
-            self.game.run_electrocuted_draw(screen)
-        elif self.current_state == "HIGH_SCORES":
-            self.game.run_high_scores_draw(screen)
+        handler = self.draw_handlers.get(self.current_state)
+        if handler is not None:
+            handler(screen)
@@ -1,141 +1,259 @@
 
 import pygame
-import random
 import math
+import numpy as np
 
-class SuckingParticle(pygame.sprite.Sprite):
-    def __init__(self, position, color, size, game):
-        super().__init__()
-        self.game = game
-        self.image = pygame.Surface([size, size])
-        self.image.fill(color)
-        self.image.set_colorkey(self.game.black)
-        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
-        self.rect = self.image.get_rect(center=position)
-        self.x, self.y = [float(pos) for pos in position]
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
-        self.lifespan = 60
-        self.sucked_in = False
-        self.suck_in_timer = 30
-        self.swirl_strength = random.uniform(0.5, 1.5)
+try:
+    from numba import njit
+except ImportError: # numba is optional; the NumPy code paths are used without it
+    njit = None
 
-    def update(self):
-        if not self.sucked_in:
-            self.x += self.vx
-            self.y += self.vy
-            self.lifespan -= 1
-            if self.lifespan <= self.suck_in_timer:
-                self.sucked_in = True
-        else:
-            dx = self.game.original_screen_width // 2 - self.x
-            dy = self.game.original_screen_height // 2 - self.y
-            distance = math.hypot(dx, dy)
-            if distance > 0:
-                attraction_speed = 4
-                tangential_speed = attraction_speed * 1.9 * self.swirl_strength
-                nx = dx / distance
-                ny = dy / distance
-                tangential_vx = -ny * tangential_speed
-                tangential_vy = nx * tangential_speed
-                self.x += nx * attraction_speed + tangential_vx
-                self.y += ny * attraction_speed + tangential_vy
-        self.rect.center = (int(round(self.x)), int(round(self.y)))
+# --- Sucking Particles ---
+SUCKING_PARTICLE_COUNT = 20
+SUCKING_PARTICLE_LIFESPAN = 60
+SUCKING_PARTICLE_SUCK_IN_TIMER = 30 # Lifespan at which a particle starts being pulled in
+SUCKING_PARTICLE_ATTRACTION_SPEED = 4
+SUCKING_PARTICLE_SWIRL_FACTOR = 1.9
+SUCKING_PARTICLE_CAPTURE_RADIUS = 50 * 1.2 # Particles this close to the black hole are swallowed
+SUCKING_PARTICLE_CAPTURE_RADIUS_SQ = SUCKING_PARTICLE_CAPTURE_RADIUS ** 2
+
+def tick_sucking_particles(x, y, vx, vy, lifespan, sucked_in, swirl_strength, center_x, center_y):
+    # One frame of drift-then-swirl for every particle; all arrays are updated in place
+    drifting = ~sucked_in
+
+    # Particles drift freely until their lifespan runs down to the suck-in point
+    x[drifting] += vx[drifting]
+    y[drifting] += vy[drifting]
+    lifespan[drifting] -= 1
+
+    # ...then spiral into the black hole
+    dx = center_x - x[sucked_in]
+    dy = center_y - y[sucked_in]
+    distance = np.hypot(dx, dy)
+    inverse_distance = np.divide(1.0, distance, out=np.zeros_like(distance), where=distance > 0)
+    nx = dx * inverse_distance
+    ny = dy * inverse_distance
+    tangential_speed = SUCKING_PARTICLE_ATTRACTION_SPEED * SUCKING_PARTICLE_SWIRL_FACTOR * swirl_strength[sucked_in]
+    x[sucked_in] += nx * SUCKING_PARTICLE_ATTRACTION_SPEED - ny * tangential_speed
+    y[sucked_in] += ny * SUCKING_PARTICLE_ATTRACTION_SPEED + nx * tangential_speed
+
+    sucked_in |= lifespan <= SUCKING_PARTICLE_SUCK_IN_TIMER
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def tick_sucking_particles(x, y, vx, vy, lifespan, sucked_in, swirl_strength, center_x, center_y):
+        # Same step as the NumPy version above, compiled as a plain loop when numba is installed
+        for i in range(x.shape[0]):
+            if not sucked_in[i]:
+                x[i] += vx[i]
+                y[i] += vy[i]
+                lifespan[i] -= 1
+                if lifespan[i] <= SUCKING_PARTICLE_SUCK_IN_TIMER:
+                    sucked_in[i] = True
+            else:
+                dx = center_x - x[i]
+                dy = center_y - y[i]
+                distance = math.sqrt(dx * dx + dy * dy)
+                if distance > 0:
+                    nx = dx / distance
+                    ny = dy / distance
+                    tangential_speed = SUCKING_PARTICLE_ATTRACTION_SPEED * SUCKING_PARTICLE_SWIRL_FACTOR * swirl_strength[i]
+                    x[i] += nx * SUCKING_PARTICLE_ATTRACTION_SPEED - ny * tangential_speed
+                    y[i] += ny * SUCKING_PARTICLE_ATTRACTION_SPEED + nx * tangential_speed
 
 class SuckingParticleSystem:
+    # Particle images depend only on color and size, so every particle with the same
+    # (color, size, colorkey) shares one surface instead of allocating its own
+    image_cache = {}
+
     def __init__(self, position, color, game):
         self.game = game
-        self.particles = pygame.sprite.Group()
-        for _ in range(20):
-            size = random.randint(2, 5)
-            particle = SuckingParticle(position, color, size, self.game)
-            self.particles.add(particle)
+        self.center_x = self.game.original_screen_width // 2
+        self.center_y = self.game.original_screen_height // 2
+        self.is_active = True
+
+        # One array per particle attribute, so a frame's update is a handful of vector operations
+        count = SUCKING_PARTICLE_COUNT
+        self.x = np.full(count, float(position[0]))
+        self.y = np.full(count, float(position[1]))
+        self.vx = np.random.uniform(-2, 2, count)
+        self.vy = np.random.uniform(-2, 2, count)
+        self.lifespan = np.full(count, SUCKING_PARTICLE_LIFESPAN)
+        self.sucked_in = np.zeros(count, dtype=bool)
+        self.swirl_strength = np.random.uniform(0.5, 1.5, count)
+        self.size = np.random.randint(2, 6, count)
+        self.images = {size: self.get_image(tuple(color), size, self.game.black) for size in range(2, 6)}
+
+    @classmethod
+    def get_image(cls, color, size, colorkey):
+        key = (color, size, colorkey)
+        image = cls.image_cache.get(key)
+        if image is None:
+            image = pygame.Surface([size, size])
+            image.fill(color)
+            image.set_colorkey(colorkey)
+            pygame.draw.circle(image, color, (size // 2, size // 2), size // 2)
+            cls.image_cache[key] = image
+        return image
 
     def update(self):
-        self.particles.update()
-        for particle in list(self.particles):
-            if math.hypot(particle.x - self.game.original_screen_width // 2, particle.y - self.game.original_screen_height // 2) < 50 * 1.2:
-                self.particles.remove(particle)
-            elif particle.lifespan <= 0:
-                self.particles.remove(particle)
+        x, y = self.x, self.y
+        tick_sucking_particles(x, y, self.vx, self.vy, self.lifespan, self.sucked_in, self.swirl_strength,
+                               float(self.center_x), float(self.center_y))
+
+        # Swallowed and expired particles are dropped from every array at once
+        dx = x - self.center_x
+        dy = y - self.center_y
+        keep = (dx * dx + dy * dy >= SUCKING_PARTICLE_CAPTURE_RADIUS_SQ) & (self.lifespan > 0)
+        if not keep.all():
+            self.x = x[keep]
+            self.y = y[keep]
+            self.vx = self.vx[keep]
+            self.vy = self.vy[keep]
+            self.lifespan = self.lifespan[keep]
+            self.sucked_in = self.sucked_in[keep]
+            self.swirl_strength = self.swirl_strength[keep]
+            self.size = self.size[keep]
+            self.is_active = len(self.x) > 0
 
     def draw(self, screen, camera_x=0, camera_y=0):
-        for particle in self.particles:
-            screen.blit(particle.image, (particle.rect.x - camera_x, particle.rect.y - camera_y))
+        # Top-left of each particle's image when centred on its rounded position
+        half_size = self.size // 2
+        xs = (np.rint(self.x).astype(int) - half_size - camera_x).tolist()
+        ys = (np.rint(self.y).astype(int) - half_size - camera_y).tolist()
+        images = self.images
+        screen.blits([(images[size], (x, y)) for size, x, y in zip(self.size.tolist(), xs, ys)], doreturn=False)
 
-class AdvancedParticle(pygame.sprite.Sprite):
-    def __init__(self, start_pos, color, max_dist, pause_duration, return_speed, deceleration_factor=0.95):
-        super().__init__()
-        self.start_pos = start_pos
-        self.color = color
-        self.max_dist = max_dist
-        self.pause_duration = pause_duration
-        self.return_speed = return_speed
-        self.deceleration_factor = deceleration_factor
+# --- Burst Particles ---
+ADVANCED_PARTICLE_COUNT = 30
+ADVANCED_PARTICLE_DECELERATION = 0.95
+# Particle states: fly out, hang in place, then fly back to the start and vanish
+PARTICLE_BURST = 0
+PARTICLE_PAUSE = 1
+PARTICLE_RETURN = 2
 
-        self.pos = list(start_pos)
-        self.state = "burst"
-        self.pause_timer = 0
+def tick_burst_particles(x, y, vx, vy, max_dist, pause_duration, return_speed, state, pause_timer, start_x, start_y):
+    # One frame of the burst/pause/return cycle for every particle, updated in place.
+    # Each particle takes the step of the state it started the frame in.
+    # Returns a mask of the particles that made it back to the start this frame.
+    burst = state == PARTICLE_BURST
+    paused = state == PARTICLE_PAUSE
+    returning = state == PARTICLE_RETURN
 
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 5)
-        self.velocity = [math.cos(angle) * speed, math.sin(angle) * speed]
+    # Burst: fly outwards and slow down until far enough out or nearly stopped
+    x[burst] += vx[burst]
+    y[burst] += vy[burst]
+    vx[burst] *= ADVANCED_PARTICLE_DECELERATION
+    vy[burst] *= ADVANCED_PARTICLE_DECELERATION
+    dist_from_start = np.hypot(x[burst] - start_x, y[burst] - start_y)
+    stopped = (dist_from_start >= max_dist[burst]) | (np.hypot(vx[burst], vy[burst]) < 0.1)
+    state[np.flatnonzero(burst)[stopped]] = PARTICLE_PAUSE
 
-        self.image = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (2, 2), 2)
-        self.rect = self.image.get_rect(center=self.pos)
+    # Pause: hang in place for the particle's pause duration
+    pause_timer[paused] += 1
+    state[paused & (pause_timer >= pause_duration)] = PARTICLE_RETURN
 
-    def update(self):
-        if self.state == "burst":
-            self.pos[0] += self.velocity[0]
-            self.pos[1] += self.velocity[1]
-            self.velocity[0] *= self.deceleration_factor
-            self.velocity[1] *= self.deceleration_factor
-
-            dist_from_start = math.hypot(self.pos[0] - self.start_pos[0], self.pos[1] - self.start_pos[1])
-            if dist_from_start >= self.max_dist or math.hypot(self.velocity[0], self.velocity[1]) < 0.1:
-                self.state = "pause"
-        elif self.state == "pause":
-            self.pause_timer += 1
-            if self.pause_timer >= self.pause_duration:
-                self.state = "return"
-        elif self.state == "return":
-            dx = self.start_pos[0] - self.pos[0]
-            dy = self.start_pos[1] - self.pos[1]
-            dist = math.hypot(dx, dy)
-            if dist < self.return_speed:
-                self.kill()
-            else:
-                self.pos[0] += (dx / dist) * self.return_speed
-                self.pos[1] += (dy / dist) * self.return_speed
+    # Return: head back to the start, vanishing once within one step of it
+    dx = start_x - x[returning]
+    dy = start_y - y[returning]
+    dist = np.hypot(dx, dy)
+    speed = return_speed[returning]
+    arrived = dist < speed
+    step = np.divide(speed, dist, out=np.zeros_like(dist), where=~arrived)
+    x[returning] += dx * step
+    y[returning] += dy * step
 
-        self.rect.center = self.pos
+    done = np.zeros(x.shape[0], dtype=np.bool_)
+    done[np.flatnonzero(returning)[arrived]] = True
+    return done
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def tick_burst_particles(x, y, vx, vy, max_dist, pause_duration, return_speed, state, pause_timer, start_x, start_y):
+        # Same step as the NumPy version above, compiled as a plain loop when numba is installed
+        done = np.zeros(x.shape[0], dtype=np.bool_)
+        for i in range(x.shape[0]):
+            if state[i] == PARTICLE_BURST:
+                x[i] += vx[i]
+                y[i] += vy[i]
+                vx[i] *= ADVANCED_PARTICLE_DECELERATION
+                vy[i] *= ADVANCED_PARTICLE_DECELERATION
+                dx = x[i] - start_x
+                dy = y[i] - start_y
+                if dx * dx + dy * dy >= max_dist[i] * max_dist[i] or vx[i] * vx[i] + vy[i] * vy[i] < 0.01:
+                    state[i] = PARTICLE_PAUSE
+            elif state[i] == PARTICLE_PAUSE:
+                pause_timer[i] += 1
+                if pause_timer[i] >= pause_duration[i]:
+                    state[i] = PARTICLE_RETURN
+            else:
+                dx = start_x - x[i]
+                dy = start_y - y[i]
+                dist = math.sqrt(dx * dx + dy * dy)
+                if dist < return_speed[i]:
+                    done[i] = True
+                else:
+                    step = return_speed[i] / dist
+                    x[i] += dx * step
+                    y[i] += dy * step
+        return done
 
 class AdvancedParticleSystem:
+    # One dot image per color, shared by every system of that color
+    image_cache = {}
+
     def __init__(self, position, color):
-        self.particles = pygame.sprite.Group()
         self.position = position
         self.color = color
         self.is_active = True
+        self.start_x = float(position[0])
+        self.start_y = float(position[1])
+
+        # One array per particle attribute; each state's step is applied to all its particles at once
+        count = ADVANCED_PARTICLE_COUNT
+        self.x = np.full(count, self.start_x)
+        self.y = np.full(count, self.start_y)
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        speed = np.random.uniform(2, 5, count)
+        self.vx = np.cos(angle) * speed
+        self.vy = np.sin(angle) * speed
+        self.max_dist = np.random.uniform(50, 100, count)
+        self.pause_duration = np.random.randint(10, 21, count)
+        self.return_speed = np.random.uniform(4, 6, count)
+        self.state = np.full(count, PARTICLE_BURST, dtype=np.uint8)
+        self.pause_timer = np.zeros(count, dtype=np.int32)
+
+        color_key = tuple(self.color)
+        self.image = self.image_cache.get(color_key)
+        if self.image is None:
+            self.image = pygame.Surface((4, 4), pygame.SRCALPHA)
+            pygame.draw.circle(self.image, self.color, (2, 2), 2)
+            self.image_cache[color_key] = self.image
 
-        for _ in range(30):
-            particle = AdvancedParticle(
-                start_pos=self.position,
-                color=self.color,
-                max_dist=random.uniform(50, 100),
-                pause_duration=random.randint(10, 20),
-                return_speed=random.uniform(4, 6)
-            )
-            self.particles.add(particle)
-    
     def update(self):
-        self.particles.update()
-        if not self.particles:
-            self.is_active = False
+        x, y, vx, vy, state = self.x, self.y, self.vx, self.vy, self.state
+        done = tick_burst_particles(x, y, vx, vy, self.max_dist, self.pause_duration, self.return_speed,
+                                    state, self.pause_timer, self.start_x, self.start_y)
+
+        if done.any():
+            keep = ~done
+            self.x = x[keep]
+            self.y = y[keep]
+            self.vx = vx[keep]
+            self.vy = vy[keep]
+            self.max_dist = self.max_dist[keep]
+            self.pause_duration = self.pause_duration[keep]
+            self.return_speed = self.return_speed[keep]
+            self.state = state[keep]
+            self.pause_timer = self.pause_timer[keep]
+            self.is_active = len(self.x) > 0
 
     def draw(self, screen, camera_x=0, camera_y=0):
-        for particle in self.particles:
-            screen.blit(particle.image, (particle.rect.x - camera_x, particle.rect.y - camera_y))
+        # Top-left of the 4x4 dot centred on each particle
+        xs = (self.x.astype(int) - 2 - camera_x).tolist()
+        ys = (self.y.astype(int) - 2 - camera_y).tolist()
+        image = self.image
+        screen.blits([(image, (x, y)) for x, y in zip(xs, ys)], doreturn=False)
 
 class BoostParticleSystem(AdvancedParticleSystem):
     def __init__(self, position):
@@ -3,6 +3,8 @@ import random
 import math
 from particle_module import ExplosionParticleSystem
 
+TWO_PI = 2 * math.pi
+
 # --- Pirate Configuration ---
 PIRATE_RADIUS = 15
 PIRATE_COLOR = (150, 150, 0) # Dark yellow/gold
@@ -11,6 +13,7 @@ PIRATE_SPEED = 0.003 # Orbital speed
 PIRATE_ENTRY_SPEED = 7 # How fast it flies in
 PIRATE_SHOOT_INTERVAL_MIN = 90 # frames
 PIRATE_SHOOT_INTERVAL_MAX = 240 # frames
+PIRATE_ROTATION_STEP = 5 # degrees between the pre-rotated ship images
 
 # --- Projectile Configuration ---
 PROJECTILE_RADIUS = 5
@@ -20,22 +23,25 @@ PROJECTILE_LIFETIME = 120 # frames
 PROJECTILE_DAMAGE = 10
 
 class PirateProjectile:
+    # Every projectile looks and hits the same, so these are shared on the class
+    radius = PROJECTILE_RADIUS
+    color = PROJECTILE_COLOR
+    damage = PROJECTILE_DAMAGE
+
     def __init__(self, x, y, target_x, target_y, game):
         self.game = game
         self.x = x
         self.y = y
-        self.radius = PROJECTILE_RADIUS
-        self.color = PROJECTILE_COLOR
         self.lifetime = PROJECTILE_LIFETIME
-        self.damage = PROJECTILE_DAMAGE
 
-        # Calculate direction towards target
+        # Calculate direction towards target, scaled to the projectile speed in one division
         dx = target_x - x
         dy = target_y - y
         distance = math.hypot(dx, dy)
         if distance > 0:
-            self.vx = (dx / distance) * PROJECTILE_SPEED
-            self.vy = (dy / distance) * PROJECTILE_SPEED
+            scale = PROJECTILE_SPEED / distance
+            self.vx = dx * scale
+            self.vy = dy * scale
         else:
             self.vx = 0
             self.vy = 0
@@ -44,22 +50,32 @@ class PirateProjectile:
         self.x += self.vx
         self.y += self.vy
         self.lifetime -= 1
+        # Once fully off screen a shot can't be seen or reach the ship, so it expires right away
+        # instead of being moved, drawn and collision-tested for the rest of its lifetime
+        if not (-PROJECTILE_RADIUS < self.x < self.game.original_screen_width + PROJECTILE_RADIUS
+                and -PROJECTILE_RADIUS < self.y < self.game.original_screen_height + PROJECTILE_RADIUS):
+            self.lifetime = 0
 
     def draw(self, game_surface):
         if self.lifetime > 0:
             pygame.draw.circle(game_surface, self.color, (int(self.x), int(self.y)), self.radius)
 
 class Pirate:
+    # Scaled ship image, loaded with the first pirate and shared by all of them
+    image_orig = None
+    # Ship image pre-rotated every PIRATE_ROTATION_STEP degrees, shared by all pirates
+    rotated_images = None
+
     def __init__(self, track, game):
         self.game = game
         self.track = track
-        self.target_radius = self.game.player_ship.orbital_radius_base + track * self.game.player_ship.track_width * self.game.player_ship.track_spacing_multiplier
-        self.angle = random.uniform(0, 2 * math.pi) # Initial angle
+        self.target_radius = self.game.player_ship.track_radii[track]
+        self.angle = random.uniform(0, TWO_PI) # Initial angle
         self.radius = 0 # Starts off-screen
         self.orbital_speed = PIRATE_SPEED * random.choice([-1, 1]) # Random direction
 
-        self.x = self.game.original_screen_width // 2
-        self.y = self.game.original_screen_height // 2
+        self.x = self.game.center_x
+        self.y = self.game.center_y
 
         self.structure = PIRATE_STRUCTURE
         self.is_destroyed = False
@@ -69,11 +85,18 @@ class Pirate:
 
         self.pirate_radius = PIRATE_RADIUS # For collision detection
 
-        # Load pirate image
-        self.image_orig = pygame.image.load("assets/ship02.png").convert_alpha()
-        self.image = self.image_orig # Current image (for rotation)
         self.image_scale = 1.25 # Adjusted for larger size
-        self.image_orig = pygame.transform.scale(self.image_orig, (int(self.image_orig.get_width() * self.image_scale), int(self.image_orig.get_height() * self.image_scale)))
+        self.image_orig = self.get_image(self.image_scale)
+        self.image = self.image_orig # Current image (for rotation)
+
+    @classmethod
+    def get_image(cls, image_scale):
+        # Loading, scaling and pre-rotating the ship happens once, on the first spawn
+        if cls.image_orig is None:
+            image = pygame.image.load("assets/ship02.png").convert_alpha()
+            cls.image_orig = pygame.transform.scale(image, (int(image.get_width() * image_scale), int(image.get_height() * image_scale)))
+            cls.rotated_images = [pygame.transform.rotate(cls.image_orig, angle) for angle in range(0, 360, PIRATE_ROTATION_STEP)]
+        return cls.image_orig
 
     def update(self):
         if self.is_destroyed:
@@ -90,11 +113,11 @@ class Pirate:
                 if self.radius <= self.target_radius:
                     self.entering_screen = False
         else:
-            self.angle += self.orbital_speed
+            self.angle = (self.angle + self.orbital_speed) % TWO_PI
 
         # Update position based on orbital parameters
-        self.x = self.game.original_screen_width // 2 + self.radius * math.cos(self.angle)
-        self.y = self.game.original_screen_height // 2 + self.radius * math.sin(self.angle)
+        self.x = self.game.center_x + self.radius * math.cos(self.angle)
+        self.y = self.game.center_y + self.radius * math.sin(self.angle)
 
         # Shooting logic
         self.shoot_timer -= 1
@@ -134,6 +157,6 @@ class Pirate:
             else: # Clockwise movement
                 rotation_angle_deg = base_rotation_angle_deg + 180 # Now faces 180 degrees opposite
             
-            rotated_image = pygame.transform.rotate(self.image_orig, rotation_angle_deg)
-            image_rect = rotated_image.get_rect(center=(int(self.x), int(self.y)))
-            game_surface.blit(rotated_image, image_rect)
+            rotated_images = Pirate.rotated_images
+            rotated_image = rotated_images[round(rotation_angle_deg / PIRATE_ROTATION_STEP) % len(rotated_images)]
+            game_surface.blit(rotated_image, (int(self.x) - rotated_image.get_width() // 2, int(self.y) - rotated_image.get_height() // 2))
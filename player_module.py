@@ -3,11 +3,16 @@ import pygame
 import math
 import random
 
+TWO_PI = 2 * math.pi
+
 class FlameParticle:
     def __init__(self, x, y, angle, speed, max_length):
         self.x = x
         self.y = y
         self.angle = angle
+        # A particle never changes direction, so its unit vector is worked out once here
+        self.dir_x = math.cos(angle)
+        self.dir_y = math.sin(angle)
         self.speed = speed
         self.max_length = max_length
         self.current_length = 0
@@ -21,10 +26,10 @@ class FlameParticle:
         return True
 
     def draw(self, screen, ship_angle):
-        end_x = self.x + self.current_length * math.cos(self.angle)
-        end_y = self.y + self.current_length * math.sin(self.angle)
-        start_x = self.x + (self.current_length - self.speed) * math.cos(self.angle)
-        start_y = self.y + (self.current_length - self.speed) * math.sin(self.angle)
+        end_x = self.x + self.current_length * self.dir_x
+        end_y = self.y + self.current_length * self.dir_y
+        start_x = self.x + (self.current_length - self.speed) * self.dir_x
+        start_y = self.y + (self.current_length - self.speed) * self.dir_y
         
         # Adjust width and color based on length
         life_fraction = self.current_length / self.max_length
@@ -100,6 +105,10 @@ class Ship:
         self.image_orig = ship_image
         self.image = self.image_orig
         self.display_scale = 1.7
+        # Scaled sprite and its rotations by whole degree, rebuilt when display_scale changes
+        self.scaled_image = None
+        self.scaled_image_scale = None
+        self.rotated_images = {}
         self.radius = 12
         self.angle = 0
         self.track = 1  # Start on the middle track (0, 1, 2)
@@ -141,6 +150,8 @@ class Ship:
         self.track_width = 40
         self.track_spacing_multiplier = 1.5
         self.orbital_radius_base = 150
+        # Orbital radius of each track's center line; the layout never changes after this
+        self.track_radii = tuple(self.orbital_radius_base + track * self.track_width * self.track_spacing_multiplier for track in range(3))
         self.is_destroyed = False
         
         self.flame_system = FlameSystem(self)
@@ -199,13 +210,9 @@ class Ship:
         self._update_hit_effect()
 
         # Update position and angle
-        self.orbital_radius = self.orbital_radius_base + self.track * self.track_width * self.track_spacing_multiplier
+        self.orbital_radius = self.track_radii[self.track]
         self.speed = self.base_tangential_speed / self.orbital_radius
-        self.angle += self.speed
-        if self.angle > 2 * math.pi:
-            self.angle -= 2 * math.pi
-        elif self.angle < 0:
-            self.angle += 2 * math.pi
+        self.angle = (self.angle + self.speed) % TWO_PI
 
         self.x = self.screen_width // 2 + self.orbital_radius * math.cos(self.angle)
         self.y = self.screen_height // 2 + self.orbital_radius * math.sin(self.angle)
@@ -227,20 +234,30 @@ class Ship:
                 self.hit_effect_active = False
                 self.radius = self.original_radius
 
+    def get_rotated_image(self, rotation_angle_deg):
+        """Returns the scaled ship sprite rotated to the nearest whole degree, from cache when possible."""
+        if self.scaled_image_scale != self.display_scale:
+            self.scaled_image = pygame.transform.scale(self.image_orig, (int(self.image.get_width() * self.display_scale), int(self.image.get_height() * self.display_scale)))
+            self.scaled_image_scale = self.display_scale
+            self.rotated_images = {}
+        rotation_step = round(rotation_angle_deg) % 360
+        rotated_image = self.rotated_images.get(rotation_step)
+        if rotated_image is None:
+            rotated_image = pygame.transform.rotate(self.scaled_image, rotation_step)
+            self.rotated_images[rotation_step] = rotated_image
+        return rotated_image
+
     def draw(self, screen):
         """Draws the ship and its shield to the screen."""
         self.flame_system.draw(screen)
         
         # Draw ship
-        scaled_image = pygame.transform.scale(self.image_orig, (int(self.image.get_width() * self.display_scale), int(self.image.get_height() * self.display_scale)))
-        
         rotation_angle_deg = math.degrees(-self.angle)
         if not self.debug_mode:
             rotation_angle_deg -= 90 # Adjust for in-game orientation
 
-        rotated_image = pygame.transform.rotate(scaled_image, rotation_angle_deg)
-        image_rect = rotated_image.get_rect(center=(self.x, self.y))
-        screen.blit(rotated_image, image_rect.topleft)
+        rotated_image = self.get_rotated_image(rotation_angle_deg)
+        screen.blit(rotated_image, (int(self.x) - rotated_image.get_width() // 2, int(self.y) - rotated_image.get_height() // 2))
 
         # Draw shield
         if self.shield_active:
@@ -71,6 +71,25 @@ STAR_MIN_ALPHA = 50
 STAR_MAX_ALPHA = 200
 STAR_ALPHA_CHANGE_SPEED = 5
 
+# Scratch surface for the additive glow circles, shared instead of allocated on every draw
+_glow_scratch = None
+
+def _blit_additive_circle(surface, color, pos, radius):
+    global _glow_scratch
+    size = int(radius * 2)
+    if size <= 0:
+        return
+    if _glow_scratch is None or _glow_scratch.get_width() < size:
+        scratch_size = max(size, CORE_MAX_RADIUS * 2, SMOKE_CLOUD_MAX_RADIUS * 2)
+        _glow_scratch = pygame.Surface((scratch_size, scratch_size), pygame.SRCALPHA)
+    # Clip to the size a dedicated surface would have had so the circle is cut off the same way
+    area = pygame.Rect(0, 0, size, size)
+    _glow_scratch.set_clip(area)
+    _glow_scratch.fill((0, 0, 0, 0))
+    pygame.draw.circle(_glow_scratch, color, (radius, radius), radius)
+    _glow_scratch.set_clip(None)
+    surface.blit(_glow_scratch, (pos[0] - radius, pos[1] - radius), area, special_flags=pygame.BLEND_RGBA_ADD)
+
 # --- Helper Classes ---
 
 class CinematicDebris:
@@ -91,10 +110,13 @@ class CinematicDebris:
         self.velocity[0] *= coasting_drag
         self.velocity[1] *= coasting_drag
 
-    def draw(self, surface):
+    def get_blit(self):
+        """Returns the (image, rect) pair that draws this piece, for batching with Surface.blits."""
         rotated_image = pygame.transform.rotate(self.image, self.rotation_angle) # Apply only its own tumbling rotation
-        rect = rotated_image.get_rect(center=self.pos)
-        surface.blit(rotated_image, rect)
+        return rotated_image, rotated_image.get_rect(center=self.pos)
+
+    def draw(self, surface):
+        surface.blit(*self.get_blit())
 
 class ExplosionCore:
     """The central expanding fireball of the explosion."""
@@ -116,9 +138,7 @@ class ExplosionCore:
 
     def draw(self, surface):
         if self.alpha > 0:
-            temp_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (*self.color, int(self.alpha)), (self.radius, self.radius), self.radius)
-            surface.blit(temp_surface, (self.pos[0] - self.radius, self.pos[1] - self.radius), special_flags=pygame.BLEND_RGBA_ADD)
+            _blit_additive_circle(surface, (*self.color, int(self.alpha)), self.pos, self.radius)
 
 class MiniExplosion:
     """A small, short-lived explosion for localized damage effects."""
@@ -140,9 +160,7 @@ class MiniExplosion:
 
     def draw(self, surface):
         if self.alpha > 0:
-            temp_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (*MINI_EXPLOSION_COLOR, int(self.alpha)), (self.radius, self.radius), self.radius)
-            surface.blit(temp_surface, (self.pos[0] - self.radius, self.pos[1] - self.radius), special_flags=pygame.BLEND_RGBA_ADD)
+            _blit_additive_circle(surface, (*MINI_EXPLOSION_COLOR, int(self.alpha)), self.pos, self.radius)
 
 class SmokeCloud:
     """An expanding and fading smoke/dust cloud."""
@@ -174,9 +192,7 @@ class SmokeCloud:
 
     def draw(self, surface):
         if self.alpha > 0:
-            temp_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (SMOKE_CLOUD_COLOR[0], SMOKE_CLOUD_COLOR[1], SMOKE_CLOUD_COLOR[2], int(self.alpha)), (self.radius, self.radius), self.radius)
-            surface.blit(temp_surface, (self.pos[0] - self.radius, self.pos[1] - self.radius), special_flags=pygame.BLEND_RGBA_ADD)
+            _blit_additive_circle(surface, (SMOKE_CLOUD_COLOR[0], SMOKE_CLOUD_COLOR[1], SMOKE_CLOUD_COLOR[2], int(self.alpha)), self.pos, self.radius)
 
 class ElectricalArc:
     """A short-lived electrical arc/line effect."""
@@ -254,21 +270,49 @@ class Spark:
         if self.lifetime > 0:
             pygame.draw.circle(surface, (*SPARK_COLOR, int(self.alpha)), self.pos, 1)
 
-class TwinklingStar:
-    """A small, twinkling star in the background."""
-    def __init__(self, screen_width, screen_height):
-        self.pos = (random.randint(0, screen_width), random.randint(0, screen_height))
-        self.size = random.randint(STAR_MIN_SIZE, STAR_MAX_SIZE)
-        self.alpha = random.randint(STAR_MIN_ALPHA, STAR_MAX_ALPHA)
-        self.alpha_change = random.choice([-1, 1]) * STAR_ALPHA_CHANGE_SPEED
+class TwinklingStarField:
+    """The small, twinkling background stars, one NumPy array per attribute."""
+    def __init__(self, screen_width, screen_height, count):
+        self.xs = np.random.randint(0, screen_width + 1, count)
+        self.ys = np.random.randint(0, screen_height + 1, count)
+        self.sizes = np.random.randint(STAR_MIN_SIZE, STAR_MAX_SIZE + 1, count)
+        self.alpha = np.random.randint(STAR_MIN_ALPHA, STAR_MAX_ALPHA + 1, count)
+        self.alpha_change = np.random.choice(np.array([-STAR_ALPHA_CHANGE_SPEED, STAR_ALPHA_CHANGE_SPEED]), count)
+
+        # Pixels covered by each star: a single pixel for size 1, a 3x3 block for size 2
+        # (size 0 draws nothing, as with pygame.draw.circle), clipped to the screen
+        offsets = np.arange(-1, 2)
+        block_xs = self.xs[:, None] + np.repeat(offsets, 3)
+        block_ys = self.ys[:, None] + np.tile(offsets, 3)
+        covered = np.zeros(block_xs.shape, dtype=bool)
+        covered[self.sizes >= 2] = True
+        covered[self.sizes == 1, 4] = True # Centre of the block
+        covered &= (block_xs >= 0) & (block_xs < screen_width) & (block_ys >= 0) & (block_ys < screen_height)
+        self.pixel_xs = block_xs[covered]
+        self.pixel_ys = block_ys[covered]
+        self.pixel_owner = np.nonzero(covered)[0]
+        # White layer whose per-pixel alpha is rewritten every frame
+        self.surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self.surface.fill((255, 255, 255, 0))
 
     def update(self):
+        # Every star twinkles in the same two array operations
         self.alpha += self.alpha_change
-        if self.alpha <= STAR_MIN_ALPHA or self.alpha >= STAR_MAX_ALPHA:
-            self.alpha_change *= -1 # Reverse twinkling direction
+        reverse = (self.alpha <= STAR_MIN_ALPHA) | (self.alpha >= STAR_MAX_ALPHA)
+        self.alpha_change[reverse] *= -1 # Reverse twinkling direction
 
     def draw(self, surface):
-        pygame.draw.circle(surface, (255, 255, 255, int(self.alpha)), self.pos, self.size)
+        # The stars never move, so rewriting their own pixels each frame is enough to refresh the layer
+        alpha_pixels = pygame.surfarray.pixels_alpha(self.surface)
+        alpha_pixels[self.pixel_xs, self.pixel_ys] = self.alpha[self.pixel_owner]
+        del alpha_pixels # Release the pixel lock before blitting
+        surface.blit(self.surface, (0, 0))
+
+    def draw_opaque(self, surface):
+        """Draws the stars at full brightness onto a surface without per-pixel alpha."""
+        circle = pygame.draw.circle
+        for x, y, size in zip(self.xs.tolist(), self.ys.tolist(), self.sizes.tolist()):
+            circle(surface, (255, 255, 255), (x, y), size)
 
 class ShipDestructionCinematic:
     """Manages the entire ship destruction animation sequence."""
@@ -297,9 +341,9 @@ class ShipDestructionCinematic:
         self.shake_1_sounds_played = 0
         self.shake_2_sounds_played = 0
 
-        self.twinkling_stars = []
-        for _ in range(NUM_TWINKLING_STARS):
-            self.twinkling_stars.append(TwinklingStar(screen_width, screen_height))
+        self.twinkling_stars = TwinklingStarField(screen_width, screen_height, NUM_TWINKLING_STARS)
+        # Background with the stars already drawn in, built on the first opaque draw
+        self.backdrop = None
 
     def update(self):
         if self.is_finished:
@@ -327,8 +371,7 @@ class ShipDestructionCinematic:
                 self.smoke_clouds.remove(cloud)
 
         # Update twinkling stars
-        for star in self.twinkling_stars:
-            star.update()
+        self.twinkling_stars.update()
 
         # Spawn electrical arcs continuously
         if self.state_timer % 3 == 0: # Spawn every 3 frames
@@ -495,10 +538,18 @@ class ShipDestructionCinematic:
             return
 
         # --- State-based Drawing ---
-        surface.blit(self.background_image, (0, 0)) # Draw the background first
-        # Draw twinkling stars in the background
-        for star in self.twinkling_stars:
-            star.draw(surface)
+        if surface.get_flags() & pygame.SRCALPHA:
+            surface.blit(self.background_image, (0, 0)) # Draw the background first
+            # Draw twinkling stars in the background
+            self.twinkling_stars.draw(surface)
+        else:
+            # On an opaque surface the stars' alpha is ignored and they never change,
+            # so the background and stars are composed once and blitted as one layer
+            if self.backdrop is None:
+                self.backdrop = pygame.Surface(surface.get_size())
+                self.backdrop.blit(self.background_image, (0, 0))
+                self.twinkling_stars.draw_opaque(self.backdrop)
+            surface.blit(self.backdrop, (0, 0))
 
         if self.state in ["SHAKE_1", "DELAY_1", "SHAKE_2", "DELAY_2", "INITIAL_FLASH"]:
             # Draw the intact ship at its current position and rotation
@@ -521,15 +572,13 @@ class ShipDestructionCinematic:
 
         elif self.state == "FRACTURING":
             if self.debris:
-                for piece in self.debris:
-                    piece.draw(surface)
+                surface.blits([piece.get_blit() for piece in self.debris], doreturn=False)
 
         elif self.state in ["EXPANDING_CORE", "COASTING"]:
             if self.explosion_core:
                 self.explosion_core.draw(surface)
             if self.debris:
-                for piece in self.debris:
-                    piece.draw(surface)
+                surface.blits([piece.get_blit() for piece in self.debris], doreturn=False)
             for spark in self.sparks:
                 spark.draw(surface)
             for mini_exp in self.mini_explosions:
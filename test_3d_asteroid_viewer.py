@@ -1,23 +1,54 @@
 import pygame
 from pygame.locals import *
+import OpenGL
+# PyOpenGL's per-call glGetError checks and array validation; these must be set before importing OpenGL.GL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+OpenGL.ARRAY_SIZE_CHECKING = False
+OpenGL.STORE_POINTERS = False # Client arrays are only read while a display list is being compiled
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from OpenGL.GL.EXT.texture_compression_s3tc import glInitTextureCompressionS3TcEXT, GL_COMPRESSED_RGBA_S3TC_DXT5_EXT
+from OpenGL.GLU import gluBuild2DMipmaps
 import numpy as np
+import ctypes
+import math
 from asteroid_3d_module import Asteroid3D, MAX_OUTER_RADIUS
 import os
 import random # Import the random module
 import sys # Import the sys module
+import time
+
+try:
+    from numba import njit
+except ImportError: # numba is optional; the NumPy code paths are used without it
+    njit = None
 
 # --- Collision Cooldown ---
 COLLISION_COOLDOWN = 1000 # milliseconds
 
+# --- Frame Pacing ---
+TARGET_FPS = 60
+FRAME_TIME = 1.0 / TARGET_FPS # seconds
+
+# --- Camera ---
+FIELD_OF_VIEW = 45 # degrees
+NEAR_PLANE = 0.1
+FAR_PLANE = 1000.0
+CAMERA_DISTANCE = 500
+
+# --- Lighting ---
+LIGHT_DIRECTION = (0.0, 0.0, 1.0) # Directional light from the front, in eye space
+LIGHT_AMBIENT = 0.4
+LIGHT_DIFFUSE = 1.0
+GLOBAL_AMBIENT = 0.2 # OpenGL's default light-model ambient, which the fixed-function path adds on top
+
 # --- Asset Path ---
 ASSET_PATH = "assets"
 
 # --- Texture Loading Function for OpenGL ---
 def load_texture(filename):
     texture_surface = pygame.image.load(filename)
-    texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
+    texture_data = pygame.image.tobytes(texture_surface, "RGBA", True)
     width = texture_surface.get_width()
     height = texture_surface.get_height()
 
@@ -27,40 +58,422 @@ def load_texture(filename):
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-    gluBuild2DMipmaps(GL_TEXTURE_2D, GL_RGBA, width, height, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+    # Let the driver compress to DXT5 (a quarter of the RGBA8 footprint) when S3TC is supported
+    internal_format = GL_COMPRESSED_RGBA_S3TC_DXT5_EXT if glInitTextureCompressionS3TcEXT() else GL_RGBA8
+    if glGenerateMipmap:
+        glTexImage2D(GL_TEXTURE_2D, 0, internal_format, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+        glGenerateMipmap(GL_TEXTURE_2D) # Build the mip chain on the GPU instead of in GLU on the CPU
+    else:
+        # glGenerateMipmap needs GL 3.0; older contexts (the fixed-function path) fall back to GLU
+        gluBuild2DMipmaps(GL_TEXTURE_2D, internal_format, width, height, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
     return texture_id
 
-# --- Main Drawing Function ---
-def draw_asteroid(asteroid):
+# --- Vertex Buffer Functions ---
+VERTEX_STRIDE = 32 # 8 float32 values per vertex: position, normal, uv
+NORMAL_OFFSET = 12
+UV_OFFSET = 24
+# Static asteroid VBOs store unit normals as normalized bytes (padded to 4) and UVs as normalized
+# unsigned shorts instead of floats: 20 bytes per vertex
+QUANTIZED_VERTEX = np.dtype([('position', np.float32, 3), ('normal', np.int8, 4), ('uv', np.uint16, 2)])
+QUANTIZED_STRIDE = QUANTIZED_VERTEX.itemsize
+QUANTIZED_NORMAL_OFFSET = QUANTIZED_VERTEX.fields['normal'][1]
+QUANTIZED_UV_OFFSET = QUANTIZED_VERTEX.fields['uv'][1]
+
+# Shader attribute locations, bound before the program is linked
+POSITION_ATTRIBUTE = 0
+NORMAL_ATTRIBUTE = 1
+UV_ATTRIBUTE = 2
+COLOR_ATTRIBUTE = 3
+
+def pack_triangles(vertices, normals, uvs, faces, out):
+    # Writes every face corner into out as an unindexed GL_T2F_N3F_V3F row: [u, v, nx, ny, nz, px, py, pz]
+    corners = faces.ravel()
+    out[:, 0:2] = uvs[corners]
+    out[:, 2:5] = normals[corners]
+    out[:, 5:8] = vertices[corners]
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def pack_triangles(vertices, normals, uvs, faces, out):
+        # Same packing as the NumPy version above, compiled as a plain loop when numba is installed
+        row = 0
+        for face in range(faces.shape[0]):
+            for corner in range(3):
+                i = faces[face, corner]
+                out[row, 0] = uvs[i, 0]
+                out[row, 1] = uvs[i, 1]
+                out[row, 2] = normals[i, 0]
+                out[row, 3] = normals[i, 1]
+                out[row, 4] = normals[i, 2]
+                out[row, 5] = vertices[i, 0]
+                out[row, 6] = vertices[i, 1]
+                out[row, 7] = vertices[i, 2]
+                row += 1
+
+def quantize_vertex_data(asteroid):
+    """Packs the asteroid's vertices in the QUANTIZED_VERTEX layout; GL maps the integers back to [-1, 1] and [0, 1]."""
+    quantized = np.zeros(len(asteroid.base_vertices), dtype=QUANTIZED_VERTEX)
+    quantized['position'] = asteroid.base_vertices
+    quantized['normal'][:, :3] = np.round(asteroid.normals * 127.0)
+    quantized['uv'] = np.round(np.clip(asteroid.uv_coords, 0.0, 1.0) * 65535.0)
+    return quantized
+
+class AsteroidMesh:
+    """An asteroid's static VBO/IBO pair and the vertex array object binding them to the shader attributes."""
+    def __init__(self, asteroid):
+        # The arrays the buffers were built from, so rebuilt geometry can be detected
+        self.vertex_data = asteroid.vertex_data
+        self.index_data = asteroid.index_data
+        self.index_count = len(asteroid.index_data)
+
+        self.vao = glGenVertexArrays(1)
+        self.vbo, self.ibo = glGenBuffers(2)
+        vertex_data = quantize_vertex_data(asteroid)
+        glBindVertexArray(self.vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertex_data.nbytes, vertex_data, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(POSITION_ATTRIBUTE)
+        glEnableVertexAttribArray(NORMAL_ATTRIBUTE)
+        glEnableVertexAttribArray(UV_ATTRIBUTE)
+        glVertexAttribPointer(POSITION_ATTRIBUTE, 3, GL_FLOAT, GL_FALSE, QUANTIZED_STRIDE, ctypes.c_void_p(0))
+        glVertexAttribPointer(NORMAL_ATTRIBUTE, 3, GL_BYTE, GL_TRUE, QUANTIZED_STRIDE, ctypes.c_void_p(QUANTIZED_NORMAL_OFFSET))
+        glVertexAttribPointer(UV_ATTRIBUTE, 2, GL_UNSIGNED_SHORT, GL_TRUE, QUANTIZED_STRIDE, ctypes.c_void_p(QUANTIZED_UV_OFFSET))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo) # Recorded in the VAO
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, asteroid.index_data.nbytes, asteroid.index_data, GL_STATIC_DRAW)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def update_vertices(self, asteroid):
+        """Overwrites the VBO in place after the vertices were re-displaced over the same faces."""
+        self.vertex_data = asteroid.vertex_data
+        vertex_data = quantize_vertex_data(asteroid)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertex_data.nbytes, vertex_data)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def draw(self):
+        glBindVertexArray(self.vao)
+        glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, None)
+        glBindVertexArray(0)
+
+    def release(self):
+        glDeleteVertexArrays(1, [self.vao])
+        glDeleteBuffers(2, [self.vbo, self.ibo])
+
+def release_asteroid_mesh(asteroid):
+    """Frees the GL buffers or display lists of an asteroid, its satellites and its satellite batches."""
+    if getattr(asteroid, 'gl_mesh', None) is not None:
+        asteroid.gl_mesh.release()
+        asteroid.gl_mesh = None
+    if getattr(asteroid, 'gl_list', None) is not None:
+        glDeleteLists(asteroid.gl_list, 1)
+        asteroid.gl_list = None
+    for satellite in asteroid.satellites:
+        release_asteroid_mesh(satellite)
+    for batch in getattr(asteroid, 'satellite_batches', {}).values():
+        batch.release()
+    asteroid.satellite_batches = {}
+
+# --- Matrix Functions ---
+# All matrices are column-major: each row of the C-ordered array is one OpenGL column, so they go
+# to GL without a transpose, and the product A * B is computed as B_array @ A_array.
+# Shared scratch matrices; GL copies them on upload, so every asteroid can reuse the same buffers
+MODEL_MATRIX = np.identity(4, dtype=np.float32)
+MODELVIEW_MATRIX = np.identity(4, dtype=np.float32)
+
+def write_rotation_matrix(quaternion, gl_matrix):
+    """Writes the rotation of an (x, y, z, w) unit quaternion into the upper 3x3 of a column-major 4x4 matrix in place."""
+    x, y, z, w = quaternion
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    # gl_matrix[column, row]: each row of the C-ordered array is one OpenGL column
+    gl_matrix[0, 0] = 1.0 - 2.0 * (yy + zz)
+    gl_matrix[0, 1] = 2.0 * (xy + wz)
+    gl_matrix[0, 2] = 2.0 * (xz - wy)
+    gl_matrix[1, 0] = 2.0 * (xy - wz)
+    gl_matrix[1, 1] = 1.0 - 2.0 * (xx + zz)
+    gl_matrix[1, 2] = 2.0 * (yz + wx)
+    gl_matrix[2, 0] = 2.0 * (xz + wy)
+    gl_matrix[2, 1] = 2.0 * (yz - wx)
+    gl_matrix[2, 2] = 1.0 - 2.0 * (xx + yy)
+
+def perspective_matrix(field_of_view, aspect, near, far):
+    """Column-major projection matrix, as built by gluPerspective."""
+    f = 1.0 / math.tan(math.radians(field_of_view) / 2.0)
+    gl_matrix = np.zeros((4, 4), dtype=np.float32)
+    gl_matrix[0, 0] = f / aspect
+    gl_matrix[1, 1] = f
+    gl_matrix[2, 2] = (far + near) / (near - far)
+    gl_matrix[2, 3] = -1.0
+    gl_matrix[3, 2] = 2.0 * far * near / (near - far)
+    return gl_matrix
+
+def translation_matrix(x, y, z):
+    """Column-major translation matrix, as applied by glTranslatef."""
+    gl_matrix = np.identity(4, dtype=np.float32)
+    gl_matrix[3, :3] = (x, y, z)
+    return gl_matrix
+
+def rotation_matrix(angle, x, y, z):
+    """Column-major rotation by angle degrees about the unit axis (x, y, z), as applied by glRotatef."""
+    half_angle = math.radians(angle) / 2.0
+    sin_half = math.sin(half_angle)
+    gl_matrix = np.identity(4, dtype=np.float32)
+    write_rotation_matrix((x * sin_half, y * sin_half, z * sin_half, math.cos(half_angle)), gl_matrix)
+    return gl_matrix
+
+# --- Shaders ---
+VERTEX_SHADER = """
+#version 120
+attribute vec3 position;
+attribute vec3 normal;
+attribute vec2 uv;
+attribute vec4 color;
+uniform mat4 modelview;
+uniform mat4 projection;
+uniform vec3 light_direction;
+uniform float ambient_light;
+uniform float diffuse_light;
+varying vec2 frag_uv;
+varying vec4 frag_color;
+
+void main() {
+    // Per-vertex Lambert lighting in eye space, like the fixed-function pipeline it replaces
+    vec3 eye_normal = normalize(mat3(modelview) * normal);
+    float lighting = ambient_light + diffuse_light * max(dot(eye_normal, light_direction), 0.0);
+    frag_color = vec4(min(color.rgb * lighting, 1.0), color.a);
+    frag_uv = uv;
+    gl_Position = projection * modelview * vec4(position, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D asteroid_texture;
+varying vec2 frag_uv;
+varying vec4 frag_color;
+
+void main() {
+    gl_FragColor = texture2D(asteroid_texture, frag_uv) * frag_color;
+}
+"""
+
+def compile_shader(source, shader_type):
+    shader = glCreateShader(shader_type)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        raise RuntimeError(f"Shader compilation failed: {glGetShaderInfoLog(shader)}")
+    return shader
+
+def supports_shader_pipeline():
+    """Whether the context has GLSL shaders, VBOs and vertex array objects (OpenGL 3.0)."""
+    return bool(glCreateShader) and bool(glGenBuffers) and bool(glGenVertexArrays)
+
+class AsteroidShader:
+    """The textured, Lambert-lit program every asteroid is drawn with; only the modelview changes per draw."""
+    def __init__(self, projection_matrix):
+        vertex_shader = compile_shader(VERTEX_SHADER, GL_VERTEX_SHADER)
+        fragment_shader = compile_shader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER)
+        self.program = glCreateProgram()
+        glAttachShader(self.program, vertex_shader)
+        glAttachShader(self.program, fragment_shader)
+        glBindAttribLocation(self.program, POSITION_ATTRIBUTE, "position")
+        glBindAttribLocation(self.program, NORMAL_ATTRIBUTE, "normal")
+        glBindAttribLocation(self.program, UV_ATTRIBUTE, "uv")
+        glBindAttribLocation(self.program, COLOR_ATTRIBUTE, "color")
+        glLinkProgram(self.program)
+        if not glGetProgramiv(self.program, GL_LINK_STATUS):
+            raise RuntimeError(f"Shader linking failed: {glGetProgramInfoLog(self.program)}")
+        glDeleteShader(vertex_shader)
+        glDeleteShader(fragment_shader)
+
+        self.modelview_location = glGetUniformLocation(self.program, "modelview")
+
+        # Everything else is constant for the whole run, so it is set once
+        glUseProgram(self.program)
+        glUniformMatrix4fv(glGetUniformLocation(self.program, "projection"), 1, GL_FALSE, projection_matrix)
+        glUniform3f(glGetUniformLocation(self.program, "light_direction"), *LIGHT_DIRECTION)
+        glUniform1f(glGetUniformLocation(self.program, "ambient_light"), GLOBAL_AMBIENT + LIGHT_AMBIENT)
+        glUniform1f(glGetUniformLocation(self.program, "diffuse_light"), LIGHT_DIFFUSE)
+        glUniform1i(glGetUniformLocation(self.program, "asteroid_texture"), 0) # Texture unit 0
+
+    def set_modelview(self, gl_matrix):
+        glUniformMatrix4fv(self.modelview_location, 1, GL_FALSE, gl_matrix)
+
+def setup_fixed_function(projection_matrix):
+    """Lighting and projection for contexts without the shader pipeline."""
     glEnable(GL_TEXTURE_2D)
-    glBindTexture(GL_TEXTURE_2D, asteroid.texture_id)
-
-    glPushMatrix()
-    # Apply the asteroid's position and rotation
-    glTranslatef(asteroid.position[0], asteroid.position[1], asteroid.position[2])
-    
-    # Convert the 3x3 rotation matrix from scipy to a 4x4 matrix for OpenGL
-    rotation_matrix_3x3 = asteroid.rotation.as_matrix()
-    rotation_matrix_4x4 = np.identity(4, dtype=np.float32)
-    rotation_matrix_4x4[:3, :3] = rotation_matrix_3x3
-    glMultMatrixf(rotation_matrix_4x4.T) # Use transpose for OpenGL
-
-    # Set color and material properties
-    color = asteroid.get_color()
-    glColor4f(color[0]/255.0, color[1]/255.0, color[2]/255.0, 1.0)
-    glMaterialfv(GL_FRONT, GL_AMBIENT_AND_DIFFUSE, (color[0]/255.0, color[1]/255.0, color[2]/255.0, 1.0))
-
-    # Draw the faces
-    glBegin(GL_TRIANGLES)
-    for face in asteroid.faces:
-        for vertex_index in face:
-            glNormal3fv(asteroid.base_vertices[vertex_index]) # Use vertex position as normal for smooth shading
-            glTexCoord2fv(asteroid.uv_coords[vertex_index])
-            glVertex3fv(asteroid.base_vertices[vertex_index])
-    glEnd()
-
-    glPopMatrix()
-    glDisable(GL_TEXTURE_2D)
+    glEnable(GL_LIGHTING)
+    glEnable(GL_LIGHT0)
+    glEnable(GL_COLOR_MATERIAL)
+    glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+
+    glLightfv(GL_LIGHT0, GL_POSITION, LIGHT_DIRECTION + (0,)) # Set under an identity modelview, so it stays in eye space
+    glLightfv(GL_LIGHT0, GL_AMBIENT, (LIGHT_AMBIENT, LIGHT_AMBIENT, LIGHT_AMBIENT, 1.0))
+    glLightfv(GL_LIGHT0, GL_DIFFUSE, (LIGHT_DIFFUSE, LIGHT_DIFFUSE, LIGHT_DIFFUSE, 1.0))
+
+    glMatrixMode(GL_PROJECTION)
+    glLoadMatrixf(projection_matrix)
+    glMatrixMode(GL_MODELVIEW)
+
+# --- Satellite Batching ---
+class SatelliteBatch:
+    """All satellites sharing a texture, drawn from one streaming VBO of pre-transformed vertices."""
+    def __init__(self, texture_id, satellites):
+        self.texture_id = texture_id
+        self.satellites = satellites
+
+        # Concatenate the satellites' meshes; each one owns the vertex range offsets[i]:offsets[i + 1].
+        # Every satellite samples its own random hull, so no two meshes are identical and there is
+        # nothing to instance: the batch already holds each mesh exactly once, in a single buffer.
+        vertex_counts = [len(satellite.vertex_data) for satellite in satellites]
+        self.offsets = np.concatenate(([0], np.cumsum(vertex_counts)))
+        self.base_data = np.concatenate([satellite.vertex_data for satellite in satellites])
+        self.vertex_data = self.base_data.copy() # World-space copy, rewritten every frame
+        # (vertex, [position, normal], xyz) views, so a single matmul rotates positions and normals together
+        self.base_pairs = self.base_data[:, 0:6].reshape(-1, 2, 3)
+        self.world_pairs = self.vertex_data[:, 0:6].reshape(-1, 2, 3)
+        self.rotation = np.identity(4, dtype=np.float32) # Scratch; its column-major upper 3x3 is R.T, ready for row vectors
+        index_data = np.concatenate([satellite.index_data + offset for satellite, offset in zip(satellites, self.offsets)]).astype(np.uint32)
+        self.index_count = len(index_data)
+        # Satellites have their own colors, so they travel as a per-vertex color array
+        color_data = np.concatenate([
+            np.tile(np.array(satellite.get_color() + (255,), dtype=np.uint8), (count, 1))
+            for satellite, count in zip(satellites, vertex_counts)
+        ])
+
+        self.vao = glGenVertexArrays(1)
+        self.vbo, self.color_vbo, self.ibo = glGenBuffers(3)
+        glBindVertexArray(self.vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.color_vbo)
+        glBufferData(GL_ARRAY_BUFFER, color_data.nbytes, color_data, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(COLOR_ATTRIBUTE)
+        glVertexAttribPointer(COLOR_ATTRIBUTE, 4, GL_UNSIGNED_BYTE, GL_TRUE, 0, ctypes.c_void_p(0))
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.vertex_data.nbytes, None, GL_STREAM_DRAW)
+        glEnableVertexAttribArray(POSITION_ATTRIBUTE)
+        glEnableVertexAttribArray(NORMAL_ATTRIBUTE)
+        glEnableVertexAttribArray(UV_ATTRIBUTE)
+        glVertexAttribPointer(POSITION_ATTRIBUTE, 3, GL_FLOAT, GL_FALSE, VERTEX_STRIDE, ctypes.c_void_p(0))
+        glVertexAttribPointer(NORMAL_ATTRIBUTE, 3, GL_FLOAT, GL_FALSE, VERTEX_STRIDE, ctypes.c_void_p(NORMAL_OFFSET))
+        glVertexAttribPointer(UV_ATTRIBUTE, 2, GL_FLOAT, GL_FALSE, VERTEX_STRIDE, ctypes.c_void_p(UV_OFFSET))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo) # Recorded in the VAO
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, index_data.nbytes, index_data, GL_STATIC_DRAW)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def update_vertices(self):
+        """Transforms every satellite's positions and normals into world space and streams them to the VBO."""
+        for satellite, start, end in zip(self.satellites, self.offsets[:-1], self.offsets[1:]):
+            write_rotation_matrix(satellite.rotation.as_quat(), self.rotation)
+            world_pairs = self.world_pairs[start:end]
+            np.matmul(self.base_pairs[start:end], self.rotation[:3, :3], out=world_pairs) # Row vectors: v @ R.T == R @ v
+            world_pairs[:, 0] += satellite.position
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.vertex_data.nbytes, self.vertex_data)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def draw(self, bound_texture_id, view_matrix, shader):
+        """Draws the batch; the texture is only rebound if it differs from the one already bound."""
+        self.update_vertices()
+
+        if self.texture_id != bound_texture_id:
+            glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        shader.set_modelview(view_matrix) # The vertices are already in world space
+        glBindVertexArray(self.vao)
+        glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, None)
+        glBindVertexArray(0)
+        return self.texture_id
+
+    def release(self):
+        glDeleteVertexArrays(1, [self.vao])
+        glDeleteBuffers(3, [self.vbo, self.color_vbo, self.ibo])
+
+def draw_satellites(asteroid, view_matrix, shader):
+    """Draws the asteroid's satellites with one draw call per texture, right after the asteroid itself."""
+    bound_texture_id = asteroid.texture_id
+    if shader is None:
+        color = asteroid.color_gl
+        for satellite in asteroid.satellites:
+            if satellite.texture_id != bound_texture_id:
+                bound_texture_id = satellite.texture_id
+                glBindTexture(GL_TEXTURE_2D, bound_texture_id)
+            color = draw_asteroid_body(satellite, view_matrix, None, color)
+        return
+
+    # recreate_asteroid() builds a new satellites list, so its identity tells when to rebuild the batches
+    if getattr(asteroid, 'batched_satellites', None) is not asteroid.satellites:
+        for batch in getattr(asteroid, 'satellite_batches', {}).values():
+            batch.release()
+        satellites_by_texture = {}
+        for satellite in asteroid.satellites:
+            satellites_by_texture.setdefault(satellite.texture_id, []).append(satellite)
+        asteroid.satellite_batches = {texture_id: SatelliteBatch(texture_id, satellites) for texture_id, satellites in satellites_by_texture.items()}
+        asteroid.batched_satellites = asteroid.satellites
+
+    for batch in asteroid.satellite_batches.values():
+        bound_texture_id = batch.draw(bound_texture_id, view_matrix, shader)
+
+# --- Main Drawing Functions ---
+def draw_mesh_from_buffers(asteroid):
+    mesh = getattr(asteroid, 'gl_mesh', None)
+    if mesh is None or mesh.index_data is not asteroid.index_data:
+        if mesh is not None:
+            mesh.release()
+        mesh = asteroid.gl_mesh = AsteroidMesh(asteroid)
+    elif mesh.vertex_data is not asteroid.vertex_data:
+        mesh.update_vertices(asteroid)
+    mesh.draw()
+
+def draw_mesh_from_display_list(asteroid):
+    # Fallback for contexts without the shader pipeline: once per geometry change the triangles are packed into one
+    # interleaved client array and compiled into a display list, which the driver keeps and replays
+    gl_list = getattr(asteroid, 'gl_list', None)
+    if gl_list is None or asteroid.gl_list_source is not asteroid.vertex_data:
+        if gl_list is not None:
+            glDeleteLists(gl_list, 1)
+        packed = np.empty((asteroid.faces.size, 8), dtype=np.float32)
+        pack_triangles(asteroid.base_vertices, asteroid.normals, asteroid.uv_coords, asteroid.faces, packed)
+
+        gl_list = asteroid.gl_list = glGenLists(1)
+        asteroid.gl_list_source = asteroid.vertex_data
+        glNewList(gl_list, GL_COMPILE)
+        glInterleavedArrays(GL_T2F_N3F_V3F, 0, packed) # Client state is not compiled; the array contents are
+        glDrawArrays(GL_TRIANGLES, 0, len(packed))
+        glEndList()
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    glCallList(gl_list)
+
+def draw_asteroid_body(asteroid, view_matrix, shader, previous_color=None):
+    """
+    Draws one asteroid with its texture already bound by the caller; shader is None on the fixed-function path.
+    The color is only set when it differs from previous_color; returns the asteroid's color.
+    """
+    # The asteroid's position and rotation as one column-major model matrix, updated in place
+    write_rotation_matrix(asteroid.rotation.as_quat(), MODEL_MATRIX)
+    MODEL_MATRIX[3, :3] = asteroid.position # Translation is the fourth OpenGL column
+
+    if shader is not None:
+        np.matmul(MODEL_MATRIX, view_matrix, out=MODELVIEW_MATRIX) # view * model
+        shader.set_modelview(MODELVIEW_MATRIX)
+        # The mesh VAO has no color array, so the attribute's current value colors the whole asteroid
+        if asteroid.color_gl != previous_color:
+            glVertexAttrib4fv(COLOR_ATTRIBUTE, asteroid.color_gl)
+        draw_mesh_from_buffers(asteroid)
+    else:
+        glPushMatrix()
+        glMultMatrixf(MODEL_MATRIX)
+        # GL_COLOR_MATERIAL tracks the current color into the ambient and diffuse material
+        if asteroid.color_gl != previous_color:
+            glColor4fv(asteroid.color_gl)
+        draw_mesh_from_display_list(asteroid)
+        glPopMatrix()
+    return asteroid.color_gl
 
 # --- Main Function ---
 def main():
@@ -71,17 +484,14 @@ def main():
 
     # --- OpenGL Setup ---
     glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
-    glEnable(GL_LIGHT0)
-    glEnable(GL_COLOR_MATERIAL)
-    glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
-
-    glLightfv(GL_LIGHT0, GL_POSITION, (0, 0, 1, 0)) # Directional light from the front
-    glLightfv(GL_LIGHT0, GL_AMBIENT, (0.4, 0.4, 0.4, 1.0))
-    glLightfv(GL_LIGHT0, GL_DIFFUSE, (1.0, 1.0, 1.0, 1.0))
+    projection_matrix = perspective_matrix(FIELD_OF_VIEW, display[0] / display[1], NEAR_PLANE, FAR_PLANE)
+    view_matrix = translation_matrix(0.0, 0.0, -CAMERA_DISTANCE) # Move camera back
 
-    gluPerspective(45, (display[0] / display[1]), 0.1, 1000.0)
-    glTranslatef(0.0, 0.0, -500) # Move camera back
+    # Shaders when the context has them; otherwise fixed-function lighting with display lists.
+    # PyOpenGL entry points are falsy when the driver lacks them.
+    shader = AsteroidShader(projection_matrix) if supports_shader_pipeline() else None
+    if shader is None:
+        setup_fixed_function(projection_matrix)
 
     # --- Load Texture Once ---
     try:
@@ -94,6 +504,7 @@ def main():
     # --- Create Initial Asteroid ---
     asteroid = Asteroid3D(0, 0, 0, texture_id=asteroid_texture_id)
     asteroid.texture_id = asteroid_texture_id
+    drawn_asteroid = asteroid # Asteroid whose GL buffers are currently allocated
 
     # --- Mouse Control Variables ---
     mouse_dragging = False
@@ -120,14 +531,18 @@ def main():
     # --- Shape Randomization Control Variable ---
     current_shape_randomization_factor = (1.0, 1.0, 1.0) # Initial shape (spherical)
 
-    clock = pygame.time.Clock() # Initialize clock
+    previous_frame_time = time.perf_counter()
+    needs_redraw = True # Only set by input or a window expose; a spinning asteroid is redrawn every frame anyway
     running = True
     while running:
-        delta_time = clock.tick(60) / 1000.0 # Limit to 60 FPS and get delta time in seconds
+        # Events are drained on every pass, including the ones spent waiting for the next frame
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                needs_redraw = True
             elif event.type == pygame.KEYDOWN:
+                needs_redraw = True
                 if event.key == K_SPACE:
                     # Create a new random asteroid with the current jaggedness and displacement factors
                     asteroid = Asteroid3D(0, 0, 0, jaggedness_factor=current_jaggedness_factor, displacement_strength=current_displacement_strength, shape_randomization_factor=current_shape_randomization_factor, texture_id=asteroid_texture_id)
@@ -135,15 +550,13 @@ def main():
                 elif event.key == K_UP:
                     current_jaggedness_factor = min(MAX_JAGGEDNESS, current_jaggedness_factor + JAGGEDNESS_STEP)
                     print(f"Jaggedness: {current_jaggedness_factor:.1f}")
-                    # Recreate asteroid with new jaggedness
-                    asteroid = Asteroid3D(0, 0, 0, new_outer_radius=asteroid.outer_radius, jaggedness_factor=current_jaggedness_factor, displacement_strength=current_displacement_strength, shape_randomization_factor=current_shape_randomization_factor, texture_id=asteroid_texture_id)
-                    asteroid.texture_id = asteroid_texture_id
+                    # Re-displace the current asteroid with the new jaggedness
+                    asteroid.update_jaggedness(current_jaggedness_factor)
                 elif event.key == K_DOWN:
                     current_jaggedness_factor = max(MIN_JAGGEDNESS, current_jaggedness_factor - JAGGEDNESS_STEP)
                     print(f"Jaggedness: {current_jaggedness_factor:.1f}")
-                    # Recreate asteroid with new jaggedness
-                    asteroid = Asteroid3D(0, 0, 0, new_outer_radius=asteroid.outer_radius, jaggedness_factor=current_jaggedness_factor, displacement_strength=current_displacement_strength, shape_randomization_factor=current_shape_randomization_factor, texture_id=asteroid_texture_id)
-                    asteroid.texture_id = asteroid_texture_id
+                    # Re-displace the current asteroid with the new jaggedness
+                    asteroid.update_jaggedness(current_jaggedness_factor)
                 elif event.key == K_PERIOD:
                     # Create the largest possible asteroid, using the same randomization logic as spacebar
                     # but forcing the outer radius to MAX_OUTER_RADIUS.
@@ -155,15 +568,13 @@ def main():
                 elif event.key == K_EQUALS: # Plus key
                     current_displacement_strength = min(MAX_DISPLACEMENT, current_displacement_strength + DISPLACEMENT_STEP)
                     print(f"Displacement: {current_displacement_strength:.1f}")
-                    # Recreate asteroid with new displacement
-                    asteroid = Asteroid3D(0, 0, 0, new_outer_radius=asteroid.outer_radius, jaggedness_factor=current_jaggedness_factor, displacement_strength=current_displacement_strength, shape_randomization_factor=current_shape_randomization_factor, texture_id=asteroid_texture_id)
-                    asteroid.texture_id = asteroid_texture_id
+                    # Re-displace the current asteroid with the new displacement
+                    asteroid.update_displacement(current_displacement_strength)
                 elif event.key == K_MINUS:
                     current_displacement_strength = max(MIN_DISPLACEMENT, current_displacement_strength - DISPLACEMENT_STEP)
                     print(f"Displacement: {current_displacement_strength:.1f}")
-                    # Recreate asteroid with new displacement
-                    asteroid = Asteroid3D(0, 0, 0, new_outer_radius=asteroid.outer_radius, jaggedness_factor=current_jaggedness_factor, displacement_strength=current_displacement_strength, shape_randomization_factor=current_shape_randomization_factor, texture_id=asteroid_texture_id)
-                    asteroid.texture_id = asteroid_texture_id
+                    # Re-displace the current asteroid with the new displacement
+                    asteroid.update_displacement(current_displacement_strength)
                 elif event.key == K_ESCAPE:
                     running = False
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -174,22 +585,43 @@ def main():
             elif event.type == pygame.MOUSEMOTION and mouse_dragging:
                 dx, dy = event.pos[0] - last_mouse_pos[0], event.pos[1] - last_mouse_pos[1]
                 last_mouse_pos = event.pos
-                glRotatef(dx, 0, 1, 0) # Yaw
-                glRotatef(dy, 1, 0, 0) # Pitch
+                view_matrix = rotation_matrix(dy, 1, 0, 0) @ rotation_matrix(dx, 0, 1, 0) @ view_matrix # Yaw, then pitch
+                needs_redraw = True
+
+        # Yield until a full frame has elapsed; perf_counter is far more precise than the SDL clock
+        current_time = time.perf_counter()
+        delta_time = current_time - previous_frame_time
+        if delta_time < FRAME_TIME:
+            # An idle viewer has nothing to draw at the deadline, so it can sleep instead of spinning
+            time.sleep(0 if needs_redraw or is_spinning else FRAME_TIME - delta_time)
+            continue
+        previous_frame_time = current_time
+
+        # Nothing moved and no input arrived: keep the last frame on screen
+        if not (needs_redraw or is_spinning):
+            continue
+        needs_redraw = False
+
+        # Free the GL buffers of an asteroid replaced by a key press
+        if asteroid is not drawn_asteroid:
+            release_asteroid_mesh(drawn_asteroid)
+            drawn_asteroid = asteroid
 
         if is_spinning:
             asteroid.update(delta_time, asteroid.position)
 
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        if shader is None:
+            glLoadMatrixf(view_matrix)
 
-        draw_asteroid(asteroid)
+        # The texture is bound once for the asteroid and all its satellites
+        glBindTexture(GL_TEXTURE_2D, asteroid.texture_id)
+        draw_asteroid_body(asteroid, view_matrix, shader)
 
         # Draw satellites
-        for satellite in asteroid.satellites:
-            draw_asteroid(satellite)
+        draw_satellites(asteroid, view_matrix, shader)
 
         pygame.display.flip()
-        pygame.time.wait(10)
 
     pygame.quit()
     sys.exit()
@@ -24,7 +24,7 @@ ASTEROID_TRACK_SPEED = 0.005 # radians per second
 # --- Texture Loading Function for OpenGL (Copied from test_3d_asteroid_viewer.py) ---
 def load_texture(filename):
     texture_surface = pygame.image.load(filename)
-    texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
+    texture_data = pygame.image.tobytes(texture_surface, "RGBA", True)
     width = texture_surface.get_width()
     height = texture_surface.get_height()
 